@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent vs sequential JSON-RPC batch execution.
+
+Drives an in-process MCPEchoServer (stateless, JSON responses) through the
+full ASGI middleware stack and measures end-to-end latency of batches of
+1 to 100 tools/call entries, once with the batch concurrency cap set to 1
+(sequential) and once with the configured cap.
+
+Echo tools are CPU-bound and never yield to the event loop, so on their own
+they show only the batch overhead. A simulated I/O tool (asyncio.sleep of
+--io-ms) is mixed in to model tools that wait on something external, which
+is where concurrent execution pays off.
+
+Usage:
+    python benchmarks/bench_batch.py [--concurrency 8] [--io-ms 5] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+
+import httpx
+
+from mcp_http_echo_server import MCPEchoServer
+
+BATCH_SIZES = [1, 2, 5, 10, 25, 50, 100]
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+
+
+def build_server(concurrency: int, io_ms: float) -> MCPEchoServer:
+    """Create a stateless server with an extra simulated I/O tool."""
+    server = MCPEchoServer(stateless_mode=True, batch_concurrency=concurrency, max_in_flight=0)
+
+    @server.mcp.tool
+    async def simulatedIO(message: str) -> str:
+        """Wait like an I/O-bound tool, then echo."""
+        await asyncio.sleep(io_ms / 1000)
+        return message
+
+    return server
+
+
+def build_batch(size: int, io_ratio: float) -> list:
+    """Build a batch mixing echo and simulated I/O calls."""
+    batch = []
+    io_every = int(1 / io_ratio) if io_ratio > 0 else 0
+    for i in range(size):
+        name = "simulatedIO" if io_every and i % io_every == 0 else "echo"
+        batch.append({
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": {"message": f"bench-{i}"}}
+        })
+    return batch
+
+
+async def time_batches(concurrency: int, io_ms: float, io_ratio: float, repeat: int) -> dict:
+    """Return median latency in ms per batch size for one concurrency cap."""
+    server = build_server(concurrency, io_ms)
+    app = server.http_app(json_response=True)
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            # Warm-up
+            await client.post("/mcp", headers=HEADERS, json=build_batch(5, io_ratio))
+
+            for size in BATCH_SIZES:
+                batch = build_batch(size, io_ratio)
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    response = await client.post("/mcp", headers=HEADERS, json=batch)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    if response.status_code != 200 or len(response.json()) != size:
+                        raise RuntimeError(f"Unexpected batch response: {response.status_code} {response.text[:200]}")
+                results[size] = statistics.median(samples)
+    return results
+
+
+async def run(args) -> list:
+    sequential = await time_batches(1, args.io_ms, args.io_ratio, args.repeat)
+    concurrent = await time_batches(args.concurrency, args.io_ms, args.io_ratio, args.repeat)
+    return [
+        {
+            "batch_size": size,
+            "sequential_ms": round(sequential[size], 2),
+            "concurrent_ms": round(concurrent[size], 2),
+            "speedup": round(sequential[size] / concurrent[size], 2)
+        }
+        for size in BATCH_SIZES
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON-RPC batch execution")
+    parser.add_argument("--concurrency", type=int, default=8, help="Batch concurrency cap (default: 8)")
+    parser.add_argument("--io-ms", type=float, default=5.0, help="Simulated I/O latency in ms (default: 5)")
+    parser.add_argument("--io-ratio", type=float, default=0.5, help="Fraction of simulated I/O calls (default: 0.5)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per batch size (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # The MCP SDK logs noisy teardown errors for stateless requests
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = asyncio.run(run(args))
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"concurrency={args.concurrency} io_ms={args.io_ms} io_ratio={args.io_ratio}\n")
+    print(f"{'batch':>6} {'sequential ms':>14} {'concurrent ms':>14} {'speedup':>8}")
+    print("-" * 46)
+    for r in results:
+        print(f"{r['batch_size']:>6} {r['sequential_ms']:>14.2f} {r['concurrent_ms']:>14.2f} {r['speedup']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
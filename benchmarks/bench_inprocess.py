@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""In-process benchmark of every tool in every mode.
+
+Builds MCPEchoServer in-process for each mode (stateless, stateful,
+adaptive) and drives it through httpx's in-memory ASGI transport, so the
+numbers cover the HTTP middleware, ModeMiddleware, StateAdapter and the
+tool itself without any network or container noise. Each tool available
+in a mode gets a fresh session (session history grows with every call, so
+a shared session would make later tools look slower), runs warm-up calls,
+then times every repetition and reports mean/stdev/min/median/p90/p99/max.
+
+Besides the tools, two probes isolate the fixed cost per request:
+``ping`` (JSON-RPC ping, no tool or ModeMiddleware involved) and a
+``StateAdapter`` probe, a benchmark-only tool that times 100
+StateAdapter.set_state/get_state pairs inside the tool (reported per 100
+pairs, without the request overhead).
+
+Results are written to a JSON file keyed by mode and tool so runs on two
+commits can be compared with ``--compare``.
+
+Usage:
+    python benchmarks/bench_inprocess.py [--repeat 200] [--warmup 20] [--output bench_inprocess.json]
+    python benchmarks/bench_inprocess.py --modes stateless --tools echo,healthProbe
+    python benchmarks/bench_inprocess.py --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from fastmcp import Context
+
+from mcp_http_echo_server import MCPEchoServer
+from mcp_http_echo_server.bench import HEADERS, PROTOCOL_VERSION, classify_result, latency_summary, parse_response
+from mcp_http_echo_server.utils.state_adapter import StateAdapter
+
+MODES = ("stateless", "stateful", "adaptive")
+
+# Arguments for tools that need some (others are called without arguments)
+TOOL_ARGS = {
+    "echo": {"message": "bench"},
+    "echoStream": {"message": "bench", "count": 4},
+    "echoSynthetic": {"size": 1024},
+    "stateManipulator": {"action": "set", "key": "bench", "value": "x"},
+    "sessionTransfer": {"action": "export"},
+    "stateBenchmark": {"operations": 10},
+    "bearerDecodeBatch": {"text": ""},
+}
+
+# Tools that would distort the run (fault injection is not enabled here)
+SKIPPED_TOOLS = {"faultInjection"}
+
+STATE_ADAPTER_OPS = 100
+
+
+def build_server(mode: str) -> MCPEchoServer:
+    """Create a server for one mode with the StateAdapter probe tool."""
+    server = MCPEchoServer(
+        stateless_mode=mode == "stateless",
+        adaptive_mode=mode == "adaptive",
+        max_in_flight=0
+    )
+
+    @server.mcp.tool
+    async def benchStateAdapter(ctx: Context, ops: int = STATE_ADAPTER_OPS) -> dict:
+        """Time StateAdapter set_state/get_state pairs."""
+        start = time.perf_counter()
+        for i in range(ops):
+            await StateAdapter.set_state(ctx, "bench_key", i)
+            await StateAdapter.get_state(ctx, "bench_key")
+        return {"elapsed_ms": (time.perf_counter() - start) * 1000}
+
+    return server
+
+
+def summarize(samples: list, errors: int) -> dict:
+    """Statistical summary of latency samples in milliseconds."""
+    summary = latency_summary(samples)
+    if samples:
+        summary["median_ms"] = round(statistics.median(samples), 4)
+        summary["stdev_ms"] = round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0
+    summary["errors"] = errors
+    return summary
+
+
+async def initialize(client: httpx.AsyncClient) -> dict:
+    """Open a session (if the mode has them) and return request headers."""
+    headers = dict(HEADERS)
+    response = await client.post("/mcp", headers=headers, json={
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "bench_inprocess", "version": "1.0.0"}
+        }
+    })
+    if response.status_code != 200:
+        raise RuntimeError(f"initialize failed: {response.status_code} {response.text[:200]}")
+    if response.headers.get("mcp-session-id"):
+        headers["mcp-session-id"] = response.headers["mcp-session-id"]
+    headers["mcp-protocol-version"] = PROTOCOL_VERSION
+    await client.post("/mcp", headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+    return headers
+
+
+async def time_requests(client: httpx.AsyncClient, headers: dict, body: dict, warmup: int, repeat: int,
+                        check=classify_result) -> tuple:
+    """Run warm-up calls, then return (latencies in ms, error count)."""
+    for _ in range(warmup):
+        await client.post("/mcp", headers=headers, json=body)
+    samples = []
+    errors = 0
+    for i in range(repeat):
+        body = {**body, "id": i + 1}
+        start = time.perf_counter()
+        response = await client.post("/mcp", headers=headers, json=body)
+        elapsed = (time.perf_counter() - start) * 1000
+        if check(response):
+            errors += 1
+        else:
+            samples.append(elapsed)
+    return samples, errors
+
+
+async def time_state_adapter(client: httpx.AsyncClient, headers: dict, body: dict, warmup: int, repeat: int) -> dict:
+    """Summarize the in-tool timing of STATE_ADAPTER_OPS set_state/get_state pairs."""
+    for _ in range(warmup):
+        await client.post("/mcp", headers=headers, json=body)
+    pairs = []
+    errors = 0
+    for i in range(repeat):
+        response = await client.post("/mcp", headers=headers, json={**body, "id": i + 1})
+        if classify_result(response):
+            errors += 1
+            continue
+        pairs.append(parse_response(response)["result"]["structuredContent"]["elapsed_ms"])
+    return summarize(pairs, errors)
+
+
+def check_ping(response: httpx.Response):
+    """Error label of a ping response, or None."""
+    return None if response.status_code == 200 else f"http_{response.status_code}"
+
+
+async def bench_mode(mode: str, tools: list, warmup: int, repeat: int) -> dict:
+    """Benchmark the probes and every selected tool in one mode."""
+    server = build_server(mode)
+    app = server.http_app()
+    results = {}
+    available = set(server.tool_registry.available(stateless=mode == "stateless"))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            headers = await initialize(client)
+            samples, errors = await time_requests(
+                client, headers, {"jsonrpc": "2.0", "method": "ping"}, warmup, repeat, check=check_ping
+            )
+            results["ping"] = summarize(samples, errors)
+
+            body = {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "benchStateAdapter", "arguments": {"ops": STATE_ADAPTER_OPS}}
+            }
+            results[f"StateAdapter x{STATE_ADAPTER_OPS}"] = await time_state_adapter(client, headers, body, warmup, repeat)
+
+            for name in tools:
+                if name not in available or name in SKIPPED_TOOLS:
+                    continue
+                body = {
+                    "jsonrpc": "2.0",
+                    "method": "tools/call",
+                    "params": {"name": name, "arguments": TOOL_ARGS.get(name, {})}
+                }
+                headers = await initialize(client)
+                samples, errors = await time_requests(client, headers, body, warmup, repeat)
+                results[name] = summarize(samples, errors)
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args) -> dict:
+    tools = args.tools.split(",") if args.tools else sorted(MCPEchoServer(stateless_mode=True).tool_registry.names)
+    results = {}
+    for mode in args.modes.split(","):
+        results[mode] = await bench_mode(mode, tools, args.warmup, args.repeat)
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def print_report(report: dict, baseline: dict = None):
+    """Print per-mode tables, with the median change against a baseline."""
+    for mode, tools in report["results"].items():
+        print(f"\n[{mode}]")
+        header = f"{'tool':<22} {'mean ms':>9} {'stdev':>8} {'min':>8} {'median':>8} {'p90':>8} {'p99':>8} {'err':>5}"
+        if baseline:
+            header += f" {'vs base':>9}"
+        print(header)
+        print("-" * len(header))
+        for name, s in tools.items():
+            if not s.get("count"):
+                print(f"{name:<22} {'-':>9} {'':>8} {'':>8} {'':>8} {'':>8} {'':>8} {s['errors']:>5}")
+                continue
+            line = (
+                f"{name:<22} {s['mean_ms']:>9.3f} {s['stdev_ms']:>8.3f} {s['min_ms']:>8.3f} "
+                f"{s['median_ms']:>8.3f} {s['p90_ms']:>8.3f} {s['p99_ms']:>8.3f} {s['errors']:>5}"
+            )
+            base = (baseline or {}).get("results", {}).get(mode, {}).get(name, {})
+            if base.get("median_ms"):
+                line += f" {(s['median_ms'] / base['median_ms'] - 1) * 100:>+8.1f}%"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process benchmark of every tool in every mode")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma-separated modes (default: {','.join(MODES)})")
+    parser.add_argument("--tools", help="Comma-separated tools (default: all)")
+    parser.add_argument("--warmup", type=int, default=20, help="Warm-up calls per tool (default: 20)")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed calls per tool (default: 200)")
+    parser.add_argument("--output", "-o", default="bench_inprocess.json", help="JSON results file (default: bench_inprocess.json)")
+    parser.add_argument("--compare", metavar="PATH", help="Show the median change against an earlier results file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of tables")
+    args = parser.parse_args()
+
+    unknown = set(args.modes.split(",")) - set(MODES)
+    if unknown:
+        parser.error(f"Unknown modes: {', '.join(sorted(unknown))}")
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2")
+
+    # The MCP SDK logs noisy teardown errors for stateless requests
+    logging.basicConfig(level=logging.CRITICAL)
+    logging.disable(logging.ERROR)
+
+    report = asyncio.run(run(args))
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print(f"revision={report['meta']['revision']} warmup={args.warmup} repeat={args.repeat}")
+    print_report(report, baseline)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark the JSON codec backends over representative payloads.
+
+Compares the stdlib codec with orjson (when installed) for dumps and loads
+of a healthProbe result, a large sessionHistory result and a large echo
+response.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--repeat 7] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import timeit
+import uuid
+
+from mcp_http_echo_server.utils.codec import CODECS
+
+
+def health_probe_payload() -> dict:
+    """A healthProbe result as returned in stateful mode."""
+    return {
+        "status": "healthy",
+        "timestamp": time.time(),
+        "server": {"name": "mcp-http-echo-server", "version": "1.0.0", "mode": "stateful", "debug": False},
+        "protocol": {"supported_versions": ["2025-06-18", "2025-03-26", "2024-11-05"], "transport": "HTTP with optional SSE"},
+        "sessions": {
+            "total_active": 120,
+            "initialized": 118,
+            "average_age_seconds": 812.4,
+            "average_requests": 37.2,
+            "queued_messages": 0,
+            "timeout_seconds": 3600
+        },
+        "current_session": {"id": "3f2a9c1e...", "age_seconds": 12.5, "requests": 4, "initialized": True},
+        "tools": {
+            "total": 21,
+            "categories": {"echo": 2, "debug": 4, "auth": 3, "system": 2, "state": 10},
+            "stateful_only": []
+        },
+        "metrics": {"counters": {"admission.rejected.timeout": 3, "rate_limit.allowed.session": 1200}},
+        "performance": {"current_request_ms": 0.41, "status": "excellent"}
+    }
+
+
+def session_history_payload(events: int = 5000) -> dict:
+    """A sessionHistory result with many events."""
+    now = time.time()
+    history = []
+    for i in range(events):
+        history.append({
+            "timestamp": now + i,
+            "iso_time": "2025-06-18T12:00:00.000000+00:00",
+            "event_type": "request_received" if i % 2 == 0 else "response_sent",
+            "details": {"request_id": str(uuid.uuid4()), "tool": "echo"}
+        })
+    return {
+        "session_id": str(uuid.uuid4()),
+        "total_events": events,
+        "events_shown": events,
+        "history": history,
+        "session_age_seconds": float(events),
+        "events_per_minute": 60.0
+    }
+
+
+def large_echo_payload(size: int = 1024 * 1024) -> dict:
+    """A JSON-RPC tools/call response carrying a large echo."""
+    text = "[stateful:3f2a9c1e...:bench] " + ("lorem ipsum " * (size // 12))
+    return {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "result": {
+            "content": [{"type": "text", "text": text}],
+            "structuredContent": {"result": text},
+            "isError": False
+        }
+    }
+
+
+PAYLOADS = {
+    "healthProbe": health_probe_payload,
+    "sessionHistory_5k": session_history_payload,
+    "echo_1MiB": large_echo_payload,
+}
+
+
+def measure(func, repeat: int) -> float:
+    """Return the median seconds per call of func."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = timer.repeat(repeat=repeat, number=number)
+    return statistics.median(samples) / number
+
+
+def run(repeat: int) -> list:
+    """Run all payload/codec combinations."""
+    results = []
+    for payload_name, factory in PAYLOADS.items():
+        payload = factory()
+        for codec_name, codec_cls in CODECS.items():
+            codec = codec_cls()
+            encoded = codec.dumps_bytes(payload, default=str)
+            results.append({
+                "payload": payload_name,
+                "codec": codec_name,
+                "bytes": len(encoded),
+                "dumps_us": measure(lambda: codec.dumps_bytes(payload, default=str), repeat) * 1e6,
+                "loads_us": measure(lambda: codec.loads(encoded), repeat) * 1e6,
+            })
+    return results
+
+
+def print_table(results: list):
+    """Print results with speedups relative to the stdlib codec."""
+    baseline = {(r["payload"], "dumps"): r["dumps_us"] for r in results if r["codec"] == "json"}
+    baseline.update({(r["payload"], "loads"): r["loads_us"] for r in results if r["codec"] == "json"})
+
+    print(f"{'payload':<20} {'codec':<8} {'bytes':>10} {'dumps µs':>12} {'x':>6} {'loads µs':>12} {'x':>6}")
+    print("-" * 80)
+    for r in results:
+        dumps_x = baseline[(r["payload"], "dumps")] / r["dumps_us"]
+        loads_x = baseline[(r["payload"], "loads")] / r["loads_us"]
+        print(
+            f"{r['payload']:<20} {r['codec']:<8} {r['bytes']:>10} "
+            f"{r['dumps_us']:>12.1f} {dumps_x:>6.2f} {r['loads_us']:>12.1f} {loads_x:>6.2f}"
+        )
+    if "orjson" not in CODECS:
+        print("\norjson not installed - install with: pip install 'mcp-http-echo-server[fast]'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends")
+    parser.add_argument("--repeat", type=int, default=7, help="Timing repetitions (default: 7)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
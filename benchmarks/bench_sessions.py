@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Measure SessionManager memory and operation cost at large populations.
+
+Populates a SessionManager with synthetic stateful sessions shaped like the
+ones the tools leave behind (``last_echo``, ``echo_history``,
+``session_history`` request/response events and a ``decoded_token``), then
+reports per population size:
+
+- bytes per session from tracemalloc (Python allocations only)
+- bytes per session from RSS growth (what the pod actually pays)
+- time to populate, and the cost of get_session_stats, get_all_sessions
+  (limit 10 as in sessionInfo, and unlimited), a cleanup pass that expires
+  nothing, and a cleanup pass that expires --expire-fraction of sessions
+
+Each size runs in two fresh subprocesses (one for RSS and timings, one
+under tracemalloc, whose bookkeeping would otherwise inflate RSS and slow
+the operations). Sizes whose estimated RSS would not fit in the available
+memory are skipped.
+
+Usage:
+    python benchmarks/bench_sessions.py [--sizes 10000,100000,1000000]
+    python benchmarks/bench_sessions.py --echo-history 10 --history-events 100 --no-token
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+
+from mcp_http_echo_server.session_manager import SessionManager
+from mcp_http_echo_server.utils.jwt_decoder import decode_jwt_token
+
+DEFAULT_SIZES = "10000,100000,1000000"
+PROTOCOL_VERSION = "2025-06-18"
+
+# Fraction of available memory a run may use
+MEMORY_HEADROOM = 0.8
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def available_memory() -> int:
+    """Available system memory in bytes (0 if unknown)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def make_token(index: int) -> str:
+    """An unsigned JWT with claims unique to one session."""
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    now = int(time.time())
+    payload = {
+        "sub": f"user-{index}",
+        "iss": "https://auth.example.com",
+        "aud": "mcp-echo",
+        "iat": now,
+        "exp": now + 3600,
+        "scope": "mcp:read mcp:write",
+        "email": f"user-{index}@example.com",
+    }
+    return f"{encode({'alg': 'RS256', 'typ': 'JWT', 'kid': 'bench'})}.{encode(payload)}.{'s' * 342}"
+
+
+def populate(manager: SessionManager, count: int, args) -> list:
+    """Create count sessions with the configured state shape."""
+    padding = "x" * max(0, args.message_size - 16)
+    session_ids = []
+    for i in range(count):
+        session_id = manager.create_session()
+        session = manager.sessions[session_id]
+        now = session["created_at"]
+        session.update({
+            "initialized": True,
+            "protocol_version": PROTOCOL_VERSION,
+            "client_info": {"name": "bench-client", "version": "1.0.0"},
+            "request_count": args.history_events // 2,
+        })
+        state = session["state"]
+        messages = [f"message {i}-{n} {padding}" for n in range(args.echo_history)]
+        if messages:
+            state["last_echo"] = messages[-1]
+            state["echo_history"] = [{"message": m, "timestamp": now} for m in messages]
+        history = []
+        for n in range(args.history_events):
+            request_id = uuid.uuid4().hex
+            if n % 2 == 0:
+                history.append({
+                    "timestamp": now,
+                    "event": "request_received",
+                    "request_id": request_id,
+                    "mode": "stateful",
+                    "session_id": session_id,
+                })
+            else:
+                history.append({
+                    "timestamp": now,
+                    "event": "response_sent",
+                    "request_id": request_id,
+                    "elapsed_ms": 1.5,
+                })
+        state["session_history"] = history
+        if args.token:
+            state["decoded_token"] = decode_jwt_token(make_token(i), use_cache=False)
+        session_ids.append(session_id)
+    return session_ids
+
+
+def timed(fn, *fn_args) -> float:
+    """Milliseconds one call of fn takes."""
+    start = time.perf_counter()
+    fn(*fn_args)
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def measure_rss(count: int, args) -> dict:
+    """Populate without tracing: RSS growth and operation timings."""
+    manager = SessionManager(session_timeout=3600)
+    gc.collect()
+    before = rss_bytes()
+    start = time.perf_counter()
+    session_ids = populate(manager, count, args)
+    populate_s = time.perf_counter() - start
+    gc.collect()
+    grown = rss_bytes() - before
+
+    result = {
+        "populate_s": round(populate_s, 3),
+        "rss_bytes": grown,
+        "rss_bytes_per_session": round(grown / count),
+        "stats_ms": timed(manager.get_session_stats),
+        "list_10_ms": timed(manager.get_all_sessions, 10),
+        "list_all_ms": timed(manager.get_all_sessions),
+        "cleanup_scan_ms": timed(asyncio.run, manager.cleanup_expired_sessions()),
+    }
+
+    expired = int(count * args.expire_fraction)
+    stale = time.time() - manager.session_timeout - 1
+    for session_id in session_ids[:expired]:
+        manager.sessions[session_id]["last_activity"] = stale
+    result["cleanup_expire_ms"] = timed(asyncio.run, manager.cleanup_expired_sessions())
+    result["expired"] = count - len(manager.sessions)
+    return result
+
+
+def measure_tracemalloc(count: int, args) -> dict:
+    """Populate under tracemalloc: traced bytes per session."""
+    manager = SessionManager(session_timeout=3600)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    populate(manager, count, args)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "traced_bytes": current - before,
+        "traced_bytes_per_session": round((current - before) / count),
+    }
+
+
+def run_child(count: int, measure: str, args) -> dict:
+    """Run one measurement in a fresh interpreter."""
+    command = [
+        sys.executable, os.path.abspath(__file__),
+        "--child", measure, "--sizes", str(count),
+        "--echo-history", str(args.echo_history),
+        "--history-events", str(args.history_events),
+        "--message-size", str(args.message_size),
+        "--expire-fraction", str(args.expire_fraction),
+    ]
+    if not args.token:
+        command.append("--no-token")
+    output = subprocess.run(command, capture_output=True, text=True)
+    if output.returncode != 0:
+        raise RuntimeError(f"{measure} run for {count} sessions failed: {output.stderr.strip()[-500:]}")
+    return json.loads(output.stdout)
+
+
+def run(args) -> list:
+    sizes = [int(size) for size in args.sizes.split(",")]
+    budget = args.max_memory_mb * 1024 * 1024 if args.max_memory_mb else available_memory() * MEMORY_HEADROOM
+    results = []
+    per_session = None
+    for count in sizes:
+        if per_session and budget and per_session * count * 1.2 > budget:
+            estimate = per_session * count / 1024 / 1024
+            results.append({"sessions": count, "skipped": f"estimated {estimate:.0f} MiB RSS exceeds the memory budget"})
+            continue
+        result = {"sessions": count}
+        result.update(run_child(count, "rss", args))
+        result.update(run_child(count, "tracemalloc", args))
+        per_session = max(result["rss_bytes_per_session"], result["traced_bytes_per_session"])
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SessionManager memory and operation cost at large populations")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated session counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--echo-history", type=int, default=10, help="echo_history entries per session (default: 10, the tool's cap)")
+    parser.add_argument("--history-events", type=int, default=20, help="session_history events per session (default: 20)")
+    parser.add_argument("--message-size", type=int, default=64, help="Bytes per echoed message (default: 64)")
+    parser.add_argument("--no-token", dest="token", action="store_false", help="Do not store a decoded_token per session")
+    parser.add_argument("--expire-fraction", type=float, default=0.1, help="Fraction expired in the cleanup run (default: 0.1)")
+    parser.add_argument("--max-memory-mb", type=int, help="Skip sizes estimated to need more (default: 80%% of available memory)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--child", choices=["rss", "tracemalloc"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Session creation logs at INFO
+    logging.disable(logging.CRITICAL)
+
+    if args.child:
+        count = int(args.sizes)
+        measure = measure_rss if args.child == "rss" else measure_tracemalloc
+        json.dump(measure(count, args), sys.stdout)
+        return
+
+    results = run(args)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(
+        f"echo_history={args.echo_history} history_events={args.history_events} "
+        f"message_size={args.message_size} token={args.token} expire_fraction={args.expire_fraction}\n"
+    )
+    print(
+        f"{'sessions':>9} {'populate s':>10} {'traced B/s':>10} {'RSS B/s':>9} {'RSS MiB':>8} "
+        f"{'stats ms':>9} {'list10 ms':>9} {'listall ms':>10} {'scan ms':>9} {'expire ms':>9}"
+    )
+    print("-" * 104)
+    for r in results:
+        if "skipped" in r:
+            print(f"{r['sessions']:>9} skipped: {r['skipped']}")
+            continue
+        print(
+            f"{r['sessions']:>9} {r['populate_s']:>10.2f} {r['traced_bytes_per_session']:>10} "
+            f"{r['rss_bytes_per_session']:>9} {r['rss_bytes'] / 1024 / 1024:>8.1f} {r['stats_ms']:>9.2f} "
+            f"{r['list_10_ms']:>9.2f} {r['list_all_ms']:>10.2f} {r['cleanup_scan_ms']:>9.2f} {r['cleanup_expire_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Check cold-start import cost against a budget.
+
+Runs the informational CLI commands (--version, --list-tools) under
+``python -X importtime`` in fresh interpreters and sums the cumulative import
+time of every top-level module that a bare ``python -c pass`` does not
+already import. The serving path (``import mcp_http_echo_server.server``) is
+measured the same way for reference. Exits with status 1 if an
+informational command exceeds the budget, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget-ms 50] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+INFO_COMMANDS = {
+    "--version": ["-m", "mcp_http_echo_server", "--version"],
+    "--list-tools": ["-m", "mcp_http_echo_server", "--list-tools"],
+}
+SERVE_IMPORT = ["-c", "import mcp_http_echo_server.server"]
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map top-level module names to cumulative import time in microseconds."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below their parent
+        if name.startswith(" ") and not name.startswith("  "):
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def measure(args: list) -> dict:
+    """Run one fresh interpreter and collect import times and wall time."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{args} failed: {result.stderr[-500:]}")
+    return {"modules": parse_importtime(result.stderr), "wall_ms": wall * 1000}
+
+
+def import_cost(args: list, baseline: set, repeat: int) -> dict:
+    """Median extra import time and wall time over several runs."""
+    import_ms = []
+    wall_ms = []
+    heaviest = {}
+    for _ in range(repeat):
+        run = measure(args)
+        extra = {name: us for name, us in run["modules"].items() if name not in baseline}
+        import_ms.append(sum(extra.values()) / 1000)
+        wall_ms.append(run["wall_ms"])
+        heaviest = extra
+    top = sorted(heaviest.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        "import_ms": round(statistics.median(import_ms), 2),
+        "wall_ms": round(statistics.median(wall_ms), 2),
+        "heaviest": [{"module": name, "ms": round(us / 1000, 2)} for name, us in top],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI cold-start import time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Import budget for info commands (default: 50)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    baseline = set(measure(["-c", "pass"])["modules"])
+    results = {name: import_cost(cmd, baseline, args.repeat) for name, cmd in INFO_COMMANDS.items()}
+    serve = import_cost(SERVE_IMPORT, baseline, args.repeat)
+    over_budget = [name for name, r in results.items() if r["import_ms"] > args.budget_ms]
+
+    if args.json:
+        json.dump({
+            "budget_ms": args.budget_ms,
+            "info_commands": results,
+            "serve_import": serve,
+            "over_budget": over_budget
+        }, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"budget={args.budget_ms}ms (imports beyond a bare interpreter)\n")
+        print(f"{'command':<16} {'imports ms':>11} {'wall ms':>9}  heaviest")
+        print("-" * 72)
+        for name, r in [*results.items(), ("(serve import)", serve)]:
+            heaviest = ", ".join(f"{h['module']} {h['ms']}" for h in r["heaviest"][:3])
+            print(f"{name:<16} {r['import_ms']:>11.2f} {r['wall_ms']:>9.2f}  {heaviest}")
+        print()
+        print("FAIL: over budget: " + ", ".join(over_budget) if over_budget else "OK: within budget")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark event loop / HTTP parser combinations for the HTTP transport.
+
+Starts the server in a subprocess (stateless mode) once for every available
+combination of --loop {asyncio,uvloop} and --http-parser {h11,httptools},
+drives it with concurrent keep-alive clients calling ``echo`` for a fixed
+duration, and reports throughput and latency percentiles relative to the
+asyncio + h11 baseline.
+
+The load generator runs in this process with httpx, which is itself a
+bottleneck at high request rates; compare combinations against each other
+rather than reading the numbers as absolute server capacity.
+
+Usage:
+    python benchmarks/bench_transport.py [--concurrency 32] [--duration 5]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+LOOPS = ["asyncio", "uvloop"]
+HTTP_PARSERS = ["h11", "httptools"]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def available_combinations() -> list:
+    loops = [loop for loop in LOOPS if loop == "asyncio" or importlib.util.find_spec(loop)]
+    parsers = [p for p in HTTP_PARSERS if p == "h11" or importlib.util.find_spec(p)]
+    return [(loop, parser) for loop in loops for parser in parsers]
+
+
+def start_server(loop: str, parser: str, port: int) -> subprocess.Popen:
+    env = {**os.environ, "MCP_ECHO_DEBUG": "false"}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "mcp_http_echo_server",
+            "--mode", "stateless",
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--loop", loop,
+            "--http-parser", parser,
+            "--max-in-flight", "0",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.post(url, headers=HEADERS, json={"jsonrpc": "2.0", "id": 0, "method": "ping"})
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+async def generate_load(url: str, concurrency: int, duration: float) -> dict:
+    latencies = []
+    errors = 0
+    body = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "echo", "arguments": {"message": "benchmark"}}
+    }
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.post(url, headers=HEADERS, json=body)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2) if latencies else None,
+    }
+
+
+async def run(args) -> list:
+    results = []
+    for loop, parser in available_combinations():
+        port = free_port()
+        url = f"http://127.0.0.1:{port}/mcp"
+        process = start_server(loop, parser, port)
+        try:
+            await wait_ready(url)
+            await generate_load(url, args.concurrency, min(1.0, args.duration))  # warm-up
+            stats = await generate_load(url, args.concurrency, args.duration)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+        results.append({"loop": loop, "http": parser, **stats})
+
+    baseline = next((r["rps"] for r in results if r["loop"] == "asyncio" and r["http"] == "h11"), None)
+    for r in results:
+        r["speedup"] = round(r["rps"] / baseline, 2) if baseline else None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event loop and HTTP parser combinations")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client connections (default: 32)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per combination (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"concurrency={args.concurrency} duration={args.duration}s\n")
+    print(f"{'loop':<8} {'http':<10} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'speedup':>8}")
+    print("-" * 63)
+    for r in results:
+        print(
+            f"{r['loop']:<8} {r['http']:<10} {r['rps']:>9.1f} {r['p50_ms']:>8.2f} "
+            f"{r['p99_ms']:>8.2f} {r['errors']:>7} {r['speedup']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
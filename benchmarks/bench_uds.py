@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Compare Unix domain socket and TCP loopback latency for small echo calls.
+
+Starts the server in a subprocess (stateless mode) once listening on
+127.0.0.1 and once on a Unix domain socket, then sends ``echo`` calls with
+a short message over keep-alive connections and reports latency
+percentiles. The default concurrency of 1 measures per-call latency, which
+is what a local sidecar proxy hop adds; raise it to compare throughput.
+
+Usage:
+    python benchmarks/bench_uds.py [--requests 2000] [--concurrency 1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+BODY = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "echo", "arguments": {"message": "ping"}}
+}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(listen_args: list) -> subprocess.Popen:
+    env = {**os.environ, "MCP_ECHO_DEBUG": "false"}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "mcp_http_echo_server",
+            "--mode", "stateless",
+            "--max-in-flight", "0",
+            *listen_args,
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def make_client(uds: str = None, concurrency: int = 1) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=uds, limits=limits), timeout=30)
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await client.post(url, headers=HEADERS, json={"jsonrpc": "2.0", "id": 0, "method": "ping"})
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+async def measure(client: httpx.AsyncClient, url: str, requests: int, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.post(url, headers=HEADERS, json=BODY)
+            if response.status_code != 200:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 1)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "mean_us": round(statistics.fmean(latencies), 1),
+        "p50_us": percentile(0.50),
+        "p90_us": percentile(0.90),
+        "p99_us": percentile(0.99),
+    }
+
+
+async def run_listener(name: str, listen_args: list, url: str, uds: str, args) -> dict:
+    process = start_server(listen_args)
+    try:
+        async with make_client(uds, args.concurrency) as client:
+            await wait_ready(client, url)
+            await measure(client, url, min(500, args.requests), args.concurrency)  # warm-up
+            stats = await measure(client, url, args.requests, args.concurrency)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"listener": name, **stats}
+
+
+async def run(args) -> list:
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mcp-echo.sock")
+        results = [
+            await run_listener(
+                "tcp", ["--host", "127.0.0.1", "--port", str(port)],
+                f"http://127.0.0.1:{port}/mcp", None, args
+            ),
+            await run_listener("uds", ["--uds", path], "http://localhost/mcp", path, args),
+        ]
+
+    baseline = results[0]["p50_us"]
+    for r in results:
+        r["p50_vs_tcp"] = round(r["p50_us"] / baseline, 3)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Unix domain socket and TCP loopback latency")
+    parser.add_argument("--requests", type=int, default=2000, help="Measured calls per listener (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent client connections (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"requests={args.requests} concurrency={args.concurrency}\n")
+    print(f"{'listener':<9} {'req/s':>9} {'mean us':>9} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9} {'p50/tcp':>8}")
+    print("-" * 68)
+    for r in results:
+        print(
+            f"{r['listener']:<9} {r['rps']:>9.1f} {r['mean_us']:>9.1f} {r['p50_us']:>9.1f} "
+            f"{r['p90_us']:>9.1f} {r['p99_us']:>9.1f} {r['p50_vs_tcp']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
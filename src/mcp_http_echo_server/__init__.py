@@ -1,8 +1,7 @@
 """MCP HTTP Echo Server - A dual-mode echo server with comprehensive debugging tools."""
 
-from .server import MCPEchoServer, create_server
-from .session_manager import SessionManager
-from .utils.state_adapter import StateAdapter
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "1.0.0"
 __all__ = [
@@ -10,4 +9,31 @@ __all__ = [
     "create_server",
     "SessionManager",
     "StateAdapter",
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access so that `import mcp_http_echo_server`
+# (and informational CLI commands) does not pull in FastMCP and uvicorn
+_LAZY_IMPORTS = {
+    "MCPEchoServer": ".server",
+    "create_server": ".server",
+    "SessionManager": ".session_manager",
+    "StateAdapter": ".utils.state_adapter",
+}
+
+if TYPE_CHECKING:
+    from .server import MCPEchoServer, create_server
+    from .session_manager import SessionManager
+    from .utils.state_adapter import StateAdapter
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,16 @@
 """Main entry point for MCP HTTP Echo Server."""
 
 import argparse
-import asyncio
 import logging
 import os
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from dotenv import load_dotenv
-
-from .server import MCPEchoServer
-
-# Load environment variables
-load_dotenv()
+# Options that print something and exit. They skip .env loading and never
+# import the server (FastMCP, uvicorn, tool modules), so they return in
+# milliseconds even on a cold start.
+INFO_OPTIONS = frozenset({"--version", "--list-tools"})
 
 
 def parse_supported_versions(versions_str: str) -> List[str]:
@@ -76,10 +73,29 @@ def setup_logging(debug: bool, log_file: Optional[str] = None):
     )
 
 
+def load_environment(argv: List[str]):
+    """Load .env into the environment unless only info output was requested.
+    
+    Args:
+        argv: Command line arguments (without the program name)
+    """
+    if INFO_OPTIONS.intersection(argv):
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 def main():
     """Main entry point."""
+    # Must run before the parser is built: option defaults come from the environment
+    load_environment(sys.argv[1:])
+    
+    # The registry module is FastMCP-free, so this stays cheap
+    from .tools.registry import ToolRegistry
+    registry = ToolRegistry.from_catalog()
+    
     parser = argparse.ArgumentParser(
-        description="MCP HTTP Echo Server - Dual-mode echo server with 21 comprehensive debugging tools",
+        description=f"MCP HTTP Echo Server - Dual-mode echo server with {registry.total} comprehensive debugging tools",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Modes:
@@ -103,6 +119,9 @@ Examples:
   
   # Run with custom protocol versions
   mcp-http-echo-server --protocol-versions "2025-06-18,2025-03-26"
+  
+  # Listen on a Unix domain socket behind a local proxy
+  mcp-http-echo-server --mode stateless --uds /run/mcp-echo.sock
 
 Environment Variables:
   MCP_ECHO_HOST              - Host to bind to (default: 0.0.0.0)
@@ -112,6 +131,33 @@ Environment Variables:
   MCP_SESSION_TIMEOUT        - Session timeout in seconds (default: 3600)
   MCP_PROTOCOL_VERSIONS      - Comma-separated protocol versions
   MCP_STATELESS             - Force stateless mode (true/false)
+  MCP_MAX_IN_FLIGHT          - Max concurrent HTTP requests, 0 disables (default: 64)
+  MCP_ADMISSION_QUEUE        - Max requests waiting for a slot (default: 256)
+  MCP_ADMISSION_TIMEOUT      - Max seconds a request may wait (default: 2.0)
+  MCP_RATE_LIMIT             - Requests/second per session, 0 disables (default: 0)
+  MCP_RATE_BURST             - Per-session burst size (default: 2x rate)
+  MCP_PRINCIPAL_RATE_LIMIT   - Requests/second per JWT subject/user, 0 disables (default: 0)
+  MCP_PRINCIPAL_RATE_BURST   - Per-principal burst size (default: 2x rate)
+  MCP_COMPRESSION_LEVEL      - gzip/deflate level, 0 disables (default: 1)
+  MCP_COMPRESSION_MIN_SIZE   - Minimum response bytes to compress (default: 1024)
+  MCP_BATCH_CONCURRENCY      - Concurrent entries per stateless JSON-RPC batch, 0 disables (default: 8)
+  MCP_JWKS_FILE              - JWKS file for JWT signature verification
+  MCP_FAULT_INJECTION        - Enable fault injection for chaos testing (true/false)
+  MCP_FAULTS                 - Fault rules, e.g. "tool:echo error=0.1; * latency=200"
+  MCP_PROFILING              - Enable profileServer/memorySnapshot and /debug/profile (true/false)
+  MCP_RECORD_FILE            - Record requests/responses to a rotating JSONL file
+  MCP_RECORD_MAX_MB          - Rotate the recording after this many MiB (default: 100)
+  MCP_RECORD_BACKUPS         - Rotated recording files to keep (default: 5)
+  MCP_DRAIN_TIMEOUT          - Max seconds to finish in-flight requests on SIGTERM (default: 25)
+  MCP_DRAIN_DELAY            - Min seconds to keep serving after SIGTERM (default: 0)
+  MCP_SLOW_CALLBACK_MS       - Record event loop stalls longer than this (default: 100, 0 disables)
+  MCP_UDS                    - Unix domain socket path to listen on
+  MCP_FD                     - Inherited listening socket file descriptor
+  MCP_LOOP                   - Event loop: auto/asyncio/uvloop (default: auto)
+  MCP_HTTP_PARSER            - HTTP parser: auto/h11/httptools (default: auto)
+  MCP_BACKLOG                - Listen socket backlog (default: 2048)
+  MCP_KEEP_ALIVE_TIMEOUT     - Idle keep-alive timeout in seconds (default: 5)
+  MCP_LIMIT_CONCURRENCY      - Max concurrent connections, 0 disables (default: 0)
         """
     )
     
@@ -168,6 +214,196 @@ Environment Variables:
         help="Transport type (default: http)"
     )
     
+    # Admission control options
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=int(os.getenv("MCP_MAX_IN_FLIGHT", "64")),
+        help="Maximum concurrent HTTP requests, 0 disables admission control (default: 64, env: MCP_MAX_IN_FLIGHT)"
+    )
+    parser.add_argument(
+        "--admission-queue",
+        type=int,
+        default=int(os.getenv("MCP_ADMISSION_QUEUE", "256")),
+        help="Maximum requests waiting for a slot (default: 256, env: MCP_ADMISSION_QUEUE)"
+    )
+    parser.add_argument(
+        "--admission-timeout",
+        type=float,
+        default=float(os.getenv("MCP_ADMISSION_TIMEOUT", "2.0")),
+        help="Maximum seconds a request may wait before being shed (default: 2.0, env: MCP_ADMISSION_TIMEOUT)"
+    )
+    
+    # Rate limiting options
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=float(os.getenv("MCP_RATE_LIMIT", "0")),
+        help="Requests per second per session, 0 disables (default: 0, env: MCP_RATE_LIMIT)"
+    )
+    parser.add_argument(
+        "--rate-burst",
+        type=float,
+        default=float(os.getenv("MCP_RATE_BURST", "0")) or None,
+        help="Per-session burst size (default: 2x rate, env: MCP_RATE_BURST)"
+    )
+    parser.add_argument(
+        "--principal-rate-limit",
+        type=float,
+        default=float(os.getenv("MCP_PRINCIPAL_RATE_LIMIT", "0")),
+        help="Requests per second per JWT subject or user, 0 disables (default: 0, env: MCP_PRINCIPAL_RATE_LIMIT)"
+    )
+    parser.add_argument(
+        "--principal-rate-burst",
+        type=float,
+        default=float(os.getenv("MCP_PRINCIPAL_RATE_BURST", "0")) or None,
+        help="Per-principal burst size (default: 2x rate, env: MCP_PRINCIPAL_RATE_BURST)"
+    )
+    
+    # Compression options
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(0, 10),
+        metavar="0-9",
+        default=int(os.getenv("MCP_COMPRESSION_LEVEL", "1")),
+        help="gzip/deflate level for large responses, 0 disables (default: 1, env: MCP_COMPRESSION_LEVEL)"
+    )
+    parser.add_argument(
+        "--compression-min-size",
+        type=int,
+        default=int(os.getenv("MCP_COMPRESSION_MIN_SIZE", "1024")),
+        help="Minimum response size in bytes to compress (default: 1024, env: MCP_COMPRESSION_MIN_SIZE)"
+    )
+    
+    # Batch options
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=int(os.getenv("MCP_BATCH_CONCURRENCY", "8")),
+        help="Concurrent entries per stateless or sessionless adaptive JSON-RPC batch; stateful batches run sequentially, 0 disables batch support (default: 8, env: MCP_BATCH_CONCURRENCY)"
+    )
+    
+    # JWT verification options
+    parser.add_argument(
+        "--jwks-file",
+        default=os.getenv("MCP_JWKS_FILE") or None,
+        metavar="PATH",
+        help="JWKS file with keys for JWT signature verification, reloaded on change (env: MCP_JWKS_FILE)"
+    )
+    
+    # Fault injection options
+    parser.add_argument(
+        "--fault-injection",
+        action="store_true",
+        default=os.getenv("MCP_FAULT_INJECTION", "").lower() in ("true", "1", "yes"),
+        help="Enable fault injection (X-MCP-Fault header, faultInjection tool); never use in production (env: MCP_FAULT_INJECTION)"
+    )
+    parser.add_argument(
+        "--faults",
+        default=os.getenv("MCP_FAULTS") or None,
+        metavar="SPEC",
+        help='Initial fault rules, implies --fault-injection, e.g. "tool:echo error=0.1; * latency=200" (env: MCP_FAULTS)'
+    )
+    
+    # Profiling options
+    parser.add_argument(
+        "--profiling",
+        action="store_true",
+        default=os.getenv("MCP_PROFILING", "").lower() in ("true", "1", "yes"),
+        help="Enable the profileServer and memorySnapshot tools and the unauthenticated GET /debug/profile route (env: MCP_PROFILING)"
+    )
+    
+    # Recording options
+    parser.add_argument(
+        "--record",
+        default=os.getenv("MCP_RECORD_FILE") or None,
+        metavar="PATH",
+        help="Record every request and response to a rotating JSONL file for mcp-http-echo-replay (env: MCP_RECORD_FILE)"
+    )
+    parser.add_argument(
+        "--record-max-mb",
+        type=float,
+        default=float(os.getenv("MCP_RECORD_MAX_MB", "100")),
+        help="Rotate the recording after this many MiB, 0 disables rotation (default: 100, env: MCP_RECORD_MAX_MB)"
+    )
+    parser.add_argument(
+        "--record-backups",
+        type=int,
+        default=int(os.getenv("MCP_RECORD_BACKUPS", "5")),
+        help="Rotated recording files to keep (default: 5, env: MCP_RECORD_BACKUPS)"
+    )
+    
+    # Graceful shutdown options
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=float(os.getenv("MCP_DRAIN_TIMEOUT", "25")),
+        help="Max seconds to let in-flight requests finish after SIGTERM (default: 25, env: MCP_DRAIN_TIMEOUT)"
+    )
+    parser.add_argument(
+        "--drain-delay",
+        type=float,
+        default=float(os.getenv("MCP_DRAIN_DELAY", "0")),
+        help="Min seconds to keep serving with readiness failing after SIGTERM (default: 0, env: MCP_DRAIN_DELAY)"
+    )
+    
+    # Event loop monitoring options
+    parser.add_argument(
+        "--slow-callback-ms",
+        type=float,
+        default=float(os.getenv("MCP_SLOW_CALLBACK_MS", "100")),
+        help="Record event loop stalls longer than this and attribute them to the running tool (default: 100, 0 disables, env: MCP_SLOW_CALLBACK_MS)"
+    )
+    
+    # Transport tuning options
+    parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default=os.getenv("MCP_LOOP", "auto"),
+        help="Event loop implementation; auto uses uvloop if installed (default: auto, env: MCP_LOOP)"
+    )
+    parser.add_argument(
+        "--http-parser",
+        choices=["auto", "h11", "httptools"],
+        default=os.getenv("MCP_HTTP_PARSER", "auto"),
+        help="HTTP protocol implementation; auto uses httptools if installed (default: auto, env: MCP_HTTP_PARSER)"
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=int(os.getenv("MCP_BACKLOG", "2048")),
+        help="Listen socket backlog (default: 2048, env: MCP_BACKLOG)"
+    )
+    parser.add_argument(
+        "--keep-alive-timeout",
+        type=int,
+        default=int(os.getenv("MCP_KEEP_ALIVE_TIMEOUT", "5")),
+        help="Seconds idle keep-alive connections stay open (default: 5, env: MCP_KEEP_ALIVE_TIMEOUT)"
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=int(os.getenv("MCP_LIMIT_CONCURRENCY", "0")),
+        help="Max concurrent connections before answering 503, 0 disables (default: 0, env: MCP_LIMIT_CONCURRENCY)"
+    )
+    
+    # Listener options (HTTP transports, instead of --host/--port)
+    listener = parser.add_mutually_exclusive_group()
+    listener.add_argument(
+        "--uds",
+        default=os.getenv("MCP_UDS") or None,
+        metavar="PATH",
+        help="Listen on a Unix domain socket instead of host/port (env: MCP_UDS)"
+    )
+    listener.add_argument(
+        "--fd",
+        type=int,
+        default=int(os.environ["MCP_FD"]) if os.getenv("MCP_FD") else None,
+        help="Serve on an inherited listening socket file descriptor; systemd socket "
+             "activation (LISTEN_FDS) is detected automatically (env: MCP_FD)"
+    )
+    
     # Debug options
     parser.add_argument(
         "--debug",
@@ -198,35 +434,28 @@ Environment Variables:
     # Handle info options
     if args.list_tools:
         print("MCP HTTP Echo Server - Available Tools\n")
-        print("Echo Tools (2):")
-        print("  echo          - Echo back messages with context")
-        print("  replayLastEcho - Replay last echo (stateful only)")
-        print("\nDebug Tools (4):")
-        print("  printHeader    - Display HTTP headers")
-        print("  requestTiming  - Show request timing metrics")
-        print("  corsAnalysis   - Analyze CORS configuration")
-        print("  environmentDump - Display environment config")
-        print("\nAuth Tools (3):")
-        print("  bearerDecode   - Decode JWT tokens")
-        print("  authContext    - Display auth context")
-        print("  whoIStheGOAT   - AI excellence analyzer")
-        print("\nSystem Tools (2):")
-        print("  healthProbe    - Deep health check")
-        print("  sessionInfo    - Session information")
-        print("\nState Tools (10):")
-        print("  stateInspector   - Inspect state storage")
-        print("  sessionHistory   - Show session history")
-        print("  stateManipulator - Manipulate state")
-        print("  sessionCompare   - Compare sessions")
-        print("  sessionTransfer  - Export/import sessions")
-        print("  stateBenchmark   - Benchmark state ops")
-        print("  sessionLifecycle - Session lifecycle info")
-        print("  stateValidator   - Validate state consistency")
-        print("  requestTracer    - Trace request flow")
-        print("  modeDetector     - Detect operational mode")
-        print("\nTotal: 21 tools")
+        for category, tools in registry.by_category.items():
+            if not tools:
+                continue
+            print(f"{registry.category_title(category)} ({len(tools)}):")
+            width = max(len(tool.name) for tool in tools) + 1
+            for tool in tools:
+                note = " (stateful only)" if tool.stateful_only else ""
+                print(f"  {tool.name:<{width}}- {tool.summary}{note}")
+            print()
+        print(f"Total: {registry.total} tools")
         sys.exit(0)
     
+    # Heavy imports are deferred until we actually serve
+    from .server import MCPEchoServer
+    from .utils.listeners import describe_listener, systemd_listen_fd
+    from .utils.transport_tuning import resolve_http_parser, resolve_loop
+    
+    # systemd socket activation
+    if args.fd is None and not args.uds and args.transport != "stdio":
+        args.fd = systemd_listen_fd()
+    listen_address = describe_listener(args.host, args.port, args.uds, args.fd)
+    
     # Determine mode
     adaptive_mode = False
     if args.stateless:
@@ -271,12 +500,24 @@ Environment Variables:
     else:
         print(f"Mode: {'STATELESS' if stateless_mode else 'STATEFUL'}")
     print(f"Transport: {args.transport.upper()}")
-    print(f"Address: {args.host}:{args.port}")
+    print(f"Address: {listen_address}")
     print(f"Debug: {'Enabled' if args.debug else 'Disabled'}")
     print(f"Protocol versions: {', '.join(supported_versions)}")
     if not stateless_mode or adaptive_mode:
         print(f"Session timeout: {args.session_timeout}s")
-    print(f"Tools: 21 comprehensive debugging tools")
+    if args.max_in_flight > 0:
+        print(f"Admission: {args.max_in_flight} in-flight, queue {args.admission_queue}, wait {args.admission_timeout}s")
+    else:
+        print("Admission: unlimited")
+    if args.rate_limit > 0 or args.principal_rate_limit > 0:
+        print(f"Rate limit: {args.rate_limit or 'off'}/s per session, {args.principal_rate_limit or 'off'}/s per principal")
+    if args.transport != "stdio":
+        print(f"Event loop: {resolve_loop(args.loop)}, HTTP parser: {resolve_http_parser(args.http_parser)}")
+    if args.fault_injection or args.faults:
+        print(f"⚠️ Fault injection: {args.faults or 'enabled, no rules'}")
+    if args.record:
+        print(f"Recording: {args.record}")
+    print(f"Tools: {registry.total} comprehensive debugging tools")
     print()
     
     # Create server
@@ -286,7 +527,27 @@ Environment Variables:
             session_timeout=args.session_timeout,
             debug=args.debug,
             supported_versions=supported_versions,
-            adaptive_mode=adaptive_mode
+            adaptive_mode=adaptive_mode,
+            max_in_flight=args.max_in_flight,
+            admission_queue=args.admission_queue,
+            admission_timeout=args.admission_timeout,
+            rate_limit=args.rate_limit,
+            rate_burst=args.rate_burst,
+            principal_rate_limit=args.principal_rate_limit,
+            principal_rate_burst=args.principal_rate_burst,
+            compression_level=args.compression_level,
+            compression_min_size=args.compression_min_size,
+            batch_concurrency=args.batch_concurrency,
+            drain_timeout=args.drain_timeout,
+            drain_delay=args.drain_delay,
+            slow_callback_threshold=args.slow_callback_ms / 1000,
+            jwks_file=args.jwks_file,
+            fault_injection=args.fault_injection,
+            faults=args.faults,
+            record_file=args.record,
+            record_max_bytes=int(args.record_max_mb * 1024 * 1024),
+            record_backups=args.record_backups,
+            profiling=args.profiling
         )
         
         # Run server
@@ -295,17 +556,23 @@ Environment Variables:
         else:
             mode_str = "STATELESS" if stateless_mode else "STATEFUL"
         logger.info(
-            "Starting server in %s mode on %s:%d",
+            "Starting server in %s mode on %s",
             mode_str,
-            args.host,
-            args.port
+            listen_address
         )
         
         # Run the server
         server.run(
             host=args.host,
             port=args.port,
-            transport=args.transport
+            transport=args.transport,
+            loop=args.loop,
+            http_parser=args.http_parser,
+            backlog=args.backlog,
+            keep_alive_timeout=args.keep_alive_timeout,
+            limit_concurrency=args.limit_concurrency,
+            uds=args.uds,
+            fd=args.fd
         )
         
     except KeyboardInterrupt:
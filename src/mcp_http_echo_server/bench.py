@@ -0,0 +1,362 @@
+"""Load generator for MCP HTTP servers (``mcp-http-echo-bench``).
+
+Opens N concurrent MCP sessions over a shared, pooled HTTP client, runs
+the initialize -> notifications/initialized -> tools/call flow in each and
+mixes tools by weight. Reports throughput and p50/p90/p99/p999 latency per
+tool as a text table or JSON.
+
+Usage:
+    mcp-http-echo-bench --url http://127.0.0.1:3000/mcp --sessions 32 \\
+        --requests 20000 --mix "echo=8,printHeader=1,healthProbe=1"
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+DEFAULT_URL = "http://127.0.0.1:3000/mcp"
+DEFAULT_MIX = "echo=1"
+PROTOCOL_VERSION = "2025-06-18"
+
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+
+# Percentiles reported per tool
+PERCENTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999))
+
+# Arguments used for tools without --tool-args
+DEFAULT_TOOL_ARGS = {
+    "echo": {"message": "bench"},
+    "echoSynthetic": {"size": 256},
+}
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """Parse a weighted tool mix like ``"echo=8,healthProbe=1"``.
+
+    A tool without ``=weight`` gets weight 1.
+
+    Raises:
+        ValueError: On empty mixes or non-positive weights
+    """
+    mix = []
+    for part in spec.split(","):
+        name, sep, weight = part.strip().partition("=")
+        if not name:
+            continue
+        try:
+            value = float(weight) if sep else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for {name}: {weight}") from None
+        if value <= 0:
+            raise ValueError(f"Weight for {name} must be positive")
+        mix.append((name, value))
+    if not mix:
+        raise ValueError("The tool mix is empty")
+    return mix
+
+
+def parse_tool_args(text: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Parse ``--tool-args`` JSON, an object of argument objects per tool.
+
+    Raises:
+        ValueError: On invalid JSON or values that are not objects
+    """
+    tool_args = json.loads(text or "{}")
+    if not isinstance(tool_args, dict):
+        raise ValueError("--tool-args must be a JSON object of tool names to argument objects")
+    for name, arguments in tool_args.items():
+        if not isinstance(arguments, dict):
+            raise ValueError(f"--tool-args for {name} must be a JSON object, got {arguments!r}")
+    return tool_args
+
+
+def latency_summary(latencies: Sequence[float]) -> Dict[str, float]:
+    """Count, mean, min, max and percentiles of latencies in milliseconds.
+
+    Percentiles use the nearest-rank method on the sorted samples.
+    """
+    if not latencies:
+        return {"count": 0}
+    ordered = sorted(latencies)
+    n = len(ordered)
+    summary = {
+        "count": n,
+        "mean_ms": round(sum(ordered) / n, 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+    for label, p in PERCENTILES:
+        summary[f"{label}_ms"] = round(ordered[min(n - 1, int(n * p))], 3)
+    return summary
+
+
+def parse_response(response: httpx.Response) -> Optional[Dict[str, Any]]:
+    """JSON-RPC message of a JSON or SSE response (the last SSE data event)."""
+    text = response.text
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        message = None
+        for line in text.splitlines():
+            if line.startswith("data:"):
+                message = json.loads(line[5:])
+        return message
+    return json.loads(text) if text else None
+
+
+def classify_result(response: httpx.Response) -> Optional[str]:
+    """Error label of a tools/call response, or None on success."""
+    if response.status_code != 200:
+        return f"http_{response.status_code}"
+    try:
+        message = parse_response(response)
+    except ValueError:
+        return "invalid_response"
+    if not isinstance(message, dict):
+        return "no_response"
+    if "error" in message:
+        return f"jsonrpc_{message['error'].get('code')}"
+    if message.get("result", {}).get("isError"):
+        return "tool_error"
+    return None
+
+
+class BenchRun:
+    """Shared state of one benchmark run."""
+
+    def __init__(self, mix: List[Tuple[str, float]], tool_args: Dict[str, Dict[str, Any]], requests: int):
+        self.tools = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.tool_args = tool_args
+        self.remaining = requests
+        self.deadline: Optional[float] = None
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+
+    def take(self) -> bool:
+        """Reserve the next request, False once the run is over."""
+        if self.deadline is not None:
+            return time.perf_counter() < self.deadline
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+    def record(self, name: str, latency_ms: float, error: Optional[str]):
+        if error:
+            self.errors[name][error] += 1
+        else:
+            self.latencies[name].append(latency_ms)
+
+
+async def open_session(client: httpx.AsyncClient, url: str, run: BenchRun, headers: Dict[str, str]) -> Dict[str, str]:
+    """Initialize one MCP session and return its request headers."""
+    headers = dict(headers)
+    start = time.perf_counter()
+    response = await client.post(url, headers=headers, json={
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "mcp-http-echo-bench", "version": "1.0.0"}
+        }
+    })
+    error = None if response.status_code == 200 else f"http_{response.status_code}"
+    run.record("initialize", (time.perf_counter() - start) * 1000, error)
+    if error:
+        raise RuntimeError(f"initialize failed with HTTP {response.status_code}: {response.text[:200]}")
+
+    session_id = response.headers.get("mcp-session-id")
+    if session_id:
+        headers["mcp-session-id"] = session_id
+    headers["mcp-protocol-version"] = PROTOCOL_VERSION
+    await client.post(url, headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+    return headers
+
+
+async def session_worker(client: httpx.AsyncClient, url: str, run: BenchRun, index: int,
+                         headers: Dict[str, str], seed: Optional[int]):
+    """Run one session until the run is over."""
+    rng = random.Random(None if seed is None else seed + index)
+    try:
+        headers = await open_session(client, url, run, headers)
+    except httpx.HTTPError as e:
+        run.errors["initialize"][type(e).__name__] += 1
+        return
+    except RuntimeError:
+        return
+
+    request_id = 0
+    while run.take():
+        name = rng.choices(run.tools, run.weights)[0]
+        request_id += 1
+        body = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": run.tool_args.get(name, {})}
+        }
+        start = time.perf_counter()
+        try:
+            response = await client.post(url, headers=headers, json=body)
+            error = classify_result(response)
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        run.record(name, (time.perf_counter() - start) * 1000, error)
+
+    if "mcp-session-id" in headers:
+        try:
+            await client.delete(url, headers=headers)
+        except httpx.HTTPError:
+            pass
+
+
+async def run_bench(args) -> Dict[str, Any]:
+    """Run the benchmark described by parsed CLI arguments."""
+    mix = parse_mix(args.mix)
+    tool_args = {**DEFAULT_TOOL_ARGS, **parse_tool_args(args.tool_args)}
+    headers = dict(HEADERS)
+    for header in args.header or []:
+        name, _, value = header.partition(":")
+        headers[name.strip()] = value.strip()
+
+    limits = httpx.Limits(max_connections=args.sessions, max_keepalive_connections=args.sessions)
+    transport = httpx.AsyncHTTPTransport(uds=args.uds, limits=limits)
+    async with httpx.AsyncClient(transport=transport, timeout=args.timeout) as client:
+        if args.warmup:
+            warmup = BenchRun(mix, tool_args, args.warmup)
+            await asyncio.gather(*(
+                session_worker(client, args.url, warmup, i, headers, args.seed)
+                for i in range(args.sessions)
+            ))
+
+        run = BenchRun(mix, tool_args, args.requests)
+        started = time.perf_counter()
+        if args.duration:
+            run.deadline = started + args.duration
+        await asyncio.gather(*(
+            session_worker(client, args.url, run, i, headers, args.seed)
+            for i in range(args.sessions)
+        ))
+        elapsed = time.perf_counter() - started
+
+    tools = {}
+    total_ok = total_errors = 0
+    for name in [*run.tools, "initialize"]:
+        ok = len(run.latencies.get(name, ()))
+        errors = sum(run.errors[name].values()) if name in run.errors else 0
+        if name != "initialize":
+            total_ok += ok
+            total_errors += errors
+        tools[name] = {
+            **latency_summary(run.latencies.get(name, ())),
+            "errors": errors,
+            "error_types": dict(run.errors.get(name, {})),
+            "rps": round(ok / elapsed, 1) if elapsed else 0.0,
+        }
+
+    calls = [latency for name in run.tools for latency in run.latencies.get(name, ())]
+    return {
+        "url": args.url,
+        "sessions": args.sessions,
+        "mix": dict(mix),
+        "elapsed_s": round(elapsed, 3),
+        "requests": total_ok + total_errors,
+        "errors": total_errors,
+        "rps": round(total_ok / elapsed, 1) if elapsed else 0.0,
+        "overall": latency_summary(calls),
+        "tools": tools,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """Render a benchmark result as a text table."""
+    lines = [
+        f"url={result['url']} sessions={result['sessions']} elapsed={result['elapsed_s']}s",
+        f"requests={result['requests']} errors={result['errors']} throughput={result['rps']} req/s",
+        "",
+        f"{'tool':<20} {'count':>8} {'errors':>7} {'req/s':>9} {'mean':>8} "
+        f"{'p50':>8} {'p90':>8} {'p99':>8} {'p999':>8} {'max':>8}",
+        "-" * 100,
+    ]
+    rows = [*result["tools"].items(), ("all tools", {**result["overall"], "errors": result["errors"], "rps": result["rps"]})]
+    for name, stats in rows:
+        if not stats.get("count"):
+            lines.append(f"{name:<20} {0:>8} {stats['errors']:>7}")
+            continue
+        lines.append(
+            f"{name:<20} {stats['count']:>8} {stats['errors']:>7} {stats['rps']:>9.1f} {stats['mean_ms']:>8.2f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p90_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['p999_ms']:>8.2f} "
+            f"{stats['max_ms']:>8.2f}"
+        )
+    lines.append("")
+    lines.append("latencies in ms; initialize is not counted in the totals")
+    for name, stats in result["tools"].items():
+        for error, count in stats["error_types"].items():
+            lines.append(f"  {name}: {count} x {error}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for mcp-http-echo-bench."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-http-echo-bench",
+        description="Drive concurrent MCP sessions against a server and report latency percentiles"
+    )
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"MCP endpoint (default: {DEFAULT_URL})")
+    parser.add_argument("--uds", metavar="PATH", help="Connect through a Unix domain socket")
+    parser.add_argument("--sessions", "-c", type=int, default=16, help="Concurrent sessions/connections (default: 16)")
+    parser.add_argument("--requests", "-n", type=int, default=10000, help="Total tool calls (default: 10000)")
+    parser.add_argument("--duration", "-d", type=float, help="Run for this many seconds instead of --requests")
+    parser.add_argument("--warmup", type=int, default=0, help="Unmeasured tool calls before the run (default: 0)")
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f'Weighted tools, e.g. "echo=8,healthProbe=1" (default: {DEFAULT_MIX})'
+    )
+    parser.add_argument(
+        "--tool-args",
+        metavar="JSON",
+        help='Arguments per tool as JSON, e.g. \'{"echoSynthetic": {"size": 4096}}\''
+    )
+    parser.add_argument("--header", "-H", action="append", metavar="NAME: VALUE", help="Extra request header (repeatable)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--seed", type=int, help="Seed for the tool mix")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", "-o", metavar="PATH", help="Also write the JSON results to a file")
+    args = parser.parse_args(argv)
+
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    try:
+        parse_mix(args.mix)
+        parse_tool_args(args.tool_args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        result = asyncio.run(run_bench(args))
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_report(result))
+    if result["requests"] and result["errors"] == result["requests"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""ASGI middleware for the MCP Echo Server HTTP transport."""
+
+from .admission import AdmissionController, AdmissionMiddleware, AdmissionRejected
+from .batch import BatchMiddleware
+from .compression import CompressionMiddleware, negotiate_encoding
+from .drain import DrainController, DrainMiddleware
+from .faults import FaultInjectionMiddleware, FaultInjector, parse_fault_spec
+from .health import HealthMiddleware, HealthState
+from .profiling import ProfileRouteMiddleware
+from .recording import RecordingMiddleware, RecordingWriter
+from .rate_limit import RateLimiter, RateLimitMiddleware, TokenBucket
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionMiddleware",
+    "AdmissionRejected",
+    "BatchMiddleware",
+    "CompressionMiddleware",
+    "DrainController",
+    "DrainMiddleware",
+    "FaultInjectionMiddleware",
+    "FaultInjector",
+    "HealthMiddleware",
+    "HealthState",
+    "ProfileRouteMiddleware",
+    "RateLimiter",
+    "RateLimitMiddleware",
+    "RecordingMiddleware",
+    "RecordingWriter",
+    "TokenBucket",
+    "negotiate_encoding",
+    "parse_fault_spec",
+]
@@ -0,0 +1,257 @@
+"""Admission control and load shedding for the HTTP transport."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Dict
+
+from ..utils.metrics import metrics
+from .common import buffer_request, send_jsonrpc_error
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridable via CLI/env)
+DEFAULT_MAX_IN_FLIGHT = 64
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_MAX_WAIT = 2.0  # seconds
+
+# Extra slots reserved for health probes so they skip the queue; when all
+# of them are busy, probes fall back to the normal slots and queue
+PRIORITY_SLOTS = 4
+PRIORITY_TOOLS = frozenset({"healthProbe"})
+
+# JSON-RPC server error returned with HTTP 503
+OVERLOADED_ERROR_CODE = -32000
+
+# Weight of the newest sample in the service time moving average
+SERVICE_TIME_EWMA_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted."""
+
+    def __init__(self, reason: str, retry_after: float):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Request rejected: {reason}")
+
+
+class AdmissionController:
+    """Bounded in-flight limiter with a FIFO wait queue.
+
+    Requests beyond ``max_in_flight`` wait in a queue of at most
+    ``max_queue`` entries for up to ``max_wait`` seconds. A request whose
+    expected wait (queue position times the moving average service time)
+    already exceeds ``max_wait`` is rejected immediately instead of
+    occupying a queue slot it will time out in.
+
+    Priority traffic first tries ``priority_slots`` extra slots via
+    :meth:`try_acquire_priority` and uses :meth:`acquire` like any other
+    request when they are all taken.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        priority_slots: int = PRIORITY_SLOTS
+    ):
+        """Initialize the admission controller.
+
+        Args:
+            max_in_flight: Maximum number of concurrently executing requests
+            max_queue: Maximum number of requests waiting for a slot
+            max_wait: Maximum time in seconds a request may wait
+            priority_slots: Extra slots reserved for priority traffic
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.priority_slots = priority_slots
+
+        self.in_flight = 0
+        self.priority_in_flight = 0
+        self._waiters: deque = deque()
+        self._service_time_ewma = 0.0
+
+        self._stats = {
+            "admitted": 0,
+            "queued": 0,
+            "priority_admitted": 0,
+            "priority_overflow": 0,
+            "rejected_queue_full": 0,
+            "rejected_wait_estimate": 0,
+            "rejected_timeout": 0,
+            "peak_in_flight": 0,
+            "peak_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return len(self._waiters)
+
+    def _reject(self, reason: str):
+        """Record a rejection and raise."""
+        self._stats[f"rejected_{reason}"] += 1
+        metrics.increment(f"admission.rejected.{reason}")
+        retry_after = max(1.0, self._service_time_ewma * (self.queue_depth + 1) / self.max_in_flight)
+        raise AdmissionRejected(reason, retry_after)
+
+    def try_acquire_priority(self) -> bool:
+        """Take a reserved priority slot without waiting.
+
+        Returns:
+            True if a priority slot was taken (release it with
+            ``priority=True``), False if the caller should use
+            :meth:`acquire` instead
+        """
+        if self.priority_in_flight >= self.priority_slots:
+            self._stats["priority_overflow"] += 1
+            return False
+        self.priority_in_flight += 1
+        self._stats["priority_admitted"] += 1
+        return True
+
+    async def acquire(self) -> float:
+        """Wait for an execution slot.
+
+        Returns:
+            Time spent waiting in seconds
+
+        Raises:
+            AdmissionRejected: If the request is shed
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self._admit()
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue:
+            self._reject("queue_full")
+
+        expected_wait = self._service_time_ewma * (len(self._waiters) + 1) / self.max_in_flight
+        if expected_wait > self.max_wait:
+            self._reject("wait_estimate")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._stats["queued"] += 1
+        self._stats["peak_queue_depth"] = max(self._stats["peak_queue_depth"], len(self._waiters))
+        start = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just as we gave up: pass it on
+                self.release(0.0)
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._reject("timeout")
+
+        waited = time.perf_counter() - start
+        self._stats["total_wait_seconds"] += waited
+        return waited
+
+    def _admit(self):
+        """Account for a newly admitted request."""
+        self.in_flight += 1
+        self._stats["admitted"] += 1
+        self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self.in_flight)
+
+    def release(self, service_time: float, priority: bool = False):
+        """Release a slot and hand it to the next waiter.
+
+        Args:
+            service_time: How long the request held the slot (seconds)
+            priority: Whether the slot came from the priority lane
+        """
+        if priority:
+            self.priority_in_flight -= 1
+            return
+
+        if service_time > 0:
+            self._service_time_ewma += SERVICE_TIME_EWMA_ALPHA * (service_time - self._service_time_ewma)
+
+        self.in_flight -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._admit()
+                waiter.set_result(None)
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        queued = self._stats["queued"]
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "max_wait_seconds": self.max_wait,
+            "in_flight": self.in_flight,
+            "priority_in_flight": self.priority_in_flight,
+            "queue_depth": self.queue_depth,
+            "service_time_ewma_ms": round(self._service_time_ewma * 1000, 3),
+            "average_wait_ms": round(self._stats["total_wait_seconds"] * 1000 / queued, 3) if queued else 0,
+            **{k: v for k, v in self._stats.items() if k != "total_wait_seconds"}
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying an AdmissionController to MCP POST requests.
+
+    GET (SSE listening streams) and DELETE requests pass through untouched.
+    Shed requests receive HTTP 503 with a ``Retry-After`` header and a
+    JSON-RPC error body.
+    """
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        # Buffer the body so we can classify the request, then replay it
+        _, message, receive = await buffer_request(scope, receive)
+        priority = is_priority_request(message) and self.controller.try_acquire_priority()
+
+        if not priority:
+            try:
+                await self.controller.acquire()
+            except AdmissionRejected as e:
+                logger.warning(f"Shedding request ({e.reason}), in_flight={self.controller.in_flight}")
+                await send_jsonrpc_error(
+                    send,
+                    message,
+                    status=503,
+                    code=OVERLOADED_ERROR_CODE,
+                    text="Server overloaded, request rejected",
+                    data={"reason": e.reason, "retry_after": round(e.retry_after, 3)},
+                    retry_after=e.retry_after
+                )
+                return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(time.perf_counter() - start, priority=priority)
+
+
+def is_priority_request(message: Any) -> bool:
+    """Check whether a JSON-RPC message should use the priority lane."""
+    if not isinstance(message, dict) or message.get("method") != "tools/call":
+        return False
+    params = message.get("params") or {}
+    return params.get("name") in PRIORITY_TOOLS
@@ -0,0 +1,243 @@
+"""Concurrent execution of JSON-RPC batch requests."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import codec
+from ..utils.metrics import metrics
+from .common import REQUEST_SCOPE_KEY, buffer_request, get_header, send_jsonrpc_error
+
+logger = logging.getLogger(__name__)
+
+# Default number of batch entries executed at the same time
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Larger batches are rejected outright
+MAX_BATCH_SIZE = 1000
+
+INVALID_REQUEST_CODE = -32600
+INTERNAL_ERROR_CODE = -32603
+
+
+def is_initialize(message: Any) -> bool:
+    """Check whether a batch entry is an initialize request."""
+    return isinstance(message, dict) and message.get("method") == "initialize"
+
+
+def extract_responses(content_type: str, body: bytes) -> List[Dict[str, Any]]:
+    """Extract JSON-RPC responses from a JSON or SSE response body.
+
+    Server-to-client notifications interleaved in an SSE stream (progress,
+    logging) are dropped since a batch response can only carry responses.
+    """
+    if not body:
+        return []
+
+    if content_type.startswith("text/event-stream"):
+        payloads = []
+        data_lines = []
+        for line in body.decode("utf-8").splitlines():
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip())
+            elif not line and data_lines:
+                payloads.append("\n".join(data_lines))
+                data_lines = []
+        if data_lines:
+            payloads.append("\n".join(data_lines))
+        messages = [codec.loads(payload) for payload in payloads]
+    else:
+        parsed = codec.loads(body)
+        messages = parsed if isinstance(parsed, list) else [parsed]
+
+    return [m for m in messages if isinstance(m, dict) and "id" in m and ("result" in m or "error" in m)]
+
+
+class BatchMiddleware:
+    """ASGI middleware that splits JSON-RPC batches into concurrent calls.
+
+    Each entry is dispatched to the wrapped app as its own POST, so rate
+    limiting, admission control and tools behave exactly as for single
+    requests. Entries of stateless batches run concurrently up to
+    ``max_concurrency``. Entries of a stateful batch run one by one in
+    batch order: every request of a session updates its history and
+    request count, so concurrent entries would race on the same session.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        stateless_mode: bool = False,
+        adaptive_mode: bool = False
+    ):
+        self.app = app
+        self.max_concurrency = max(1, max_concurrency)
+        self.stateless_mode = stateless_mode
+        self.adaptive_mode = adaptive_mode
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        _, message, receive = await buffer_request(scope, receive)
+        if not isinstance(message, list):
+            await self.app(scope, receive, send)
+            return
+
+        if not message or len(message) > MAX_BATCH_SIZE:
+            await send_jsonrpc_error(
+                send,
+                None,
+                status=400,
+                code=INVALID_REQUEST_CODE,
+                text="Empty batch" if not message else f"Batch exceeds {MAX_BATCH_SIZE} entries"
+            )
+            return
+
+        start = time.perf_counter()
+        responses, session_id = await self.execute(scope, message)
+        metrics.increment("batch.requests")
+        metrics.increment("batch.entries", len(message))
+        metrics.increment("batch.seconds", time.perf_counter() - start)
+
+        if not responses:
+            # Batch of notifications only
+            await send({"type": "http.response.start", "status": 202, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        payload = codec.dumps_bytes(responses)
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+        ]
+        if session_id:
+            headers.append((b"mcp-session-id", session_id.encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    async def execute(self, scope, batch: List[Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Run all batch entries and collect their responses in batch order.
+
+        Without an ``mcp-session-id`` header, the entries up to the first
+        ``initialize`` run first and the session it creates is passed on to
+        all later entries.
+
+        Returns:
+            Tuple of (responses, session ID reported by the app)
+        """
+        session_id = get_header(scope, b"mcp-session-id")
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(batch)
+        reported = []
+
+        async def run_entry(index: int):
+            responses, new_session_id = await self.dispatch(scope, batch[index], session_id)
+            results[index] = responses
+            if new_session_id:
+                reported.append(new_session_id)
+
+        pending = list(range(len(batch)))
+        if session_id is None:
+            first_initialize = next((i for i in pending if is_initialize(batch[i])), None)
+            if first_initialize is not None:
+                for index in pending[:first_initialize + 1]:
+                    await run_entry(index)
+                pending = pending[first_initialize + 1:]
+                session_id = reported[0] if reported else None
+
+        stateful = not self.stateless_mode and (session_id is not None or not self.adaptive_mode)
+        if stateful:
+            for index in pending:
+                await run_entry(index)
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def run_limited(index: int):
+                async with semaphore:
+                    await run_entry(index)
+
+            await asyncio.gather(*(run_limited(index) for index in pending))
+
+        responses = [r for entry_responses in results for r in (entry_responses or [])]
+        return responses, reported[0] if reported else None
+
+    async def dispatch(
+        self,
+        scope,
+        entry: Any,
+        session_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Send one batch entry through the wrapped app.
+
+        Args:
+            scope: ASGI scope of the batch request
+            entry: JSON-RPC message to send
+            session_id: Session to send the entry in (overrides the header)
+
+        Returns:
+            Tuple of (JSON-RPC responses, mcp-session-id response header)
+        """
+        body = codec.dumps_bytes(entry)
+        headers = [
+            (k, v) for k, v in scope["headers"]
+            if k not in (b"content-length", b"accept-encoding", b"mcp-session-id")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        if session_id:
+            headers.append((b"mcp-session-id", session_id.encode("latin-1")))
+        sub_scope = {**scope, "headers": headers}
+        sub_scope.pop(REQUEST_SCOPE_KEY, None)
+
+        done = asyncio.Event()
+        status = 500
+        response_headers = []
+        chunks = []
+        body_sent = False
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Streaming responses watch for disconnects; only report one once done
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    done.set()
+
+        try:
+            await self.app(sub_scope, receive, send)
+        finally:
+            done.set()
+
+        header_map = {k.lower(): v.decode("latin-1") for k, v in response_headers}
+        content_type = header_map.get(b"content-type", "")
+        session_id = header_map.get(b"mcp-session-id")
+        response_body = b"".join(chunks)
+
+        try:
+            responses = extract_responses(content_type, response_body)
+        except ValueError:
+            responses = []
+
+        if not responses and status >= 400 and isinstance(entry, dict) and "id" in entry:
+            responses = [{
+                "jsonrpc": "2.0",
+                "id": entry["id"],
+                "error": {
+                    "code": INTERNAL_ERROR_CODE,
+                    "message": f"HTTP {status}: {response_body[:200].decode('utf-8', 'replace')}"
+                }
+            }]
+        return responses, session_id
@@ -0,0 +1,120 @@
+"""Shared ASGI helpers for the HTTP middleware."""
+
+from typing import Any, Optional, Tuple
+
+from ..utils import codec
+
+# Scope key under which the buffered body and parsed message are cached
+REQUEST_SCOPE_KEY = "mcp_echo.request"
+
+
+async def read_body(receive) -> bytes:
+    """Read a complete ASGI request body."""
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive):
+    """Return a receive callable that yields an already-read body first."""
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def parse_jsonrpc(body: bytes) -> Optional[Any]:
+    """Parse a JSON-RPC body, returning None if it is not valid JSON."""
+    try:
+        return codec.loads(body) if body else None
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+async def buffer_request(scope, receive) -> Tuple[bytes, Any, Any]:
+    """Buffer and parse a request body once per request.
+    
+    The first middleware to call this reads the body and caches it on the
+    scope; later middleware reuse the cached copy and the receive callable
+    they were given (which already replays the body).
+    
+    Args:
+        scope: ASGI scope
+        receive: ASGI receive callable
+        
+    Returns:
+        Tuple of (body, parsed JSON-RPC message or None, receive callable)
+    """
+    cached = scope.get(REQUEST_SCOPE_KEY)
+    if cached is not None:
+        return cached[0], cached[1], receive
+    
+    body = await read_body(receive)
+    message = parse_jsonrpc(body)
+    scope[REQUEST_SCOPE_KEY] = (body, message)
+    return body, message, replay_body(body, receive)
+
+
+def get_header(scope, name: bytes) -> Optional[str]:
+    """Get a request header from an ASGI scope.
+    
+    Args:
+        scope: ASGI scope
+        name: Lower-case header name
+        
+    Returns:
+        Header value or None
+    """
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+async def send_jsonrpc_error(
+    send,
+    message: Any,
+    status: int,
+    code: int,
+    text: str,
+    data: Optional[dict] = None,
+    retry_after: Optional[float] = None
+):
+    """Send an HTTP error response carrying a JSON-RPC error object.
+    
+    Args:
+        send: ASGI send callable
+        message: Parsed JSON-RPC request (used for the response id)
+        status: HTTP status code
+        code: JSON-RPC error code
+        text: Error message
+        data: Optional error data
+        retry_after: Optional Retry-After value in seconds
+    """
+    request_id = message.get("id") if isinstance(message, dict) else None
+    error = {"code": code, "message": text}
+    if data:
+        error["data"] = data
+    payload = codec.dumps_bytes({"jsonrpc": "2.0", "id": request_id, "error": error})
+
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(payload)).encode()),
+    ]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(int(retry_after + 0.999)).encode()))
+
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": payload})
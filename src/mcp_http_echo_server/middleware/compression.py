@@ -0,0 +1,211 @@
+"""Response compression negotiated from Accept-Encoding (gzip/deflate)."""
+
+import logging
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+
+from ..utils.metrics import metrics
+from .common import buffer_request, get_header
+
+logger = logging.getLogger(__name__)
+
+# Responses smaller than this are sent uncompressed
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Level 1 is the fastest zlib setting; JSON still compresses well at this level
+DEFAULT_COMPRESSION_LEVEL = 1
+
+# zlib window bits selecting the container format
+ENCODING_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+COMPRESSIBLE_TYPES = ("application/json", "text/event-stream", "text/")
+
+# Cap on distinct per-tool labels (names come from client input)
+MAX_TRACKED_LABELS = 256
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        "gzip", "deflate", or None if neither is acceptable
+    """
+    if not accept_encoding:
+        return None
+
+    # Explicitly listed codings keep their own weight (q=0 refuses them);
+    # "*" only covers codings that are not listed
+    explicit: Dict[str, float] = {}
+    wildcard_q = 0.0
+    order: List[str] = []
+    for item in accept_encoding.split(","):
+        parts = item.strip().split(";")
+        coding = parts[0].strip().lower()
+        q = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if coding == "*":
+            wildcard_q = q
+            order.extend(ENCODING_WBITS)
+        elif coding not in explicit:
+            explicit[coding] = q
+            order.append(coding)
+
+    best = None
+    best_q = 0.0
+    for coding in order:
+        # Ties prefer the coding listed first (gzip for "*")
+        q = explicit.get(coding, wildcard_q)
+        if coding in ENCODING_WBITS and q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def get_request_label(message: Any) -> str:
+    """Label a request for per-tool metrics (tool name or JSON-RPC method)."""
+    if isinstance(message, dict):
+        if message.get("method") == "tools/call":
+            return (message.get("params") or {}).get("name") or "tools/call"
+        return message.get("method") or "response"
+    if isinstance(message, list):
+        return "batch"
+    return "unknown"
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing MCP POST responses.
+
+    The decision is made on the first body chunk: if it reaches the size
+    threshold the whole response is compressed. Streaming (SSE) responses
+    are flushed with Z_SYNC_FLUSH after every chunk so events are not held
+    back by the compressor.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        level: int = DEFAULT_COMPRESSION_LEVEL
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "responses": 0,
+            "compressed_responses": 0,
+            "bytes_uncompressed": 0,
+            "bytes_sent": 0,
+        })
+        metrics.register_collector("compression", self.get_stats)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        _, message, receive = await buffer_request(scope, receive)
+        label = get_request_label(message)
+        if label not in self._stats and len(self._stats) >= MAX_TRACKED_LABELS:
+            label = "other"
+        responder = CompressionResponder(
+            send,
+            negotiate_encoding(get_header(scope, b"accept-encoding")),
+            self.minimum_size,
+            self.level,
+            self._stats[label]
+        )
+        await self.app(scope, receive, responder.send)
+        await responder.finish()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-tool compression statistics."""
+        per_tool = {}
+        for label, stats in sorted(self._stats.items()):
+            sent = stats["bytes_sent"]
+            raw = stats["bytes_uncompressed"]
+            per_tool[label] = {**stats, "ratio": round(sent / raw, 3) if raw else 1.0}
+        return {
+            "minimum_size": self.minimum_size,
+            "level": self.level,
+            "per_tool": per_tool
+        }
+
+
+class CompressionResponder:
+    """Wraps ASGI send for one response, compressing it if worthwhile."""
+
+    def __init__(self, send, encoding: Optional[str], minimum_size: int, level: int, stats: Dict[str, int]):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.level = level
+        self.stats = stats
+        self._start_message = None
+        self._started = False
+        self._compressor = None
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            # Hold headers back until we know whether to compress
+            self._start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self._started:
+            self._started = True
+            if self._should_compress(body):
+                headers = MutableHeaders(raw=self._start_message["headers"])
+                del headers["content-length"]
+                headers["content-encoding"] = self.encoding
+                headers.add_vary_header("Accept-Encoding")
+                self._compressor = zlib.compressobj(self.level, zlib.DEFLATED, ENCODING_WBITS[self.encoding])
+                self.stats["compressed_responses"] += 1
+            self.stats["responses"] += 1
+            await self._send(self._start_message)
+
+        self.stats["bytes_uncompressed"] += len(body)
+        if self._compressor:
+            body = self._compressor.compress(body) + self._compressor.flush(
+                zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+            )
+            message = {"type": "http.response.body", "body": body, "more_body": more_body}
+        self.stats["bytes_sent"] += len(body)
+        await self._send(message)
+
+    def _should_compress(self, first_chunk: bytes) -> bool:
+        """Decide whether to compress based on encoding, type and size."""
+        if not self.encoding or self.level <= 0 or len(first_chunk) < self.minimum_size:
+            return False
+        headers = MutableHeaders(raw=self._start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def finish(self):
+        """Send held-back headers if the app never sent a body."""
+        if self._start_message and not self._started:
+            self._started = True
+            self.stats["responses"] += 1
+            await self._send(self._start_message)
@@ -0,0 +1,267 @@
+"""Graceful drain on SIGTERM with in-flight request tracking."""
+
+import asyncio
+import logging
+import signal
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..utils.metrics import metrics
+from .common import buffer_request, send_jsonrpc_error
+
+logger = logging.getLogger(__name__)
+
+# Default upper bound for waiting on in-flight requests (seconds); stays
+# below the common 30s Kubernetes termination grace period
+DEFAULT_DRAIN_TIMEOUT = 25.0
+
+# Default minimum time to keep serving with readiness failing, so load
+# balancers notice before the listener closes (seconds)
+DEFAULT_DRAIN_DELAY = 0.0
+
+# uvicorn's limit for connections still open once draining is done
+# (long-lived GET SSE streams never finish on their own)
+STREAM_CLOSE_TIMEOUT = 5
+
+# JSON-RPC server error returned with HTTP 503 for new sessions while draining
+DRAINING_ERROR_CODE = -32002
+
+
+class DrainController:
+    """Tracks in-flight requests and coordinates a graceful drain.
+
+    On SIGTERM the controller marks the server as draining (readiness fails,
+    new sessions are refused), waits for in-flight POST requests to finish
+    up to ``drain_timeout``, then hands the signal to uvicorn's own handler
+    to stop listening. Shutdown hooks run when the application lifespan
+    ends, after uvicorn has closed all connections.
+
+    The hooks stop the session cleanup task, flush the traffic recorder and
+    remove a Unix socket file. Session state itself is kept in memory only
+    and never persisted, so there is no pending state to flush; anything
+    that starts buffering writes should register a hook here.
+    """
+
+    def __init__(
+        self,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        drain_delay: float = DEFAULT_DRAIN_DELAY,
+        health=None
+    ):
+        """Initialize the drain controller.
+
+        Args:
+            drain_timeout: Max seconds to wait for in-flight requests
+            drain_delay: Min seconds to keep serving after SIGTERM
+            health: HealthState to flip to not ready (optional)
+        """
+        self.drain_timeout = drain_timeout
+        self.drain_delay = drain_delay
+        self.health = health
+
+        self.in_flight = 0
+        self.streams = 0
+        self.draining = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._previous_handler: Any = None
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+        self.drain_started: Optional[float] = None
+        self._stats = {
+            "drains": 0,
+            "rejected_sessions": 0,
+            "last_wait_seconds": None,
+            "last_remaining_in_flight": None,
+            "last_shutdown_seconds": None,
+        }
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]):
+        """Register a coroutine function to run once the server has drained."""
+        self._shutdown_hooks.append(hook)
+
+    def request_started(self, stream: bool = False):
+        """Account for a request entering the app."""
+        if stream:
+            self.streams += 1
+            return
+        self.in_flight += 1
+        self._idle.clear()
+
+    def request_finished(self, stream: bool = False):
+        """Account for a request leaving the app."""
+        if stream:
+            self.streams -= 1
+            return
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+    def session_rejected(self):
+        """Count an initialize request refused while draining."""
+        self._stats["rejected_sessions"] += 1
+        metrics.increment("drain.rejected_sessions")
+
+    def install_signal_handler(self):
+        """Intercept SIGTERM, keeping the current handler (uvicorn's) for later.
+
+        Only possible from the main thread; elsewhere SIGTERM keeps its
+        default immediate-shutdown behaviour.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        loop = asyncio.get_running_loop()
+
+        def on_sigterm(signum, frame):
+            loop.call_soon_threadsafe(self._on_sigterm)
+
+        self._previous_handler = signal.signal(signal.SIGTERM, on_sigterm)
+
+    def restore_signal_handler(self):
+        """Put the handler replaced by install_signal_handler back."""
+        if self._previous_handler is not None:
+            signal.signal(signal.SIGTERM, self._previous_handler)
+            self._previous_handler = None
+
+    def _on_sigterm(self):
+        if self._drain_task is not None:
+            # Second SIGTERM: stop waiting
+            logger.warning("SIGTERM received again, shutting down without waiting")
+            self._drain_task.cancel()
+            self._exit()
+            return
+        self._drain_task = asyncio.get_running_loop().create_task(self.drain())
+
+    def begin(self):
+        """Enter draining mode: readiness fails and new sessions are refused."""
+        if self.draining:
+            return
+        self.draining = True
+        self.drain_started = time.monotonic()
+        self._stats["drains"] += 1
+        metrics.increment("drain.started")
+        if self.health is not None:
+            self.health.set_draining()
+
+    async def drain(self):
+        """Drain in-flight requests, then let uvicorn shut down."""
+        self.begin()
+        logger.info(
+            f"Draining: {self.in_flight} request(s) and {self.streams} stream(s) in flight, "
+            f"timeout {self.drain_timeout}s"
+        )
+
+        if self.drain_delay > 0:
+            await asyncio.sleep(self.drain_delay)
+
+        remaining = max(0.0, self.drain_timeout - (time.monotonic() - self.drain_started))
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            pass
+
+        waited = time.monotonic() - self.drain_started
+        self._stats["last_wait_seconds"] = round(waited, 3)
+        self._stats["last_remaining_in_flight"] = self.in_flight
+        if self.in_flight:
+            metrics.increment("drain.deadline_exceeded")
+            logger.warning(f"Drain deadline reached after {waited:.2f}s with {self.in_flight} request(s) still in flight")
+        else:
+            logger.info(f"Drained all requests in {waited:.2f}s")
+        self._exit()
+
+    def _exit(self):
+        """Hand the signal to the replaced handler (uvicorn stops serving)."""
+        handler = self._previous_handler
+        if callable(handler):
+            handler(signal.SIGTERM, None)
+        else:
+            # No Python-level handler to defer to (e.g. SIG_DFL)
+            self.restore_signal_handler()
+            signal.raise_signal(signal.SIGTERM)
+
+    async def run_shutdown_hooks(self):
+        """Run shutdown hooks and log total drain timing."""
+        start = time.monotonic()
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"Shutdown hook failed: {e}")
+
+        if self.drain_started is not None:
+            total = time.monotonic() - self.drain_started
+            self._stats["last_shutdown_seconds"] = round(total, 3)
+            logger.info(
+                f"Shutdown complete {total:.2f}s after SIGTERM "
+                f"(drain {self._stats['last_wait_seconds']}s, hooks {time.monotonic() - start:.2f}s)"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get drain statistics."""
+        return {
+            "draining": self.draining,
+            "in_flight": self.in_flight,
+            "streams": self.streams,
+            "drain_timeout_seconds": self.drain_timeout,
+            **self._stats
+        }
+
+
+class DrainMiddleware:
+    """ASGI middleware tracking in-flight requests for graceful drain.
+
+    POST requests count as in flight (including their SSE responses); GET
+    SSE listening streams are counted separately since they only end when
+    the client or server closes them. While draining, ``initialize``
+    requests receive HTTP 503 so clients open new sessions elsewhere.
+    """
+
+    def __init__(self, app, controller: DrainController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            self.controller.install_signal_handler()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.controller.restore_signal_handler()
+                await self.controller.run_shutdown_hooks()
+            return
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method == "POST" and self.controller.draining:
+            _, message, receive = await buffer_request(scope, receive)
+            if is_initialize_request(message):
+                self.controller.session_rejected()
+                await send_jsonrpc_error(
+                    send,
+                    message,
+                    status=503,
+                    code=DRAINING_ERROR_CODE,
+                    text="Server is shutting down, not accepting new sessions",
+                    retry_after=1
+                )
+                return
+
+        stream = method == "GET"
+        self.controller.request_started(stream)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.request_finished(stream)
+
+
+def is_initialize_request(message: Any) -> bool:
+    """Check whether a JSON-RPC message (or batch) opens a new session."""
+    if isinstance(message, list):
+        return any(is_initialize_request(m) for m in message)
+    return isinstance(message, dict) and message.get("method") == "initialize"
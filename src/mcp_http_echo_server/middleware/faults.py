@@ -0,0 +1,342 @@
+"""Fault injection for chaos testing MCP clients.
+
+Rules are written as ``[target] key=value ...`` and separated by ``;``::
+
+    tool:echo error=0.2; method:tools/list latency=300 jitter=100; * drip=2048
+
+Targets are ``tool:<name>`` (a ``tools/call`` of that tool),
+``method:<json-rpc method>`` or ``*`` (any request, the default). The first
+matching rule applies. Keys:
+
+- ``error=P``: answer with an error instead of running the request;
+  ``status=N`` sets the HTTP status (default 500, 200 sends the JSON-RPC
+  error in a normal response)
+- ``latency=MS``, ``jitter=MS``, ``latency_rate=P``: delay the request by
+  latency +/- jitter (with probability latency_rate, default 1)
+- ``drop=P``, ``drop_hold=S``: run the request but never answer; the
+  connection is held until the client gives up or ``drop_hold`` seconds
+  (default 30) pass
+- ``truncate=P``, ``truncate_after=BYTES``: end the response body early
+  (default after 64 bytes), e.g. an SSE stream without its result
+- ``drip=BYTES_PER_SECOND``, ``drip_chunk=BYTES``: throttle the response
+  body to a slow drip (default chunks of 16 bytes)
+
+The middleware is only installed when fault injection is enabled, so it
+costs nothing otherwise. Rules come from configuration, the admin tool, or
+a per-request ``X-MCP-Fault`` header that applies to that request only.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from ..utils.metrics import metrics
+from .common import buffer_request, get_header, send_jsonrpc_error
+
+logger = logging.getLogger(__name__)
+
+FAULT_HEADER = b"x-mcp-fault"
+
+# JSON-RPC error code for injected errors
+INJECTED_ERROR_CODE = -32099
+
+DEFAULT_DROP_HOLD = 30.0
+DEFAULT_TRUNCATE_AFTER = 64
+DEFAULT_DRIP_CHUNK = 16
+
+FAULT_TYPES = ("error", "latency", "drop", "truncate", "drip")
+
+
+class FaultRule(NamedTuple):
+    """One fault injection rule."""
+
+    target: str = "*"
+    error: float = 0.0
+    status: int = 500
+    latency: float = 0.0
+    jitter: float = 0.0
+    latency_rate: float = 1.0
+    drop: float = 0.0
+    drop_hold: float = DEFAULT_DROP_HOLD
+    truncate: float = 0.0
+    truncate_after: int = DEFAULT_TRUNCATE_AFTER
+    drip: float = 0.0
+    drip_chunk: int = DEFAULT_DRIP_CHUNK
+
+    def matches(self, targets: Tuple[str, ...]) -> bool:
+        """Whether the rule applies to a request with these targets."""
+        return self.target == "*" or self.target in targets
+
+    def describe(self) -> str:
+        """Render the rule back to spec syntax (non-default keys only)."""
+        defaults = FaultRule()
+        options = [
+            f"{key}={value}" for key, value in self._asdict().items()
+            if key != "target" and value != getattr(defaults, key)
+        ]
+        return " ".join([self.target, *options])
+
+
+_RULE_FIELDS = {name: type(default) for name, default in FaultRule._field_defaults.items() if name != "target"}
+
+
+def parse_fault_spec(spec: str) -> List[FaultRule]:
+    """Parse a fault spec into rules.
+
+    Args:
+        spec: Rules separated by ";" (see module docstring)
+
+    Returns:
+        Parsed rules (empty for a blank spec)
+
+    Raises:
+        ValueError: On unknown keys, bad or non-finite values, probabilities
+            outside [0, 1] or a status outside 100-599
+    """
+    rules = []
+    for part in spec.split(";"):
+        tokens = part.split()
+        if not tokens:
+            continue
+        target = "*"
+        if "=" not in tokens[0]:
+            target = tokens.pop(0)
+            if target != "*" and not target.startswith(("tool:", "method:")):
+                raise ValueError(f"Invalid fault target '{target}': use tool:<name>, method:<name> or *")
+        options: Dict[str, Any] = {}
+        for token in tokens:
+            key, sep, value = token.partition("=")
+            if not sep or key not in _RULE_FIELDS:
+                raise ValueError(f"Invalid fault option '{token}'. Keys: {', '.join(_RULE_FIELDS)}")
+            try:
+                options[key] = _RULE_FIELDS[key](value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {key}: {value}") from None
+            if not math.isfinite(options[key]):
+                raise ValueError(f"Invalid value for {key}: {value}")
+            if options[key] < 0:
+                raise ValueError(f"{key} must not be negative")
+        rule = FaultRule(target, **options)
+        for key in ("error", "latency_rate", "drop", "truncate"):
+            if getattr(rule, key) > 1:
+                raise ValueError(f"{key} is a probability and must be between 0 and 1")
+        if not 100 <= rule.status <= 599:
+            raise ValueError(f"status must be an HTTP status code (100-599), got {rule.status}")
+        rules.append(rule)
+    return rules
+
+
+def request_targets(message: Any) -> Tuple[str, ...]:
+    """Fault targets of a JSON-RPC message (or batch)."""
+    if isinstance(message, list):
+        return tuple(target for entry in message for target in request_targets(entry))
+    if not isinstance(message, dict):
+        return ()
+    method = message.get("method")
+    targets = [f"method:{method}"]
+    if method == "tools/call":
+        params = message.get("params")
+        if isinstance(params, dict) and params.get("name"):
+            targets.append(f"tool:{params['name']}")
+    return tuple(targets)
+
+
+class FaultPlan(NamedTuple):
+    """Faults drawn for one request."""
+
+    error: bool
+    latency: float
+    drop: bool
+    truncate: bool
+    rule: FaultRule
+
+
+class FaultInjector:
+    """Holds the active fault rules and counts injected faults."""
+
+    def __init__(self, rules: Optional[List[FaultRule]] = None, allow_header: bool = True, seed: Optional[int] = None):
+        """Initialize the injector.
+
+        Args:
+            rules: Initial rules (from configuration)
+            allow_header: Honour the per-request X-MCP-Fault header
+            seed: Seed for reproducible fault decisions
+        """
+        self.rules: List[FaultRule] = list(rules or [])
+        self.allow_header = allow_header
+        self._rng = random.Random(seed)
+        self.injected: Counter = Counter()
+        self.requests = 0
+
+    def set_rules(self, rules: List[FaultRule]):
+        """Replace the active rules."""
+        self.rules = list(rules)
+        logger.warning(f"Fault injection rules set: {self.describe_rules() or 'none'}")
+
+    def describe_rules(self) -> str:
+        """Active rules in spec syntax."""
+        return "; ".join(rule.describe() for rule in self.rules)
+
+    def plan(self, rules: List[FaultRule], targets: Tuple[str, ...]) -> Optional[FaultPlan]:
+        """Draw the faults for a request from the first matching rule."""
+        rule = next((rule for rule in rules if rule.matches(targets)), None)
+        if rule is None:
+            return None
+        rng = self._rng
+        latency = 0.0
+        if rule.latency and rng.random() < rule.latency_rate:
+            latency = max(0.0, rule.latency + rng.uniform(-rule.jitter, rule.jitter)) / 1000
+        return FaultPlan(
+            error=rng.random() < rule.error,
+            latency=latency,
+            drop=rng.random() < rule.drop,
+            truncate=rng.random() < rule.truncate,
+            rule=rule
+        )
+
+    def record(self, fault: str):
+        """Count one injected fault."""
+        self.injected[fault] += 1
+        metrics.increment(f"faults.{fault}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fault injection statistics."""
+        return {
+            "rules": self.describe_rules(),
+            "allow_header": self.allow_header,
+            "requests_matched": self.requests,
+            "injected": {fault: self.injected.get(fault, 0) for fault in FAULT_TYPES}
+        }
+
+
+class FaultInjectionMiddleware:
+    """ASGI middleware applying fault rules to MCP requests."""
+
+    def __init__(self, app, injector: FaultInjector):
+        self.app = app
+        self.injector = injector
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        injector = self.injector
+        rules = injector.rules
+        if injector.allow_header:
+            header = get_header(scope, FAULT_HEADER)
+            if header:
+                try:
+                    rules = parse_fault_spec(header)
+                except ValueError as e:
+                    logger.debug(f"Ignoring invalid {FAULT_HEADER.decode()} header: {e}")
+        if not rules:
+            await self.app(scope, receive, send)
+            return
+
+        message = None
+        if scope["method"] == "POST":
+            _, message, receive = await buffer_request(scope, receive)
+        plan = injector.plan(rules, request_targets(message))
+        if plan is None:
+            await self.app(scope, receive, send)
+            return
+        injector.requests += 1
+
+        if plan.latency:
+            injector.record("latency")
+            await asyncio.sleep(plan.latency)
+
+        if plan.error:
+            injector.record("error")
+            await send_jsonrpc_error(
+                send,
+                message,
+                status=plan.rule.status,
+                code=INJECTED_ERROR_CODE,
+                text="Injected fault",
+                data={"fault": "error"}
+            )
+            return
+
+        if plan.drop:
+            injector.record("drop")
+            await self._drop(scope, receive, send, plan.rule.drop_hold)
+            return
+
+        if plan.truncate or plan.rule.drip:
+            if plan.truncate:
+                injector.record("truncate")
+            if plan.rule.drip:
+                injector.record("drip")
+            send = self._shaped_send(send, plan)
+        await self.app(scope, receive, send)
+
+    async def _drop(self, scope, receive, send, hold: float):
+        """Run the request, discard its response and leave the client hanging."""
+        async def discard(message):
+            pass
+
+        await self.app(scope, receive, discard)
+        # Wait for the client to give up (or the hold time), then close
+        deadline = time.monotonic() + hold
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                message = await asyncio.wait_for(receive(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if message["type"] == "http.disconnect":
+                return
+        await send({"type": "http.response.start", "status": 504, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    def _shaped_send(send, plan: FaultPlan):
+        """Wrap send to truncate and/or throttle the response body."""
+        limit = plan.rule.truncate_after if plan.truncate else None
+        rate = plan.rule.drip
+        chunk_size = max(1, plan.rule.drip_chunk)
+        sent = 0
+        finished = False
+
+        async def shaped(message):
+            nonlocal sent, finished
+            if finished:
+                return
+            if message["type"] == "http.response.start":
+                if limit is not None:
+                    # The body will be shorter than declared
+                    message = {
+                        **message,
+                        "headers": [(k, v) for k, v in message.get("headers", []) if k.lower() != b"content-length"]
+                    }
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if limit is not None and sent + len(body) >= limit:
+                body = body[:limit - sent]
+                more_body = False
+                finished = True
+
+            if rate:
+                for offset in range(0, len(body), chunk_size):
+                    piece = body[offset:offset + chunk_size]
+                    last = offset + chunk_size >= len(body)
+                    await send({"type": "http.response.body", "body": piece, "more_body": more_body or not last})
+                    await asyncio.sleep(len(piece) / rate)
+                if not body:
+                    await send({"type": "http.response.body", "body": b"", "more_body": more_body})
+            else:
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+            sent += len(body)
+
+        return shaped
@@ -0,0 +1,167 @@
+"""Plain HTTP liveness and readiness routes that bypass the MCP stack."""
+
+import logging
+import time
+from typing import Any, Dict, List
+
+from ..utils import codec
+from ..utils.loop_monitor import LoopLagMonitor
+
+logger = logging.getLogger(__name__)
+
+LIVE_PATHS = frozenset({"/health", "/health/live"})
+READY_PATH = "/health/ready"
+
+# Readiness fails when the loop lags more than this (seconds)
+DEFAULT_MAX_LOOP_LAG = 0.5
+
+# Readiness also fails for this long (seconds) after the loop was blocked
+# for more than the lag limit
+DEFAULT_STALL_WINDOW = 10.0
+
+# Readiness fails when the admission queue is fuller than this fraction
+DEFAULT_MAX_QUEUE_FRACTION = 0.9
+
+_JSON_HEADERS = [(b"content-type", b"application/json"), (b"cache-control", b"no-store")]
+_LIVE_BODY = b'{"status":"alive"}'
+
+
+class HealthState:
+    """Cached readiness verdict, refreshed by the event loop monitor.
+
+    Every sample of the loop monitor re-evaluates readiness and pre-renders
+    the response body, so probes only copy bytes no matter how often an
+    orchestrator polls.
+    """
+
+    def __init__(
+        self,
+        loop_monitor: LoopLagMonitor,
+        session_manager=None,
+        admission=None,
+        max_loop_lag: float = DEFAULT_MAX_LOOP_LAG,
+        max_queue_fraction: float = DEFAULT_MAX_QUEUE_FRACTION,
+        stall_window: float = DEFAULT_STALL_WINDOW
+    ):
+        """Initialize the health state.
+
+        Args:
+            loop_monitor: Event loop lag monitor driving refreshes
+            session_manager: Session store to check (None in stateless mode)
+            admission: AdmissionController to check (None if disabled)
+            max_loop_lag: Lag in seconds above which the server is not ready
+            max_queue_fraction: Admission queue fill level above which the
+                server is not ready
+            stall_window: Seconds readiness keeps failing after a stall
+                longer than max_loop_lag
+        """
+        self.loop_monitor = loop_monitor
+        self.session_manager = session_manager
+        self.admission = admission
+        self.max_loop_lag = max_loop_lag
+        self.max_queue_fraction = max_queue_fraction
+        self.stall_window = stall_window
+
+        self.draining = False
+        self.ready = True
+        self.reasons: List[str] = []
+        self._ready_body = b""
+        loop_monitor.add_listener(self.refresh)
+        self.refresh()
+
+    def refresh(self):
+        """Re-evaluate readiness from cached component state."""
+        reasons = ["draining"] if self.draining else []
+        checks: Dict[str, Any] = {"loop_lag_ms": round(self.loop_monitor.lag * 1000, 3)}
+
+        if self.loop_monitor.lag > self.max_loop_lag:
+            reasons.append("event_loop_lag")
+
+        stall = self.loop_monitor.last_stall
+        if stall:
+            checks["loop_stalls"] = self.loop_monitor.stalls
+            checks["last_stall"] = {key: stall[key] for key in ("timestamp", "duration_ms", "tool")}
+            if (stall["duration_ms"] > self.max_loop_lag * 1000
+                    and time.time() - stall["timestamp"] < self.stall_window):
+                reasons.append("event_loop_blocked")
+
+        if self.session_manager is not None:
+            try:
+                store = self.session_manager.check_health()
+            except Exception as e:
+                store = {"reachable": False, "error": str(e)}
+            checks["session_store"] = store
+            if not store.get("reachable"):
+                reasons.append("session_store_unreachable")
+
+        if self.admission is not None:
+            depth = self.admission.queue_depth
+            checks["admission_queue_depth"] = depth
+            if depth > self.admission.max_queue * self.max_queue_fraction:
+                reasons.append("admission_queue_full")
+
+        self.ready = not reasons
+        self.reasons = reasons
+        self._ready_body = codec.dumps_bytes({
+            "status": "ready" if self.ready else "not_ready",
+            "reasons": reasons,
+            "checks": checks
+        })
+
+    def set_draining(self):
+        """Fail readiness from now on (graceful shutdown in progress)."""
+        self.draining = True
+        self.refresh()
+
+    def readiness_response(self):
+        """Return (status code, body) for the readiness route."""
+        return (200 if self.ready else 503), self._ready_body
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current readiness verdict."""
+        return {"ready": self.ready, "reasons": self.reasons}
+
+
+class HealthMiddleware:
+    """ASGI middleware answering health routes before any other processing.
+
+    Also starts the loop monitor with the application lifespan (or on the
+    first request if the host does not run lifespan events).
+    """
+
+    def __init__(self, app, health: HealthState):
+        self.app = app
+        self.health = health
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            self.health.loop_monitor.start()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                await self.health.loop_monitor.stop()
+            return
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.health.loop_monitor.running:
+            self.health.loop_monitor.start()
+
+        path = scope["path"]
+        if path in LIVE_PATHS:
+            await self._respond(scope, send, 200, _LIVE_BODY)
+        elif path == READY_PATH:
+            status, body = self.health.readiness_response()
+            await self._respond(scope, send, status, body)
+        else:
+            await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _respond(scope, send, status: int, body: bytes):
+        if scope["method"] not in ("GET", "HEAD"):
+            status, body = 405, b'{"error":"method not allowed"}'
+        headers = [*_JSON_HEADERS, (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
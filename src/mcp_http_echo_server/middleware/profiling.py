@@ -0,0 +1,77 @@
+"""HTTP route for on-demand profiling (``GET /debug/profile``).
+
+Query parameters: ``mode`` (sample/cprofile), ``duration`` (seconds),
+``interval_ms`` (sample mode), ``format`` (collapsed/top/pstats) and
+``limit``. The response is the rendered profile as plain text, e.g.::
+
+    curl -s 'http://localhost:3000/debug/profile?duration=10' > stacks.txt
+    flamegraph.pl stacks.txt > flame.svg
+
+The route sits outside admission control and rate limiting so that an
+overloaded server can still be profiled.
+"""
+
+import logging
+from urllib.parse import parse_qs
+
+from ..utils import codec
+from ..utils.profiler import DEFAULT_DURATION, DEFAULT_INTERVAL, DEFAULT_LIMIT, Profiler, ProfilerBusy
+
+logger = logging.getLogger(__name__)
+
+PROFILE_PATH = "/debug/profile"
+
+
+class ProfileRouteMiddleware:
+    """ASGI middleware answering the profiling route."""
+
+    def __init__(self, app, profiler: Profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != PROFILE_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await self._respond(send, 405, {"error": "method not allowed"})
+            return
+
+        query = {key: values[-1] for key, values in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()}
+        try:
+            result = await self.profiler.profile(
+                mode=query.get("mode", "sample"),
+                duration=float(query.get("duration", DEFAULT_DURATION)),
+                interval=float(query.get("interval_ms", DEFAULT_INTERVAL * 1000)) / 1000,
+                output=query.get("format"),
+                limit=int(query.get("limit", DEFAULT_LIMIT))
+            )
+        except ValueError as e:
+            await self._respond(send, 400, {"error": str(e)})
+            return
+        except ProfilerBusy as e:
+            await self._respond(send, 409, {"error": str(e)})
+            return
+
+        body = result["output"].encode()
+        summary = {key: value for key, value in result.items() if key != "output"}
+        headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"cache-control", b"no-store"),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-profile-summary", codec.dumps_bytes(summary)),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _respond(send, status: int, payload: dict):
+        body = codec.dumps_bytes(payload)
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"cache-control", b"no-store"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
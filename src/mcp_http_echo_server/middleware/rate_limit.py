@@ -0,0 +1,211 @@
+"""Per-session and per-principal token-bucket rate limiting."""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from ..utils.auth_context import get_scope_auth_context
+from ..utils.metrics import metrics
+from .common import buffer_request, get_header, send_jsonrpc_error
+
+logger = logging.getLogger(__name__)
+
+# Burst defaults to this multiple of the refill rate
+DEFAULT_BURST_FACTOR = 2.0
+
+# JSON-RPC server error returned with HTTP 429
+RATE_LIMITED_ERROR_CODE = -32001
+
+# How often idle buckets are swept (seconds)
+BUCKET_SWEEP_INTERVAL = 60
+
+
+class TokenBucket:
+    """A single token bucket (four slots, no per-instance dict)."""
+
+    __slots__ = ("tokens", "updated", "allowed", "throttled")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.allowed = 0
+        self.throttled = 0
+
+    def consume(self, rate: float, burst: float, now: float) -> float:
+        """Refill and try to take one token.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            now: Current monotonic time
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.allowed += 1
+            return 0.0
+
+        self.throttled += 1
+        return (1.0 - self.tokens) / rate
+
+    def is_full(self, rate: float, burst: float, now: float) -> bool:
+        """Check whether the bucket has refilled completely."""
+        return self.tokens + (now - self.updated) * rate >= burst
+
+
+class RateLimiter:
+    """A keyed collection of token buckets sharing one rate and burst."""
+
+    def __init__(self, name: str, rate: float, burst: Optional[float] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            name: Limiter name used in metrics ("session", "principal")
+            rate: Sustained requests per second per key
+            burst: Bucket capacity (default: rate * DEFAULT_BURST_FACTOR, at least 1)
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1.0, burst if burst else rate * DEFAULT_BURST_FACTOR)
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._last_sweep = time.monotonic()
+        self._throttled_total = 0
+        self._allowed_total = 0
+
+    def check(self, key: str, now: Optional[float] = None) -> float:
+        """Consume a token for a key.
+
+        Args:
+            key: Session ID or principal ID
+            now: Current monotonic time (default: time.monotonic())
+
+        Returns:
+            0.0 if allowed, otherwise seconds until the key may retry
+        """
+        if now is None:
+            now = time.monotonic()
+
+        if now - self._last_sweep > BUCKET_SWEEP_INTERVAL:
+            self.sweep(now)
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(self.burst, now)
+
+        retry_after = bucket.consume(self.rate, self.burst, now)
+        if retry_after:
+            self._throttled_total += 1
+            metrics.increment(f"rate_limit.throttled.{self.name}")
+        else:
+            self._allowed_total += 1
+            metrics.increment(f"rate_limit.allowed.{self.name}")
+        return retry_after
+
+    def remove(self, key: str):
+        """Drop the bucket for a key (e.g. when its session expires)."""
+        self.buckets.pop(key, None)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop buckets that have refilled completely.
+
+        A full bucket behaves exactly like a freshly created one, so it can
+        be discarded without changing any future decision.
+
+        Returns:
+            Number of buckets removed
+        """
+        if now is None:
+            now = time.monotonic()
+        self._last_sweep = now
+
+        idle = [key for key, bucket in self.buckets.items() if bucket.is_full(self.rate, self.burst, now)]
+        for key in idle:
+            del self.buckets[key]
+        return len(idle)
+
+    def describe(self, key: str) -> Optional[Dict[str, Any]]:
+        """Describe the bucket for a key, or None if it has none."""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return None
+        now = time.monotonic()
+        return {
+            "tokens_available": round(min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate), 2),
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "allowed": bucket.allowed,
+            "throttled": bucket.throttled
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "active_buckets": len(self.buckets),
+            "allowed": self._allowed_total,
+            "throttled": self._throttled_total
+        }
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing session and principal rate limits.
+
+    Throttled requests receive HTTP 429 with a ``Retry-After`` header and a
+    JSON-RPC error body.
+    """
+
+    def __init__(
+        self,
+        app,
+        session_limiter: Optional[RateLimiter] = None,
+        principal_limiter: Optional[RateLimiter] = None
+    ):
+        self.app = app
+        self.session_limiter = session_limiter
+        self.principal_limiter = principal_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        now = time.monotonic()
+        limited_by = None
+        retry_after = 0.0
+
+        if self.session_limiter:
+            session_id = get_header(scope, b"mcp-session-id")
+            if session_id:
+                retry_after = self.session_limiter.check(session_id, now)
+                if retry_after:
+                    limited_by = "session"
+
+        if not limited_by and self.principal_limiter:
+            # Shared with the tools of this request, so the token is decoded once
+            principal = get_scope_auth_context(scope).principal_id
+            if principal:
+                retry_after = self.principal_limiter.check(principal, now)
+                if retry_after:
+                    limited_by = "principal"
+
+        if limited_by:
+            _, message, receive = await buffer_request(scope, receive)
+            logger.debug(f"Rate limited request by {limited_by}, retry after {retry_after:.2f}s")
+            await send_jsonrpc_error(
+                send,
+                message,
+                status=429,
+                code=RATE_LIMITED_ERROR_CODE,
+                text="Rate limit exceeded",
+                data={"limited_by": limited_by, "retry_after": round(retry_after, 3)},
+                retry_after=retry_after
+            )
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,253 @@
+"""Traffic recording to a rotating JSONL file.
+
+Every MCP POST request is recorded with its response and timing as one
+JSON line, for replay with ``mcp-http-echo-replay``::
+
+    {"ts": 1760870000.123, "session": "...", "protocol_version": "2025-06-18",
+     "request": {...}, "status": 200, "response": {...}, "duration_ms": 2.4}
+
+``response`` is the JSON-RPC response (a list for batches, or when an SSE
+stream carried several messages such as progress notifications) and null
+for accepted notifications. The request path only captures raw bytes into
+an in-memory buffer; a background task parses, serializes and appends them
+in a worker thread, so requests never wait for disk I/O. When the buffer
+is full (the disk cannot keep up) new records are dropped and counted.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import anyio
+
+from ..utils import codec
+from ..utils.metrics import metrics
+from .common import buffer_request, get_header, parse_jsonrpc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_BACKUPS = 5
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Records kept in memory waiting for the writer
+DEFAULT_MAX_PENDING = 10000
+
+# Larger response bodies are recorded truncated (and unparsed)
+MAX_RECORDED_RESPONSE = 1024 * 1024
+
+# Captured request: (wall time, session, protocol version, request body,
+# status, content type, response chunks, truncated, duration in ms)
+Capture = Tuple[float, Optional[str], Optional[str], bytes, int, str, List[bytes], bool, float]
+
+
+def parse_response_body(content_type: str, body: bytes) -> Any:
+    """JSON-RPC message(s) of a JSON or SSE response body.
+
+    SSE bodies return the single message or a list of all data events.
+    """
+    if not body:
+        return None
+    if not content_type.startswith("text/event-stream"):
+        return parse_jsonrpc(body)
+    messages = []
+    for line in body.decode("utf-8", "replace").splitlines():
+        if line.startswith("data:"):
+            try:
+                messages.append(codec.loads(line[5:]))
+            except ValueError:
+                pass
+    return messages[0] if len(messages) == 1 else messages
+
+
+def rotate_files(path: str, backups: int):
+    """Shift path -> path.1 -> ... -> path.N, dropping the oldest."""
+    if backups <= 0:
+        os.remove(path)
+        return
+    for index in range(backups - 1, 0, -1):
+        source = f"{path}.{index}"
+        if os.path.exists(source):
+            os.replace(source, f"{path}.{index + 1}")
+    os.replace(path, f"{path}.1")
+
+
+class RecordingWriter:
+    """Buffers captured requests and appends them to a rotating JSONL file."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: JSONL file to append to
+            max_bytes: Rotate once the file exceeds this size (0 disables)
+            backups: Rotated files to keep (path.1 ... path.N)
+            flush_interval: Seconds between background writes
+            max_pending: Records buffered in memory before new ones are dropped
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: List[Capture] = []
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._closed = False
+        self._stats = {"recorded": 0, "written": 0, "dropped": 0, "bytes_written": 0, "rotations": 0, "write_errors": 0}
+
+    def record(self, capture: Capture):
+        """Queue one captured request (called on the event loop)."""
+        if self._closed or len(self._pending) >= self.max_pending:
+            self._stats["dropped"] += 1
+            metrics.increment("recording.dropped")
+            return
+        self._pending.append(capture)
+        self._stats["recorded"] += 1
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """Flush the buffer every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """Write everything buffered so far (in a worker thread)."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            try:
+                await anyio.to_thread.run_sync(self._write, batch)
+            except Exception as e:
+                self._stats["write_errors"] += 1
+                logger.error(f"Failed to write {len(batch)} recorded requests to {self.path}: {e}")
+
+    async def close(self):
+        """Stop the background task and write the remaining records."""
+        self._closed = True
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    @staticmethod
+    def to_record(capture: Capture) -> Dict[str, Any]:
+        """Build the JSONL record of a captured request."""
+        ts, session, protocol_version, body, status, content_type, chunks, truncated, duration_ms = capture
+        response_body = b"".join(chunks)
+        record = {
+            "ts": round(ts, 6),
+            "session": session,
+            "protocol_version": protocol_version,
+            "request": parse_jsonrpc(body),
+            "status": status,
+            "response": None if truncated else parse_response_body(content_type, response_body),
+            "duration_ms": round(duration_ms, 3),
+        }
+        if truncated:
+            record["response_truncated"] = True
+        return record
+
+    def _write(self, batch: List[Capture]):
+        """Serialize and append a batch, rotating the file as needed."""
+        lines = [codec.dumps_bytes(self.to_record(capture)) + b"\n" for capture in batch]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        f = open(self.path, "ab")
+        try:
+            size = f.tell()
+            for line in lines:
+                if self.max_bytes and size and size + len(line) > self.max_bytes:
+                    # Rotate between records so every file stays valid JSONL
+                    f.close()
+                    rotate_files(self.path, self.backups)
+                    self._stats["rotations"] += 1
+                    f = open(self.path, "ab")
+                    size = 0
+                f.write(line)
+                size += len(line)
+                self._stats["written"] += 1
+                self._stats["bytes_written"] += len(line)
+        finally:
+            f.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recording statistics."""
+        return {"path": self.path, "pending": len(self._pending), **self._stats}
+
+
+class RecordingMiddleware:
+    """ASGI middleware capturing MCP POST requests for the RecordingWriter."""
+
+    def __init__(self, app, writer: RecordingWriter, max_response_bytes: int = MAX_RECORDED_RESPONSE):
+        self.app = app
+        self.writer = writer
+        self.max_response_bytes = max_response_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        body, _, receive = await buffer_request(scope, receive)
+        ts = time.time()
+        start = time.perf_counter()
+        session = get_header(scope, b"mcp-session-id")
+        status = 0
+        content_type = ""
+        chunks: List[bytes] = []
+        size = 0
+        truncated = False
+        max_bytes = self.max_response_bytes
+
+        async def capture(message):
+            nonlocal status, content_type, session, size, truncated
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", []):
+                    name = name.lower()
+                    if name == b"content-type":
+                        content_type = value.decode("latin-1")
+                    elif name == b"mcp-session-id" and not session:
+                        session = value.decode("latin-1")
+            elif message["type"] == "http.response.body" and not truncated:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > max_bytes:
+                    truncated = True
+                    chunks.clear()
+                elif chunk:
+                    chunks.append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            self.writer.record((
+                ts,
+                session,
+                get_header(scope, b"mcp-protocol-version"),
+                body,
+                status,
+                content_type,
+                chunks,
+                truncated,
+                (time.perf_counter() - start) * 1000
+            ))
@@ -0,0 +1,329 @@
+"""Replay recorded MCP traffic (``mcp-http-echo-replay``).
+
+Re-drives a recording made with ``--record`` against a server. Requests of
+one recorded session are sent in their original order on one replay
+session (the recorded initialize opens it; a session recorded without one
+gets a fresh initialize first), while sessions and stateless requests run
+concurrently. ``--speed 1`` keeps the recorded timing, ``--speed 10``
+replays ten times faster and ``--speed 0`` sends as fast as ordering
+allows. The report shows, per method/tool, the recorded server-side
+duration next to the client-observed replay latency (the two are not the
+same measurement, so no difference is computed) and counts status and
+outcome mismatches.
+
+Usage:
+    mcp-http-echo-replay recording.jsonl.1 recording.jsonl --url http://127.0.0.1:3000/mcp --speed 0
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .bench import DEFAULT_URL, HEADERS, PROTOCOL_VERSION, latency_summary, parse_response
+
+
+def load_records(paths: List[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Read recordings (e.g. rotated files) and return records by timestamp."""
+    records = []
+    for path in paths:
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record.get("request") is not None:
+                    records.append(record)
+    records.sort(key=lambda record: record["ts"])
+    return records[:limit] if limit else records
+
+
+def request_key(request: Any) -> str:
+    """Report key of a request: JSON-RPC method, tools/call:<tool> or batch."""
+    if isinstance(request, list):
+        return "batch"
+    if not isinstance(request, dict):
+        return "invalid"
+    method = request.get("method", "?")
+    if method == "tools/call":
+        return f"tools/call:{(request.get('params') or {}).get('name')}"
+    return method
+
+
+def outcome(request: Any, response: Any) -> str:
+    """Coarse outcome of a response, comparable between recording and replay."""
+    if isinstance(request, list):
+        return "batch"
+    if isinstance(response, list):
+        response = response[-1] if response else None
+    if not isinstance(response, dict):
+        return "none"
+    if "error" in response:
+        return f"error:{response['error'].get('code')}"
+    result = response.get("result")
+    if isinstance(result, dict) and result.get("isError"):
+        return "tool_error"
+    return "ok"
+
+
+def group_records(records: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Split records into ordered units: one per session, one per sessionless request."""
+    sessions: Dict[str, List[Dict[str, Any]]] = {}
+    units = []
+    for record in records:
+        session = record.get("session")
+        if session is None:
+            units.append([record])
+        elif session in sessions:
+            sessions[session].append(record)
+        else:
+            sessions[session] = [record]
+            units.append(sessions[session])
+    return units
+
+
+def is_initialize(record: Dict[str, Any]) -> bool:
+    request = record["request"]
+    return isinstance(request, dict) and request.get("method") == "initialize"
+
+
+class Replay:
+    """Replays grouped records and collects per-key results."""
+
+    def __init__(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str], speed: float, start_ts: float):
+        self.client = client
+        self.url = url
+        self.headers = headers
+        self.speed = speed
+        self.start_ts = start_ts
+        self.started = 0.0
+        self.recorded: Dict[str, List[float]] = defaultdict(list)
+        self.replayed: Dict[str, List[float]] = defaultdict(list)
+        self.status_mismatches: Dict[str, int] = defaultdict(int)
+        self.outcome_mismatches: Dict[str, int] = defaultdict(int)
+        self.transport_errors: Dict[str, int] = defaultdict(int)
+        self.examples: List[Dict[str, Any]] = []
+
+    async def wait_for(self, record: Dict[str, Any]):
+        """Sleep until the record's (scaled) time in the replay."""
+        if self.speed <= 0:
+            return
+        due = self.started + (record["ts"] - self.start_ts) / self.speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def send(self, record: Dict[str, Any], headers: Dict[str, str]) -> Optional[httpx.Response]:
+        """Send one recorded request and compare it with the recording."""
+        request = record["request"]
+        key = request_key(request)
+        headers = dict(headers)
+        headers["mcp-protocol-version"] = record.get("protocol_version") or PROTOCOL_VERSION
+        start = time.perf_counter()
+        try:
+            response = await self.client.post(self.url, headers=headers, json=request)
+        except httpx.HTTPError as e:
+            self.transport_errors[key] += 1
+            self.examples.append({"key": key, "error": type(e).__name__})
+            return None
+        self.replayed[key].append((time.perf_counter() - start) * 1000)
+        self.recorded[key].append(record["duration_ms"])
+
+        if response.status_code != record["status"]:
+            self.status_mismatches[key] += 1
+            if len(self.examples) < 20:
+                self.examples.append({"key": key, "recorded_status": record["status"], "status": response.status_code})
+            return response
+        if record.get("response_truncated"):
+            return response
+        try:
+            replayed = parse_response(response)
+        except ValueError:
+            replayed = None
+        expected, actual = outcome(request, record.get("response")), outcome(request, replayed)
+        if expected != actual:
+            self.outcome_mismatches[key] += 1
+            if len(self.examples) < 20:
+                self.examples.append({"key": key, "recorded": expected, "replayed": actual})
+        return response
+
+    async def run_unit(self, unit: List[Dict[str, Any]], limiter: asyncio.Semaphore):
+        """Replay one session (or one sessionless request) in order.
+
+        ``limiter`` bounds requests in flight; it is taken per request after
+        the scheduled wait, so sessions idling between records don't hold it.
+        """
+        headers = dict(self.headers)
+        if unit[0].get("session") and not is_initialize(unit[0]):
+            async with limiter:
+                await self.open_session(headers)
+        for record in unit:
+            await self.wait_for(record)
+            async with limiter:
+                response = await self.send(record, headers)
+            if response is not None and is_initialize(record) and response.headers.get("mcp-session-id"):
+                headers["mcp-session-id"] = response.headers["mcp-session-id"]
+        if "mcp-session-id" in headers:
+            async with limiter:
+                try:
+                    await self.client.delete(self.url, headers=headers)
+                except httpx.HTTPError:
+                    pass
+
+    async def open_session(self, headers: Dict[str, str]):
+        """Initialize a session for records captured after their initialize."""
+        response = await self.client.post(self.url, headers=headers, json={
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "mcp-http-echo-replay", "version": "1.0.0"}
+            }
+        })
+        if response.headers.get("mcp-session-id"):
+            headers["mcp-session-id"] = response.headers["mcp-session-id"]
+        await self.client.post(self.url, headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    def report(self, elapsed: float, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Latencies and mismatch counts per key.
+
+        ``recorded_server`` is the server-side duration from the recording
+        (time spent in the app) and ``replay_client`` the latency the replay
+        client observed (including connection and transfer time). They are
+        reported side by side rather than subtracted.
+        """
+        keys = sorted(set(self.recorded) | set(self.transport_errors))
+        per_key = {}
+        for key in keys:
+            replayed = latency_summary(self.replayed.get(key, ()))
+            per_key[key] = {
+                "count": replayed.get("count", 0),
+                "recorded_server": latency_summary(self.recorded.get(key, ())),
+                "replay_client": replayed,
+                "status_mismatches": self.status_mismatches.get(key, 0),
+                "outcome_mismatches": self.outcome_mismatches.get(key, 0),
+                "transport_errors": self.transport_errors.get(key, 0),
+            }
+        span = records[-1]["ts"] - records[0]["ts"] if records else 0
+        return {
+            "url": self.url,
+            "speed": self.speed or "max",
+            "records": len(records),
+            "recorded_span_s": round(span, 3),
+            "elapsed_s": round(elapsed, 3),
+            "status_mismatches": sum(self.status_mismatches.values()),
+            "outcome_mismatches": sum(self.outcome_mismatches.values()),
+            "transport_errors": sum(self.transport_errors.values()),
+            "keys": per_key,
+            "examples": self.examples,
+        }
+
+
+async def run_replay(args) -> Dict[str, Any]:
+    """Replay the recordings described by parsed CLI arguments."""
+    records = load_records(args.recordings, args.limit)
+    if not records:
+        raise ValueError("No replayable records found")
+    headers = dict(HEADERS)
+    for header in args.header or []:
+        name, _, value = header.partition(":")
+        headers[name.strip()] = value.strip()
+
+    units = group_records(records)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    transport = httpx.AsyncHTTPTransport(uds=args.uds, limits=limits)
+    async with httpx.AsyncClient(transport=transport, timeout=args.timeout) as client:
+        replay = Replay(client, args.url, headers, args.speed, records[0]["ts"])
+        limiter = asyncio.Semaphore(args.concurrency)
+        replay.started = time.perf_counter()
+        await asyncio.gather(*(replay.run_unit(unit, limiter) for unit in units))
+        elapsed = time.perf_counter() - replay.started
+    return replay.report(elapsed, records)
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """Render a replay report as a text table."""
+    lines = [
+        f"url={result['url']} speed={result['speed']} records={result['records']}",
+        f"recorded span={result['recorded_span_s']}s replay elapsed={result['elapsed_s']}s "
+        f"status mismatches={result['status_mismatches']} outcome mismatches={result['outcome_mismatches']} "
+        f"transport errors={result['transport_errors']}",
+        "",
+        f"{'method/tool':<32} {'count':>6} {'srv p50':>8} {'srv p99':>8} {'p50':>8} {'p99':>8} {'mism':>5}",
+        "-" * 83,
+    ]
+    for key, entry in result["keys"].items():
+        recorded, replayed = entry["recorded_server"], entry["replay_client"]
+        mismatches = entry["status_mismatches"] + entry["outcome_mismatches"] + entry["transport_errors"]
+        if not replayed.get("count"):
+            lines.append(f"{key:<32} {0:>6} {'':>8} {'':>8} {'':>8} {'':>8} {mismatches:>5}")
+            continue
+        lines.append(
+            f"{key:<32} {entry['count']:>6} {recorded['p50_ms']:>8.2f} {recorded['p99_ms']:>8.2f} "
+            f"{replayed['p50_ms']:>8.2f} {replayed['p99_ms']:>8.2f} {mismatches:>5}"
+        )
+    lines.append("")
+    lines.append("latencies in ms; srv = recorded server-side duration, p50/p99 = replay client latency")
+    for example in result["examples"][:10]:
+        lines.append(f"  {example}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for mcp-http-echo-replay."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-http-echo-replay",
+        description="Replay a --record JSONL recording against an MCP server and report latencies"
+    )
+    parser.add_argument("recordings", nargs="+", help="Recording files (rotated files may be given together)")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"MCP endpoint (default: {DEFAULT_URL})")
+    parser.add_argument("--uds", metavar="PATH", help="Connect through a Unix domain socket")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Time scale: 1 = recorded timing, 10 = ten times faster, 0 = as fast as possible (default: 1)"
+    )
+    parser.add_argument("--concurrency", "-c", type=int, default=64, help="Requests in flight at once (default: 64)")
+    parser.add_argument("--limit", type=int, help="Replay only the first N records")
+    parser.add_argument("--header", "-H", action="append", metavar="NAME: VALUE", help="Extra request header (repeatable)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", "-o", metavar="PATH", help="Also write the JSON results to a file")
+    args = parser.parse_args(argv)
+
+    if args.speed < 0:
+        parser.error("--speed must not be negative")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        result = asyncio.run(run_replay(args))
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_report(result))
+    if result["status_mismatches"] or result["outcome_mismatches"] or result["transport_errors"]:
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,68 @@
 
 import os
 import logging
+from functools import partial
 from typing import Optional
+
+import anyio
 from fastmcp import FastMCP
 
 from .session_manager import SessionManager
+from .middleware.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_QUEUE,
+    DEFAULT_MAX_WAIT,
+)
+from .middleware.batch import BatchMiddleware, DEFAULT_BATCH_CONCURRENCY
+from .middleware.compression import (
+    CompressionMiddleware,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_MINIMUM_SIZE,
+)
+from .middleware.drain import (
+    DrainController,
+    DrainMiddleware,
+    DEFAULT_DRAIN_DELAY,
+    DEFAULT_DRAIN_TIMEOUT,
+    STREAM_CLOSE_TIMEOUT,
+)
+from .middleware.faults import FaultInjectionMiddleware, FaultInjector, parse_fault_spec
+from .middleware.health import HealthMiddleware, HealthState
+from .middleware.profiling import ProfileRouteMiddleware
+from .middleware.rate_limit import RateLimiter, RateLimitMiddleware
+from .middleware.recording import (
+    RecordingMiddleware,
+    RecordingWriter,
+    DEFAULT_BACKUPS as DEFAULT_RECORD_BACKUPS,
+    DEFAULT_MAX_BYTES as DEFAULT_RECORD_MAX_BYTES,
+)
+from .utils import codec
+from .utils.auth_context import AUTH_CONTEXT_KEY, AuthContext, get_scope_auth_context
+from .utils.jwt_decoder import jwt_cache
+from .utils.jwt_verify import jwt_verifier
+from .utils.listeners import describe_listener, socket_from_fd
+from .utils.loop_monitor import DEFAULT_SLOW_CALLBACK_THRESHOLD, LoopLagMonitor
+from .utils.memory_snapshots import MemorySnapshots
+from .utils.metrics import metrics
+from .utils.profiler import Profiler
 from .utils.state_adapter import StateAdapter
+from .utils.transport_tuning import (
+    DEFAULT_BACKLOG,
+    DEFAULT_KEEP_ALIVE_TIMEOUT,
+    build_uvicorn_config,
+    get_loop_factory,
+    resolve_http_parser,
+    resolve_loop,
+)
 from .tools.echo_tools import register_echo_tools
 from .tools.debug_tools import register_debug_tools
 from .tools.auth_tools import register_auth_tools
 from .tools.system_tools import register_system_tools
 from .tools.state_tools import register_state_tools
+from .tools.admin_tools import register_admin_tools
+from .tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +81,27 @@ class MCPEchoServer:
         session_timeout: int = 3600,
         debug: bool = False,
         supported_versions: Optional[list[str]] = None,
-        adaptive_mode: bool = False
+        adaptive_mode: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        admission_queue: int = DEFAULT_MAX_QUEUE,
+        admission_timeout: float = DEFAULT_MAX_WAIT,
+        rate_limit: float = 0,
+        rate_burst: Optional[float] = None,
+        principal_rate_limit: float = 0,
+        principal_rate_burst: Optional[float] = None,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        compression_min_size: int = DEFAULT_MINIMUM_SIZE,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        drain_delay: float = DEFAULT_DRAIN_DELAY,
+        slow_callback_threshold: float = DEFAULT_SLOW_CALLBACK_THRESHOLD,
+        jwks_file: Optional[str] = None,
+        fault_injection: bool = False,
+        faults: Optional[str] = None,
+        record_file: Optional[str] = None,
+        record_max_bytes: int = DEFAULT_RECORD_MAX_BYTES,
+        record_backups: int = DEFAULT_RECORD_BACKUPS,
+        profiling: bool = False
     ):
         """Initialize the MCP Echo Server.
         
@@ -39,53 +111,132 @@ class MCPEchoServer:
             debug: Enable debug logging
             supported_versions: List of supported protocol versions
             adaptive_mode: Enable adaptive mode (auto-detect per request)
+            max_in_flight: Maximum concurrent HTTP requests (0 disables admission control)
+            admission_queue: Maximum number of requests waiting for a slot
+            admission_timeout: Maximum seconds a request may wait before being shed
+            rate_limit: Requests per second per session (0 disables)
+            rate_burst: Per-session burst size (default: 2x rate_limit)
+            principal_rate_limit: Requests per second per JWT subject/user (0 disables)
+            principal_rate_burst: Per-principal burst size (default: 2x principal_rate_limit)
+            compression_level: zlib level for gzip/deflate responses (0 disables compression)
+            compression_min_size: Responses smaller than this many bytes are not compressed
+            batch_concurrency: Concurrent entries per JSON-RPC batch (0 disables batch support)
+            drain_timeout: Max seconds to wait for in-flight requests after SIGTERM
+            drain_delay: Min seconds to keep serving (readiness failing) after SIGTERM
+            slow_callback_threshold: Seconds the event loop may be blocked before
+                the stall is recorded and attributed to the running tool (0 disables)
+            jwks_file: JWKS file with keys for JWT signature verification
+                (default: MCP_JWKS_FILE)
+            fault_injection: Enable the fault injection middleware, the
+                X-MCP-Fault header and the faultInjection tool
+            faults: Initial fault rules (implies fault_injection)
+            record_file: Record requests and responses to this JSONL file
+            record_max_bytes: Rotate the recording once it exceeds this size
+            record_backups: Rotated recording files to keep
+            profiling: Enable the profileServer and memorySnapshot tools and
+                the /debug/profile route
         """
         self.stateless_mode = stateless_mode
         self.adaptive_mode = adaptive_mode
         self.debug = debug
         self.supported_versions = supported_versions or [self.PROTOCOL_VERSION]
         self.session_timeout = session_timeout
+        self.compression_level = compression_level
+        self.compression_min_size = compression_min_size
+        self.batch_concurrency = batch_concurrency
         
-        # Create FastMCP instance
-        if adaptive_mode:
-            mode_desc = "adaptive (auto-detect)"
-            mode_info = "ADAPTIVE - Automatically detects stateful/stateless based on client behavior"
-        elif stateless_mode:
-            mode_desc = "stateless"
-            mode_info = "STATELESS - No session persistence"
-        else:
-            mode_desc = "stateful"
-            mode_info = "STATEFUL - Full session management"
-        
+        # Create FastMCP instance (instructions are set once tools are registered)
         self.mcp = FastMCP(
             name=self.SERVER_NAME,
             version=self.SERVER_VERSION,
-            instructions=f"""A {mode_desc} MCP echo server with 21 comprehensive debugging tools.
-            
-Mode: {mode_info}
-Protocol: {', '.join(self.supported_versions)}
-            
-Available tool categories:
-- Echo Tools: echo, replayLastEcho
-- Debug Tools: printHeader, requestTiming, corsAnalysis, environmentDump
-- Auth Tools: bearerDecode, authContext, whoIStheGOAT
-- System Tools: healthProbe, sessionInfo
-- State Tools: stateInspector, sessionHistory, stateManipulator, sessionCompare, 
-               sessionTransfer, stateBenchmark, sessionLifecycle, stateValidator,
-               requestTracer, modeDetector"""
+            tool_serializer=codec.tool_serializer()
         )
         
+        # Tool metadata, filled in from the registered tools
+        self.tool_registry = ToolRegistry()
+        
         # Initialize session manager (always available for adaptive mode)
         # In adaptive mode, we need the session manager ready for stateful clients
         self.session_manager = SessionManager(session_timeout) if (not stateless_mode or adaptive_mode) else None
         
+        # Admission control for the HTTP transport
+        self.admission = None
+        if max_in_flight > 0:
+            self.admission = AdmissionController(
+                max_in_flight=max_in_flight,
+                max_queue=admission_queue,
+                max_wait=admission_timeout
+            )
+            metrics.register_collector("admission", self.admission.get_stats)
+        
+        # Token-bucket rate limiting per session and per principal
+        self.session_limiter = RateLimiter("session", rate_limit, rate_burst) if rate_limit > 0 else None
+        self.principal_limiter = (
+            RateLimiter("principal", principal_rate_limit, principal_rate_burst)
+            if principal_rate_limit > 0 else None
+        )
+        if self.session_limiter and self.session_manager:
+            # Session buckets expire together with their sessions
+            self.session_manager.add_removal_listener(self.session_limiter.remove)
+        if self.session_limiter or self.principal_limiter:
+            metrics.register_collector("rate_limit", self._get_rate_limit_stats)
+        
+        # Event loop lag sampling and cached readiness for /health/ready
+        self.loop_monitor = LoopLagMonitor(slow_callback_threshold=slow_callback_threshold)
+        self.health = HealthState(
+            self.loop_monitor,
+            session_manager=self.session_manager,
+            admission=self.admission
+        )
+        metrics.register_collector("event_loop", self.loop_monitor.get_stats)
+        metrics.register_collector("readiness", self.health.get_stats)
+        
+        # Graceful drain on SIGTERM
+        self.drain = DrainController(drain_timeout, drain_delay, health=self.health)
+        if self.session_manager:
+            self.drain.add_shutdown_hook(self.session_manager.stop_cleanup_task)
+        metrics.register_collector("drain", self.drain.get_stats)
+        
+        # Decoded bearer tokens and verification results are cached process-wide
+        if jwks_file:
+            jwt_verifier.set_jwks_file(jwks_file)
+        metrics.register_collector("jwt_cache", jwt_cache.get_stats)
+        metrics.register_collector("jwt_verify", jwt_verifier.get_stats)
+        
+        # Chaos testing; the middleware is only installed when enabled
+        self.fault_injector = None
+        if fault_injection or faults:
+            self.fault_injector = FaultInjector(parse_fault_spec(faults or ""))
+            metrics.register_collector("faults", self.fault_injector.get_stats)
+            logger.warning(f"Fault injection enabled: {self.fault_injector.describe_rules() or 'no rules yet'}")
+        
+        # Traffic recording for replay, written in the background
+        self.recorder = None
+        if record_file:
+            self.recorder = RecordingWriter(record_file, max_bytes=record_max_bytes, backups=record_backups)
+            self.drain.add_shutdown_hook(self.recorder.close)
+            metrics.register_collector("recording", self.recorder.get_stats)
+        
+        # On-demand CPU profiling and allocation tracing
+        self.profiler = None
+        self.memory_snapshots = None
+        if profiling:
+            self.profiler = Profiler()
+            self.memory_snapshots = MemorySnapshots()
+            metrics.register_collector("profiler", self.profiler.get_stats)
+            metrics.register_collector("tracemalloc", self.memory_snapshots.get_stats)
+        
         # Register middleware
         self._register_middleware()
         
         # Register all tools
         self._register_tools()
+        self.tool_registry.load(self.mcp)
+        self.mcp.instructions = self._build_instructions()
+        self._install_tools_list_cache()
         
         if debug:
+            logger.info(f"Registered {self.tool_registry.total} tools")
             if adaptive_mode:
                 logger.info("MCP Echo Server initialized in ADAPTIVE mode")
             else:
@@ -97,6 +248,7 @@ Available tool categories:
     def _register_middleware(self):
         """Register middleware for request processing."""
         from fastmcp.server.middleware import Middleware
+        from fastmcp.server.dependencies import get_http_headers, get_http_request
         import time
         import uuid
         
@@ -162,6 +314,19 @@ Available tool categories:
                     if hasattr(fc, "_request") and hasattr(fc._request, "headers"):
                         headers = dict(fc._request.headers)
                         fc.set_state("request_headers", headers)
+                    else:
+                        # Current FastMCP exposes the HTTP request via dependencies
+                        headers = get_http_headers(include_all=True)
+                        if headers:
+                            fc.set_state("request_headers", headers)
+                    
+                    # Lazily computed auth context, shared with the ASGI
+                    # middleware (rate limiting) through the request scope
+                    try:
+                        auth_context = get_scope_auth_context(get_http_request().scope)
+                    except RuntimeError:
+                        auth_context = AuthContext(fc.get_state("request_headers") or {})
+                    fc.set_state(AUTH_CONTEXT_KEY, auth_context)
                 
                     # Check if we should use stateful mode for this request
                     is_stateless = fc.get_state("stateless_mode")
@@ -249,6 +414,11 @@ Available tool categories:
                     await self.server._track_response(ctx.fastmcp_context, result)
                 
                 return result
+            
+            async def on_call_tool(self, ctx, call_next):
+                """Attribute event loop stalls to the executing tool."""
+                with self.server.loop_monitor.track_tool(ctx.message.name):
+                    return await call_next(ctx)
         
         # Create error handling middleware class
         class ErrorHandlingMiddleware(Middleware):
@@ -338,19 +508,140 @@ Available tool categories:
         register_echo_tools(self.mcp, is_stateless_init)
         register_debug_tools(self.mcp, is_stateless_init)
         register_auth_tools(self.mcp, is_stateless_init)
-        register_system_tools(self.mcp, is_stateless_init, self.session_manager)
+        register_system_tools(
+            self.mcp,
+            is_stateless_init,
+            self.session_manager,
+            session_limiter=self.session_limiter,
+            principal_limiter=self.principal_limiter,
+            tool_registry=self.tool_registry
+        )
         register_state_tools(self.mcp, is_stateless_init)
+        register_admin_tools(
+            self.mcp,
+            is_stateless_init,
+            fault_injector=self.fault_injector,
+            profiler=self.profiler,
+            memory_snapshots=self.memory_snapshots
+        )
+    
+    def _build_instructions(self) -> str:
+        """Build the server instructions from the tool registry."""
+        if self.adaptive_mode:
+            mode_desc = "adaptive (auto-detect)"
+            mode_info = "ADAPTIVE - Automatically detects stateful/stateless based on client behavior"
+        elif self.stateless_mode:
+            mode_desc = "stateless"
+            mode_info = "STATELESS - No session persistence"
+        else:
+            mode_desc = "stateful"
+            mode_info = "STATEFUL - Full session management"
         
-        if self.debug:
-            # Count registered tools
-            tool_count = len(self.mcp._tool_manager._tools) if hasattr(self.mcp, "_tool_manager") else 0
-            logger.info(f"Registered {tool_count} tools")
+        return f"""A {mode_desc} MCP echo server with {self.tool_registry.total} comprehensive debugging tools.
+            
+Mode: {mode_info}
+Protocol: {', '.join(self.supported_versions)}
+            
+Available tool categories:
+{self.tool_registry.describe_categories()}"""
+    
+    def _install_tools_list_cache(self):
+        """Serve tools/list from a payload converted once instead of per request.
+        
+        FastMCP converts every tool to its MCP definition on each tools/list.
+        The middleware chain still runs (session tracking), only the
+        conversion is cached; it is redone if the set of tools changes.
+        
+        FastMCP has no public hook for this, so the handler mirrors
+        ``FastMCP._list_tools_mcp``; pyproject.toml pins the FastMCP minor
+        versions this was checked against.
+        """
+        from fastmcp.server.context import Context
+        
+        mcp = self.mcp
+        registry = self.tool_registry
+        
+        async def list_tools():
+            async with Context(fastmcp=mcp):
+                tools = await mcp._list_tools_middleware()
+                return registry.get_tools_list(tools, mcp.include_fastmcp_meta)
+        
+        mcp._mcp_server.list_tools()(list_tools)
+    
+    def _get_rate_limit_stats(self) -> dict:
+        """Collect rate limiter statistics for metrics."""
+        stats = {}
+        if self.session_limiter:
+            stats["session"] = self.session_limiter.get_stats()
+        if self.principal_limiter:
+            stats["principal"] = self.principal_limiter.get_stats()
+        return stats
+    
+    def _build_http_middleware(self) -> list:
+        """Build the ASGI middleware stack for HTTP transports."""
+        from starlette.middleware import Middleware as ASGIMiddleware
+        
+        # Outermost first: answer health probes (and the profiling route) before anything else, track
+        # in-flight requests for graceful drain, inject faults on the wire bytes, compress the final
+        # (possibly batched) response, record it uncompressed, then split batches so every entry passes
+        # rate limiting and admission
+        middleware = [
+            ASGIMiddleware(HealthMiddleware, health=self.health),
+            ASGIMiddleware(DrainMiddleware, controller=self.drain),
+        ]
+        if self.profiler:
+            middleware.insert(1, ASGIMiddleware(ProfileRouteMiddleware, profiler=self.profiler))
+        if self.fault_injector:
+            middleware.append(ASGIMiddleware(FaultInjectionMiddleware, injector=self.fault_injector))
+        if self.compression_level > 0:
+            middleware.append(ASGIMiddleware(
+                CompressionMiddleware,
+                minimum_size=self.compression_min_size,
+                level=self.compression_level
+            ))
+        if self.recorder:
+            middleware.append(ASGIMiddleware(RecordingMiddleware, writer=self.recorder))
+        if self.batch_concurrency > 0:
+            middleware.append(ASGIMiddleware(
+                BatchMiddleware,
+                max_concurrency=self.batch_concurrency,
+                stateless_mode=self.stateless_mode,
+                adaptive_mode=self.adaptive_mode
+            ))
+        if self.session_limiter or self.principal_limiter:
+            middleware.append(ASGIMiddleware(
+                RateLimitMiddleware,
+                session_limiter=self.session_limiter,
+                principal_limiter=self.principal_limiter
+            ))
+        if self.admission:
+            middleware.append(ASGIMiddleware(AdmissionMiddleware, controller=self.admission))
+        return middleware
+    
+    def http_app(self, **kwargs):
+        """Build the Starlette app for the HTTP transport with our middleware.
+        
+        Args:
+            **kwargs: Additional options passed to FastMCP.http_app
+            
+        Returns:
+            ASGI application
+        """
+        kwargs.setdefault("stateless_http", self.stateless_mode)
+        return self.mcp.http_app(middleware=self._build_http_middleware(), **kwargs)
     
     def run(
         self,
         host: str = "0.0.0.0",
         port: int = 3000,
         transport: str = "http",
+        loop: str = "auto",
+        http_parser: str = "auto",
+        backlog: int = DEFAULT_BACKLOG,
+        keep_alive_timeout: int = DEFAULT_KEEP_ALIVE_TIMEOUT,
+        limit_concurrency: int = 0,
+        uds: Optional[str] = None,
+        fd: Optional[int] = None,
         **kwargs
     ):
         """Run the MCP server.
@@ -359,37 +650,126 @@ Available tool categories:
             host: Host to bind to
             port: Port to bind to
             transport: Transport type (http, stdio, sse)
+            loop: Event loop implementation (auto, asyncio, uvloop)
+            http_parser: HTTP protocol implementation (auto, h11, httptools)
+            backlog: Listen socket backlog (HTTP transports)
+            keep_alive_timeout: Idle keep-alive timeout in seconds (HTTP transports)
+            limit_concurrency: Max concurrent connections before uvicorn
+                answers 503, 0 for unlimited (HTTP transports)
+            uds: Unix domain socket path to listen on instead of host/port
+                (HTTP transports)
+            fd: Inherited listening socket file descriptor to serve on
+                instead of host/port (HTTP transports)
             **kwargs: Additional transport-specific options
+        
+        Raises:
+            ValueError: If both uds and fd are given, or either with stdio
         """
+        if uds and fd is not None:
+            raise ValueError("Listen on either a Unix socket path or a file descriptor, not both")
+        if (uds or fd is not None) and transport == "stdio":
+            raise ValueError("Unix socket and file descriptor listeners require an HTTP transport")
+        
         if self.adaptive_mode:
             mode_str = "ADAPTIVE"
         else:
             mode_str = "STATELESS" if self.stateless_mode else "STATEFUL"
         logger.info(
-            "Starting %s in %s mode on %s:%d with %s transport",
+            "Starting %s in %s mode on %s with %s transport",
             self.SERVER_NAME,
             mode_str,
-            host,
-            port,
+            describe_listener(host, port, uds, fd),
             transport
         )
         
+        resolved_loop = resolve_loop(loop)
+        
         # Configure transport options
-        transport_options = {
-            "host": host,
-            "port": port,
-            **kwargs
-        }
+        transport_options = dict(kwargs)
+        if transport != "stdio":
+            transport_options.update(host=host, port=port)
         
         # For HTTP transport, set stateless mode
         if transport == "http":
             transport_options["stateless_http"] = self.stateless_mode
         
-        # Run the server
-        self.mcp.run(
+        # ASGI middleware and uvicorn tuning apply to both HTTP-based transports
+        if transport in ("http", "sse"):
+            transport_options["middleware"] = self._build_http_middleware()
+            uvicorn_config = build_uvicorn_config(
+                resolve_http_parser(http_parser),
+                backlog=backlog,
+                keep_alive_timeout=keep_alive_timeout,
+                limit_concurrency=limit_concurrency,
+                graceful_shutdown_timeout=STREAM_CLOSE_TIMEOUT
+            )
+            if uds:
+                uvicorn_config["uds"] = uds
+                # Runs before uvicorn re-raises SIGTERM/SIGINT on exit
+                self.drain.add_shutdown_hook(partial(self._remove_socket_file, uds))
+            uvicorn_config.update(transport_options.pop("uvicorn_config", {}))
+            transport_options["uvicorn_config"] = uvicorn_config
+            logger.info(
+                "Transport tuning: loop=%s http=%s backlog=%d keep_alive=%ds limit_concurrency=%s",
+                resolved_loop,
+                uvicorn_config["http"],
+                backlog,
+                keep_alive_timeout,
+                limit_concurrency or "unlimited"
+            )
+        
+        if fd is not None:
+            # uvicorn's own fd option assumes a Unix socket, so the inherited
+            # socket is wrapped here (family auto-detected) and served directly
+            sock = socket_from_fd(fd)
+            main = partial(self._serve_socket, sock, transport, **transport_options)
+        else:
+            main = partial(self.mcp.run_async, transport, **transport_options)
+        
+        # Run the server on the selected event loop
+        # (FastMCP.run always uses the default asyncio loop)
+        anyio.run(main, backend_options={"loop_factory": get_loop_factory(resolved_loop)})
+    
+    @staticmethod
+    async def _remove_socket_file(path: str):
+        """Remove the Unix domain socket file on shutdown."""
+        if os.path.exists(path):
+            os.unlink(path)
+    
+    async def _serve_socket(
+        self,
+        sock,
+        transport: str,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        path: Optional[str] = None,
+        log_level: Optional[str] = None,
+        middleware: Optional[list] = None,
+        uvicorn_config: Optional[dict] = None,
+        stateless_http: Optional[bool] = None
+    ):
+        """Serve an HTTP transport on an already bound socket.
+        
+        Mirrors FastMCP's run_http_async, which can only bind host/port.
+        """
+        import fastmcp
+        import uvicorn
+        
+        app = self.mcp.http_app(
+            path=path,
             transport=transport,
-            **transport_options
+            middleware=middleware,
+            stateless_http=stateless_http
         )
+        config_kwargs = {
+            "timeout_graceful_shutdown": 0,
+            "lifespan": "on",
+            "log_level": (log_level or fastmcp.settings.log_level).lower(),
+            **(uvicorn_config or {})
+        }
+        server = uvicorn.Server(uvicorn.Config(app, **config_kwargs))
+        logger.info(f"Serving {transport} transport on inherited socket {sock.getsockname()!r}")
+        await server.serve(sockets=[sock])
 
 
 def create_server(
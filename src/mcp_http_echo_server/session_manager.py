@@ -5,7 +5,7 @@ import logging
 import time
 import uuid
 from collections import defaultdict, deque
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 import contextlib
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,7 @@ class SessionManager:
         self.session_timeout = session_timeout
         self._cleanup_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
+        self._removal_listeners: List[Callable[[str], None]] = []
         
         # Start cleanup task
         try:
@@ -110,12 +111,25 @@ class SessionManager:
             self.sessions[session_id].update(updates)
             self.sessions[session_id]["last_activity"] = time.time()
     
+    def add_removal_listener(self, listener: Callable[[str], None]):
+        """Register a callback invoked with the session ID when a session is removed.
+        
+        Used to expire per-session data kept outside the session dict
+        (e.g. rate limiter buckets) together with the session.
+        """
+        self._removal_listeners.append(listener)
+    
     def _remove_session_internal(self, session_id: str):
         """Internal method to remove a session without lock."""
         if session_id in self.sessions:
             del self.sessions[session_id]
         if session_id in self.message_queues:
             del self.message_queues[session_id]
+        for listener in self._removal_listeners:
+            try:
+                listener(session_id)
+            except Exception as e:
+                logger.error(f"Session removal listener failed for {session_id}: {e}")
     
     def remove_session(self, session_id: str):
         """Remove a session and its message queue."""
@@ -146,6 +160,21 @@ class SessionManager:
         """Check if session has queued messages."""
         return session_id in self.message_queues and len(self.message_queues[session_id]) > 0
     
+    def check_health(self) -> Dict[str, Any]:
+        """Check that the session store can be used.
+        
+        The in-memory store is always reachable; a networked backend would
+        ping its server here.
+        
+        Returns:
+            Dict with reachability and session count
+        """
+        return {
+            "backend": "memory",
+            "reachable": True,
+            "sessions": len(self.sessions)
+        }
+    
     def get_session_count(self) -> int:
         """Get total number of active sessions."""
         return len(self.sessions)
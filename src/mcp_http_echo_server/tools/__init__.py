@@ -1,10 +1,7 @@
 """Tools modules for MCP Echo Server."""
 
-from .echo_tools import register_echo_tools
-from .debug_tools import register_debug_tools
-from .auth_tools import register_auth_tools
-from .system_tools import register_system_tools
-from .state_tools import register_state_tools
+import importlib
+from typing import TYPE_CHECKING
 
 __all__ = [
     "register_echo_tools",
@@ -12,4 +9,37 @@ __all__ = [
     "register_auth_tools",
     "register_system_tools",
     "register_state_tools",
-]
\ No newline at end of file
+    "register_admin_tools",
+]
+
+# Tool modules depend on FastMCP; import them on first access so that
+# the FastMCP-free registry can be used on its own (e.g. by --list-tools)
+_LAZY_IMPORTS = {
+    "register_echo_tools": ".echo_tools",
+    "register_debug_tools": ".debug_tools",
+    "register_auth_tools": ".auth_tools",
+    "register_system_tools": ".system_tools",
+    "register_state_tools": ".state_tools",
+    "register_admin_tools": ".admin_tools",
+}
+
+if TYPE_CHECKING:
+    from .echo_tools import register_echo_tools
+    from .debug_tools import register_debug_tools
+    from .auth_tools import register_auth_tools
+    from .system_tools import register_system_tools
+    from .state_tools import register_state_tools
+    from .admin_tools import register_admin_tools
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,175 @@
+"""Administrative tools for MCP Echo Server."""
+
+import logging
+from typing import Dict, Any, Literal, Optional
+from fastmcp import FastMCP, Context
+from ..middleware.faults import FaultInjector, parse_fault_spec
+from ..utils.memory_snapshots import DEFAULT_FRAMES, DEFAULT_TOP, MemorySnapshots
+from ..utils.metrics import metrics
+from ..utils.profiler import DEFAULT_DURATION, DEFAULT_LIMIT, Profiler, ProfilerBusy
+
+logger = logging.getLogger(__name__)
+
+
+def register_admin_tools(
+    mcp: FastMCP,
+    stateless_mode: bool,
+    fault_injector: Optional[FaultInjector] = None,
+    profiler: Optional[Profiler] = None,
+    memory_snapshots: Optional[MemorySnapshots] = None
+):
+    """Register administrative tools.
+
+    Args:
+        mcp: FastMCP instance
+        stateless_mode: Whether server is in stateless mode
+        fault_injector: Fault injector (None if fault injection is disabled)
+        profiler: CPU profiler (None if profiling is disabled)
+        memory_snapshots: tracemalloc snapshot store (None if profiling is disabled)
+    """
+
+    @mcp.tool
+    async def faultInjection(
+        ctx: Context,
+        action: Literal["status", "set", "add", "clear"] = "status",
+        spec: str = ""
+    ) -> Dict[str, Any]:
+        """Inspect or change the active fault injection rules.
+
+        Rules use the same syntax as --faults, for example
+        "tool:echo error=0.2; method:tools/list latency=300 jitter=100".
+        Only available when the server runs with --fault-injection.
+
+        Args:
+            action: "status", "set" (replace the rules), "add" (append
+                rules; earlier rules match first) or "clear"
+            spec: Rules for "set" and "add"
+
+        Returns:
+            Active rules and injected fault counts
+        """
+        if fault_injector is None:
+            return {"error": "Fault injection is disabled (start the server with --fault-injection)"}
+
+        if action in ("set", "add"):
+            try:
+                rules = parse_fault_spec(spec)
+            except ValueError as e:
+                return {"error": str(e)}
+            if action == "add":
+                rules = fault_injector.rules + rules
+            fault_injector.set_rules(rules)
+        elif action == "clear":
+            fault_injector.set_rules([])
+
+        return {"action": action, **fault_injector.get_stats()}
+
+    @mcp.tool
+    async def profileServer(
+        ctx: Context,
+        mode: Literal["sample", "cprofile"] = "sample",
+        duration: float = DEFAULT_DURATION,
+        interval_ms: float = 5.0,
+        format: Optional[Literal["collapsed", "top", "pstats"]] = None,
+        limit: int = DEFAULT_LIMIT
+    ) -> Dict[str, Any]:
+        """Profile the server's event loop for a few seconds.
+
+        "sample" samples the event loop stack from a side thread (low
+        overhead) and returns collapsed stacks for flame graphs or a top
+        list; "cprofile" runs cProfile and returns pstats text. Only one
+        profile runs at a time. Requires --profiling.
+
+        Args:
+            mode: "sample" or "cprofile"
+            duration: Seconds to profile (max 60)
+            interval_ms: Milliseconds between samples (sample mode)
+            format: "collapsed" or "top" (sample), "pstats" (cprofile)
+            limit: Entries in top/pstats output
+
+        Returns:
+            Profile summary with the rendered profile under "output"
+        """
+        if profiler is None:
+            return {"error": "Profiling is disabled (start the server with --profiling)"}
+        try:
+            return await profiler.profile(
+                mode=mode,
+                duration=duration,
+                interval=interval_ms / 1000,
+                output=format,
+                limit=limit
+            )
+        except (ValueError, ProfilerBusy) as e:
+            return {"error": str(e)}
+
+    @mcp.tool
+    async def memorySnapshot(
+        ctx: Context,
+        action: Literal["status", "start", "take", "top", "diff", "stop"] = "status",
+        label: str = "",
+        compare_to: str = "",
+        limit: int = DEFAULT_TOP,
+        group_by: Literal["lineno", "filename", "traceback"] = "lineno",
+        frames: int = DEFAULT_FRAMES
+    ) -> Dict[str, Any]:
+        """Hunt memory leaks with tracemalloc snapshots.
+
+        Typical use: "start", "take" (label "before"), exercise the server,
+        "take" (label "after"), then "diff" to see which lines allocated
+        the growth, and "stop" to end tracing. Tracing slows allocations
+        down, so it only runs between "start" and "stop". Requires
+        --profiling.
+
+        Args:
+            action: "status", "start" tracing, "take" a snapshot, "top"
+                allocation sites, "diff" two snapshots, or "stop" tracing
+                (drops all snapshots)
+            label: Snapshot label for "take", "top" and "diff" (default:
+                auto-named / latest)
+            compare_to: Older snapshot for "diff" (default: the one before)
+            limit: Entries in "top" and "diff"
+            group_by: "lineno", "filename" or "traceback"
+            frames: Frames stored per allocation for "start" (1-25)
+
+        Returns:
+            Tracing status, snapshot info, top sites or the diff
+        """
+        if memory_snapshots is None:
+            return {"error": "Memory snapshots are disabled (start the server with --profiling)"}
+        try:
+            if action == "start":
+                return memory_snapshots.start(frames)
+            if action == "stop":
+                return memory_snapshots.stop()
+            if action == "take":
+                snapshot = await memory_snapshots.take(label)
+                return {**snapshot, **(await memory_snapshots.top(snapshot["label"], limit, group_by))}
+            if action == "top":
+                return await memory_snapshots.top(label, limit, group_by)
+            if action == "diff":
+                return await memory_snapshots.diff(label, compare_to, limit, group_by)
+            return memory_snapshots.status()
+        except ValueError as e:
+            return {"error": str(e)}
+
+    @mcp.tool
+    async def serverMetrics(ctx: Context, section: str = "") -> Dict[str, Any]:
+        """Show the server's metrics: counters and per-component statistics.
+
+        Sections include counters, admission, rate_limit, compression,
+        event_loop, readiness, drain, jwt_cache and jwt_verify, plus faults,
+        recording, profiler and tracemalloc when those features are enabled.
+
+        Args:
+            section: Return only this section (default: all)
+
+        Returns:
+            Metrics snapshot, or the requested section
+        """
+        snapshot = metrics.snapshot()
+        if not section:
+            return snapshot
+        if section not in snapshot:
+            return {"error": f"Unknown section {section!r}. Available: {', '.join(snapshot)}"}
+        return {section: snapshot[section]}
@@ -1,13 +1,34 @@
 """Authentication tools for MCP Echo Server."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from functools import partial
+from typing import Dict, Any, List, Optional
+
+import anyio
 from fastmcp import FastMCP, Context
+from ..utils import codec
+from ..utils.metrics import metrics
 from ..utils.state_adapter import StateAdapter
-from ..utils.jwt_decoder import decode_jwt_token, format_jwt_claims
+from ..utils.auth_context import get_auth_context
+from ..utils.jwt_decoder import format_jwt_claims, thaw
+from ..utils.jwt_stats import TokenBatchStats, classify_token, parse_token_list
+from ..utils.jwt_verify import jwt_verifier
 
 logger = logging.getLogger(__name__)
 
+# bearerDecodeBatch limits
+MAX_BATCH_TOKENS = 100_000
+MAX_BATCH_CHUNK_SIZE = 10_000
+MAX_BATCH_WORKERS = 16
+MAX_BATCH_RESULTS = 1_000
+
+
+def _classify_chunk(tokens: List[str], now: float, verify: bool) -> List[Dict[str, Any]]:
+    """Classify a chunk of tokens (runs in a worker thread when offloaded)."""
+    return [classify_token(token, now, verify) for token in tokens]
+
 
 def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
     """Register authentication-related tools.
@@ -18,20 +39,22 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
     """
     
     @mcp.tool
-    async def bearerDecode(ctx: Context, include_raw: bool = False) -> Dict[str, Any]:
+    async def bearerDecode(ctx: Context, include_raw: bool = False, verify: bool = False) -> Dict[str, Any]:
         """Decode JWT Bearer token from Authorization header.
         
-        Decodes and analyzes JWT tokens without signature verification.
+        Decodes and analyzes JWT tokens. Signatures are only checked when
+        requested, against the keys of the server's JWKS file.
         This is a debugging tool to inspect token contents.
         
         Args:
             include_raw: Include raw token parts in response (default: False)
+            verify: Verify the signature (HS*, RS*, PS*, ES*) (default: False)
             
         Returns:
             Decoded token information or error details
         """
-        headers = (ctx.get_state("request_headers") or {})
-        auth_header = headers.get("authorization", "")
+        auth = get_auth_context(ctx)
+        auth_header = auth.authorization
         
         result = {
             "tool": "bearerDecode",
@@ -48,9 +71,9 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
             result["error"] = f"Authorization header is not Bearer type: {auth_header[:30]}..."
             return result
         
-        # Decode the token
-        token = auth_header[7:]  # Remove "Bearer " prefix
-        decoded = decode_jwt_token(token)
+        # Decoded once per request (and cached across requests)
+        token = auth.bearer_token
+        decoded = auth.decoded
         
         if not decoded:
             result["status"] = "error"
@@ -67,6 +90,14 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
         if include_raw:
             result["raw"] = decoded["raw"]
         
+        if verify:
+            result["signature_verification"] = auth.verification
+            if not jwt_verifier.configured:
+                result["signature_verification"] = {
+                    **auth.verification,
+                    "message": "No JWKS file configured (--jwks-file / MCP_JWKS_FILE)"
+                }
+        
         # Add validation info
         import time
         current_time = int(time.time())
@@ -79,8 +110,8 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
                 "time_since_expiry": current_time - exp if exp < current_time else 0
             }
         
-        # Store decoded token in state for other tools
-        await StateAdapter.set_state(ctx, "decoded_token", decoded)
+        # Store a plain copy in state for other tools (the cached one is read-only)
+        await StateAdapter.set_state(ctx, "decoded_token", thaw(decoded))
         
         return result
     
@@ -94,7 +125,7 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
         Returns:
             Authentication context analysis
         """
-        headers = (ctx.get_state("request_headers") or {})
+        auth = get_auth_context(ctx)
         
         result = {
             "tool": "authContext",
@@ -105,22 +136,24 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
         }
         
         # Check Bearer token
-        auth_header = headers.get("authorization", "")
+        auth_header = auth.authorization
         if auth_header:
-            if auth_header.lower().startswith("bearer "):
-                token = auth_header[7:]
-                decoded = decode_jwt_token(token)
+            if auth.bearer_token is not None:
+                token = auth.bearer_token
                 
-                if decoded:
+                if auth.decoded:
+                    claims = auth.claims
                     result["bearer_token"] = {
                         "present": True,
                         "valid_structure": True,
                         "length": len(token),
-                        "subject": decoded["payload"].get("sub"),
-                        "client_id": decoded["payload"].get("client_id"),
-                        "scope": decoded["payload"].get("scope"),
-                        "issuer": decoded["payload"].get("iss")
+                        "subject": claims.get("sub"),
+                        "client_id": claims.get("client_id"),
+                        "scope": claims.get("scope"),
+                        "issuer": claims.get("iss")
                     }
+                    if jwt_verifier.configured:
+                        result["bearer_token"]["signature"] = auth.verification["status"]
                 else:
                     result["bearer_token"] = {
                         "present": True,
@@ -136,23 +169,11 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
             result["bearer_token"] = {"present": False}
         
         # Check OAuth headers
-        oauth_header_mappings = {
-            "x-user-id": "user_id",
-            "x-user-name": "user_name",
-            "x-auth-token": "auth_token",
-            "x-client-id": "client_id",
-            "x-oauth-client": "oauth_client",
-            "x-auth-user": "auth_user",
-            "x-auth-email": "auth_email"
-        }
-        
-        for header_key, field_name in oauth_header_mappings.items():
-            value = headers.get(header_key)
-            if value:
-                # Redact auth tokens
-                if "token" in header_key and len(value) > 20:
-                    value = value[:10] + "***" + value[-10:]
-                result["oauth_headers"][field_name] = value
+        for field_name, value in auth.oauth_headers.items():
+            # Redact auth tokens
+            if "token" in field_name and len(value) > 20:
+                value = value[:10] + "***" + value[-10:]
+            result["oauth_headers"][field_name] = value
         
         if not result["oauth_headers"]:
             result["oauth_headers"] = {"message": "No OAuth headers found"}
@@ -172,18 +193,10 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
             result["session_context"] = {"message": "No session tracking in stateless mode"}
         
         # Authentication summary
-        has_bearer = result["bearer_token"].get("present", False) and result["bearer_token"].get("valid_structure", False)
-        has_oauth = len(result["oauth_headers"]) > 1 or "user_id" in result["oauth_headers"]
-        
         result["summary"] = {
-            "authenticated": has_bearer or has_oauth,
-            "auth_method": "bearer" if has_bearer else "oauth_headers" if has_oauth else "none",
-            "user_identifier": (
-                result["bearer_token"].get("subject") or
-                result["oauth_headers"].get("user_id") or
-                result["oauth_headers"].get("user_name") or
-                "anonymous"
-            )
+            "authenticated": auth.auth_method != "none",
+            "auth_method": auth.auth_method,
+            "user_identifier": auth.principal_id or "anonymous"
         }
         
         return result
@@ -199,8 +212,7 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
             AI-powered excellence analysis report
         """
         # Get authentication context
-        headers = (ctx.get_state("request_headers") or {})
-        auth_header = headers.get("authorization", "")
+        auth = get_auth_context(ctx)
         
         result = "🔥 G.O.A.T. PROGRAMMER IDENTIFICATION SYSTEM v4.20 🔥\n"
         result += "=" * 60 + "\n\n"
@@ -225,21 +237,17 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
         found_user = False
         
         # Check JWT token
-        if auth_header and auth_header.lower().startswith("bearer "):
-            token = auth_header[7:]
-            decoded = decode_jwt_token(token)
-            
-            if decoded:
-                payload = decoded["payload"]
-                name = payload.get("name")
-                username = payload.get("username") or payload.get("sub")
-                if name or username:
-                    found_user = True
+        if auth.decoded:
+            payload = auth.claims
+            name = payload.get("name")
+            username = payload.get("username") or payload.get("sub")
+            if name or username:
+                found_user = True
         
         # Check OAuth headers as fallback
         if not found_user:
-            oauth_name = headers.get("x-user-name")
-            oauth_id = headers.get("x-user-id")
+            oauth_name = auth.user_name
+            oauth_id = auth.user_id
             if oauth_name or oauth_id:
                 name = name or oauth_name
                 username = username or oauth_id
@@ -285,4 +293,118 @@ def register_auth_tools(mcp: FastMCP, stateless_mode: bool):
         
         return result
     
+    @mcp.tool
+    async def bearerDecodeBatch(
+        ctx: Context,
+        tokens: Optional[List[str]] = None,
+        text: str = "",
+        verify: bool = False,
+        workers: int = 0,
+        chunk_size: int = 500,
+        stream: bool = False,
+        include_results: bool = False,
+        top: int = 20
+    ) -> Dict[str, Any]:
+        """Decode and classify many JWTs at once with aggregated claim statistics.
+        
+        Tokens go through the shared decode cache. The result counts
+        malformed, expired and not-yet-valid tokens and shows the most
+        common issuers, audiences, scopes and algorithms.
+        
+        Args:
+            tokens: List of tokens ("Bearer " prefixes are stripped)
+            text: Newline-separated tokens, e.g. pasted from gateway logs
+            verify: Also verify signatures against the JWKS file
+            workers: Decode chunks in up to this many worker threads
+                (0 decodes on the event loop, yielding between chunks)
+            chunk_size: Tokens per chunk (max 10000)
+            stream: Send each chunk's per-token results as a notification
+                as soon as it completes (progress if the request has a
+                progressToken, log otherwise)
+            include_results: Add per-token results to the response (first 1000)
+            top: Entries per distribution in the summary
+            
+        Returns:
+            Aggregated statistics and timing
+        """
+        token_list = parse_token_list(tokens, text)
+        if not token_list:
+            return {"error": "Provide tokens or text with one token per line"}
+        if len(token_list) > MAX_BATCH_TOKENS:
+            return {"error": f"At most {MAX_BATCH_TOKENS} tokens per call, got {len(token_list)}"}
+        if not 1 <= chunk_size <= MAX_BATCH_CHUNK_SIZE:
+            return {"error": f"chunk_size must be between 1 and {MAX_BATCH_CHUNK_SIZE}"}
+        if not 0 <= workers <= MAX_BATCH_WORKERS:
+            return {"error": f"workers must be between 0 and {MAX_BATCH_WORKERS}"}
+        
+        meta = ctx.request_context.meta
+        use_progress = bool(meta and meta.progressToken is not None)
+        
+        now = time.time()
+        chunks = [token_list[i:i + chunk_size] for i in range(0, len(token_list), chunk_size)]
+        stats = TokenBatchStats()
+        # Slots for the first MAX_BATCH_RESULTS inputs, filled by input index
+        results: List[Optional[Dict[str, Any]]] = [None] * (
+            min(len(token_list), MAX_BATCH_RESULTS) if include_results else 0
+        )
+        done = 0
+        start = time.perf_counter()
+        
+        async def collect(index: int, records: List[Dict[str, Any]]):
+            nonlocal done
+            for record in records:
+                stats.add(record)
+            offset = index * chunk_size
+            for i, record in enumerate(records[:max(0, len(results) - offset)]):
+                results[offset + i] = {"index": offset + i, **record}
+            done += len(records)
+            if stream:
+                message = codec.dumps({
+                    "chunk": index,
+                    "offset": index * chunk_size,
+                    "results": records
+                })
+                if use_progress:
+                    await ctx.report_progress(done, len(token_list), message=message)
+                else:
+                    await ctx.log(message, level="info", logger_name="bearerDecodeBatch",
+                                  extra={"chunk": index, "decoded": done, "of": len(token_list)})
+        
+        if workers:
+            # Chunks complete (and stream) in whatever order the threads finish
+            limiter = anyio.CapacityLimiter(workers)
+            
+            async def run_chunk(index: int, chunk: List[str]):
+                records = await anyio.to_thread.run_sync(
+                    partial(_classify_chunk, chunk, now, verify), limiter=limiter
+                )
+                await collect(index, records)
+            
+            async with anyio.create_task_group() as tg:
+                for index, chunk in enumerate(chunks):
+                    tg.start_soon(run_chunk, index, chunk)
+        else:
+            for index, chunk in enumerate(chunks):
+                await collect(index, _classify_chunk(chunk, now, verify))
+                # Let other requests run between chunks
+                await asyncio.sleep(0)
+        
+        duration = time.perf_counter() - start
+        metrics.increment("bearer_decode_batch.tokens", len(token_list))
+        
+        result = {
+            "tool": "bearerDecodeBatch",
+            "summary": stats.to_dict(top),
+            "timing": {
+                "duration_ms": round(duration * 1000, 3),
+                "tokens_per_second": round(len(token_list) / duration, 1) if duration > 0 else None,
+                "chunks": len(chunks),
+                "workers": workers,
+                "streamed": stream
+            }
+        }
+        if include_results:
+            result["results"] = results
+        return result
+    
     logger.debug(f"Registered auth tools (stateless_mode={stateless_mode})")
\ No newline at end of file
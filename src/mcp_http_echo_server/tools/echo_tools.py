@@ -1,11 +1,117 @@
 """Echo tools for MCP Echo Server."""
 
+import asyncio
 import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 from fastmcp import FastMCP, Context
+from ..utils.metrics import metrics
 from ..utils.state_adapter import StateAdapter
 
 logger = logging.getLogger(__name__)
 
+# echoStream limits
+MAX_STREAM_BYTES = 64 * 1024 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+MAX_STREAM_CHUNKS = 100_000
+MAX_CHUNK_DELAY_MS = 10_000
+
+STREAM_DELIVERY_MODES = ("auto", "progress", "log")
+
+# Generated payloads are slices of this repeating pattern, built once so
+# every chunk is a cheap string slice
+_PATTERN_UNIT = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-_"
+_PATTERN = _PATTERN_UNIT * (MAX_CHUNK_SIZE // len(_PATTERN_UNIT) + 2)
+
+# echoSynthetic limits
+MAX_SYNTHETIC_BYTES = 16 * 1024 * 1024
+MAX_SYNTHETIC_DELAY_MS = 60_000
+
+DELAY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "longtail")
+
+# Pareto shape for the long-tail distribution: median ~1.6x, p99 ~21x the base delay
+DEFAULT_TAIL_ALPHA = 1.5
+
+# Total size of generated payloads kept for reuse across requests
+PAYLOAD_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class PayloadCache:
+    """Generated payloads by size, sliced from one shared buffer.
+
+    Repeated requests for the same size get the same string object back,
+    so steady-state synthetic load allocates nothing per request in the
+    tool itself. Least recently used sizes are dropped beyond
+    ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = PAYLOAD_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._buffer = _PATTERN
+        self._payloads: "OrderedDict[int, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, size: int) -> str:
+        """Get a payload of exactly ``size`` ASCII characters."""
+        with self._lock:
+            payload = self._payloads.get(size)
+            if payload is not None:
+                self._payloads.move_to_end(size)
+                return payload
+            
+            if size > len(self._buffer):
+                self._buffer = _PATTERN_UNIT * (size // len(_PATTERN_UNIT) + 1)
+            payload = self._buffer[:size]
+            if size <= self.max_bytes:
+                self._payloads[size] = payload
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, dropped = self._payloads.popitem(last=False)
+                    self._bytes -= len(dropped)
+            return payload
+
+
+_payloads = PayloadCache()
+
+# Shared generator for unseeded requests
+_rng = random.Random()
+
+
+def sample_delay_ms(
+    rng: random.Random,
+    distribution: str,
+    delay_ms: float,
+    jitter_ms: float = 0,
+    tail_alpha: float = DEFAULT_TAIL_ALPHA
+) -> float:
+    """Draw one delay in milliseconds.
+    
+    Args:
+        rng: Random generator
+        distribution: "fixed" (delay_ms), "uniform" (delay_ms +/- jitter_ms),
+            "normal" (mean delay_ms, stddev jitter_ms) or "longtail"
+            (Pareto with scale delay_ms and shape tail_alpha)
+        delay_ms: Base delay
+        jitter_ms: Spread for uniform/normal
+        tail_alpha: Pareto shape, smaller means a heavier tail
+        
+    Returns:
+        Delay clamped to [0, MAX_SYNTHETIC_DELAY_MS]
+    """
+    if distribution == "uniform":
+        delay = rng.uniform(delay_ms - jitter_ms, delay_ms + jitter_ms)
+    elif distribution == "normal":
+        delay = rng.gauss(delay_ms, jitter_ms)
+    elif distribution == "longtail":
+        delay = delay_ms * rng.paretovariate(tail_alpha)
+    else:
+        delay = delay_ms
+    return min(max(delay, 0.0), MAX_SYNTHETIC_DELAY_MS)
+
 
 def register_echo_tools(mcp: FastMCP, stateless_mode: bool):
     """Register echo-related tools.
@@ -119,4 +225,181 @@ def register_echo_tools(mcp: FastMCP, stateless_mode: bool):
         else:
             return f"[REPLAY] {last_message}"
     
+    @mcp.tool
+    async def echoStream(
+        ctx: Context,
+        message: str = "",
+        size: int = 0,
+        chunk_size: int = 1024,
+        count: Optional[int] = None,
+        delay_ms: float = 0,
+        delivery: str = "auto"
+    ) -> Dict[str, Any]:
+        """Stream a message or generated payload back as a sequence of chunks.
+        
+        Each chunk is sent as its own notification on the request's SSE
+        stream, so proxies and clients can be load-tested for streaming
+        throughput. Sends wait for the client to consume the previous event,
+        so slow readers apply backpressure; cancelling the request stops the
+        stream. With JSON responses (no SSE) only the summary is returned.
+        
+        Args:
+            message: Text to stream (takes precedence over size)
+            size: Bytes of generated ASCII payload to stream when no message is given
+            chunk_size: Characters per chunk (max 1 MiB)
+            count: Number of chunks; wraps around the payload if larger
+                than needed (default: enough chunks to cover the payload)
+            delay_ms: Delay between chunks in milliseconds
+            delivery: "progress" (progress notifications, needs a progressToken),
+                "log" (log message notifications) or "auto" (progress if possible)
+            
+        Returns:
+            Summary with chunks and bytes sent, duration and throughput
+        """
+        if delivery not in STREAM_DELIVERY_MODES:
+            return {"error": f"Invalid delivery. Must be one of: {', '.join(STREAM_DELIVERY_MODES)}"}
+        if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+            return {"error": f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}"}
+        if not 0 <= delay_ms <= MAX_CHUNK_DELAY_MS:
+            return {"error": f"delay_ms must be between 0 and {MAX_CHUNK_DELAY_MS}"}
+        
+        if message:
+            source_size = len(message)
+            # Repeated so any chunk_size window can be sliced without wrapping
+            source = message * (chunk_size // source_size + 2)
+        else:
+            source_size = len(_PATTERN_UNIT)
+            source = _PATTERN
+        
+        if count is None:
+            # Stream the payload once; the last chunk may be short
+            total_size = len(message) if message else size
+            if total_size <= 0:
+                return {"error": "Provide a message, a size or a count"}
+            count = -(-total_size // chunk_size)
+        else:
+            # Stream exactly count full chunks, wrapping around the payload
+            total_size = count * chunk_size
+        
+        if not 1 <= count <= MAX_STREAM_CHUNKS:
+            return {"error": f"count must be between 1 and {MAX_STREAM_CHUNKS}"}
+        if total_size > MAX_STREAM_BYTES:
+            return {"error": f"Stream of {total_size} bytes exceeds the limit of {MAX_STREAM_BYTES}"}
+        
+        meta = ctx.request_context.meta
+        has_progress_token = bool(meta and meta.progressToken is not None)
+        use_progress = delivery == "progress" or (delivery == "auto" and has_progress_token)
+        if use_progress and not has_progress_token:
+            return {"error": "Progress delivery requires the request to carry a progressToken"}
+        
+        delay = delay_ms / 1000
+        chunks_sent = 0
+        bytes_sent = 0
+        cancelled = False
+        start = time.perf_counter()
+        
+        try:
+            for index in range(count):
+                offset = index * chunk_size
+                window = offset % source_size
+                chunk = source[window:window + min(chunk_size, total_size - offset)]
+                
+                # Both sends wait until the transport has taken the event
+                if use_progress:
+                    await ctx.report_progress(index + 1, count, message=chunk)
+                else:
+                    await ctx.log(chunk, level="info", logger_name="echoStream", extra={"chunk": index + 1, "of": count})
+                
+                chunks_sent += 1
+                bytes_sent += len(chunk.encode("utf-8")) if message else len(chunk)
+                if delay and index + 1 < count:
+                    await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled = True
+            metrics.increment("echo_stream.cancelled")
+            logger.info(f"echoStream cancelled after {chunks_sent}/{count} chunks")
+            raise
+        finally:
+            metrics.increment("echo_stream.chunks", chunks_sent)
+            metrics.increment("echo_stream.bytes", bytes_sent)
+            if not cancelled:
+                metrics.increment("echo_stream.completed")
+        
+        duration = time.perf_counter() - start
+        return {
+            "chunks_sent": chunks_sent,
+            "bytes_sent": bytes_sent,
+            "chunk_size": chunk_size,
+            "delay_ms": delay_ms,
+            "delivery": "progress" if use_progress else "log",
+            "source": "message" if message else "generated",
+            "duration_ms": round(duration * 1000, 3),
+            "bytes_per_second": round(bytes_sent / duration, 1) if duration > 0 else None,
+            "chunks_per_second": round(chunks_sent / duration, 1) if duration > 0 else None
+        }
+    
+    @mcp.tool
+    async def echoSynthetic(
+        ctx: Context,
+        size: int = 0,
+        delay_ms: float = 0,
+        distribution: str = "fixed",
+        jitter_ms: float = 0,
+        tail_alpha: float = DEFAULT_TAIL_ALPHA,
+        seed: Optional[int] = None,
+        message: str = ""
+    ) -> Dict[str, Any]:
+        """Return a synthetic payload after a controlled delay, for load testing.
+        
+        The payload is a slice of a precomputed buffer, reused across
+        requests of the same size. The delay is drawn from the chosen
+        distribution; with a seed the same arguments always produce the
+        same delay.
+        
+        Args:
+            size: Payload size in bytes (ASCII, max 16 MiB)
+            delay_ms: Fixed delay, mean (uniform/normal) or scale (longtail)
+            distribution: "fixed", "uniform", "normal" or "longtail"
+            jitter_ms: Half-width (uniform) or standard deviation (normal)
+            tail_alpha: Pareto shape for longtail (> 0, smaller = heavier tail)
+            seed: Seed for a reproducible delay
+            message: Optional text echoed back alongside the payload
+            
+        Returns:
+            Payload, the applied delay and the parameters used
+        """
+        if distribution not in DELAY_DISTRIBUTIONS:
+            return {"error": f"Invalid distribution. Must be one of: {', '.join(DELAY_DISTRIBUTIONS)}"}
+        if not 0 <= size <= MAX_SYNTHETIC_BYTES:
+            return {"error": f"size must be between 0 and {MAX_SYNTHETIC_BYTES}"}
+        if not 0 <= delay_ms <= MAX_SYNTHETIC_DELAY_MS:
+            return {"error": f"delay_ms must be between 0 and {MAX_SYNTHETIC_DELAY_MS}"}
+        if jitter_ms < 0:
+            return {"error": "jitter_ms must not be negative"}
+        if tail_alpha <= 0:
+            return {"error": "tail_alpha must be positive"}
+        
+        rng = random.Random(seed) if seed is not None else _rng
+        delay = sample_delay_ms(rng, distribution, delay_ms, jitter_ms, tail_alpha)
+        
+        start = time.perf_counter()
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        slept = time.perf_counter() - start
+        
+        metrics.increment("echo_synthetic.requests")
+        metrics.increment("echo_synthetic.bytes", size)
+        
+        result = {
+            "size": size,
+            "distribution": distribution,
+            "delay_ms": round(delay, 3),
+            "actual_delay_ms": round(slept * 1000, 3),
+            "seed": seed,
+            "payload": _payloads.get(size)
+        }
+        if message:
+            result["message"] = message
+        return result
+    
     logger.debug(f"Registered echo tools (stateless_mode={stateless_mode})")
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Central tool registry: categories, mode availability and tools/list cache.
+
+The catalog below is the single place where a tool's category and flags
+are declared. It has no FastMCP dependency so the CLI can list tools
+without importing the server. At startup ``ToolRegistry.load`` introspects
+the tools actually registered on the FastMCP instance and precomputes
+everything derived from them (counts, per-mode availability, the
+``tools/list`` payload) once.
+"""
+
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ToolInfo(NamedTuple):
+    """Static metadata for one tool."""
+
+    name: str
+    category: str
+    summary: str
+    stateful_only: bool = False
+
+
+# Category key -> display title, in display order
+CATEGORIES = {
+    "echo": "Echo Tools",
+    "debug": "Debug Tools",
+    "auth": "Auth Tools",
+    "system": "System Tools",
+    "state": "State Tools",
+    "admin": "Admin Tools",
+}
+
+# Category used for registered tools missing from the catalog
+UNCATEGORIZED = "other"
+
+TOOL_CATALOG: Tuple[ToolInfo, ...] = (
+    # Echo tools
+    ToolInfo("echo", "echo", "Echo back messages with context"),
+    ToolInfo("replayLastEcho", "echo", "Replay last echo", stateful_only=True),
+    ToolInfo("echoStream", "echo", "Stream chunked payloads over SSE"),
+    ToolInfo("echoSynthetic", "echo", "Synthetic payloads with latency knobs"),
+    # Debug tools
+    ToolInfo("printHeader", "debug", "Display HTTP headers"),
+    ToolInfo("requestTiming", "debug", "Show request timing metrics"),
+    ToolInfo("corsAnalysis", "debug", "Analyze CORS configuration"),
+    ToolInfo("environmentDump", "debug", "Display environment config"),
+    # Auth tools
+    ToolInfo("bearerDecode", "auth", "Decode JWT tokens"),
+    ToolInfo("bearerDecodeBatch", "auth", "Decode and classify JWTs in bulk"),
+    ToolInfo("authContext", "auth", "Display auth context"),
+    ToolInfo("whoIStheGOAT", "auth", "AI excellence analyzer"),
+    # System tools
+    ToolInfo("healthProbe", "system", "Deep health check"),
+    ToolInfo("sessionInfo", "system", "Session information"),
+    # State tools
+    ToolInfo("stateInspector", "state", "Inspect state storage"),
+    ToolInfo("sessionHistory", "state", "Show session history", stateful_only=True),
+    ToolInfo("stateManipulator", "state", "Manipulate state"),
+    ToolInfo("sessionCompare", "state", "Compare sessions", stateful_only=True),
+    ToolInfo("sessionTransfer", "state", "Export/import sessions", stateful_only=True),
+    ToolInfo("stateBenchmark", "state", "Benchmark state ops"),
+    ToolInfo("sessionLifecycle", "state", "Session lifecycle info", stateful_only=True),
+    ToolInfo("stateValidator", "state", "Validate state consistency"),
+    ToolInfo("requestTracer", "state", "Trace request flow"),
+    ToolInfo("modeDetector", "state", "Detect operational mode"),
+    # Admin tools
+    ToolInfo("faultInjection", "admin", "Manage fault injection rules"),
+    ToolInfo("profileServer", "admin", "Profile the event loop on demand"),
+    ToolInfo("memorySnapshot", "admin", "Diff tracemalloc snapshots to find leaks"),
+    ToolInfo("serverMetrics", "admin", "Server metrics and component statistics"),
+)
+
+CATALOG_BY_NAME: Dict[str, ToolInfo] = {tool.name: tool for tool in TOOL_CATALOG}
+
+
+class ToolRegistry:
+    """Registered tools with their metadata and precomputed derived views.
+
+    The views returned by ``summary``, ``available`` and friends are shared
+    between requests and must not be mutated by callers.
+    """
+
+    def __init__(self, tools: Sequence[ToolInfo] = ()):
+        self._set_tools(tools)
+        self._tools_list_source: Optional[tuple] = None
+        self._tools_list_meta: Optional[bool] = None
+        self._tools_list: List[Any] = []
+
+    @classmethod
+    def from_catalog(cls) -> "ToolRegistry":
+        """Registry of every tool in the catalog (for the CLI)."""
+        return cls(TOOL_CATALOG)
+
+    def load(self, mcp) -> "ToolRegistry":
+        """Introspect the tools registered on a FastMCP instance.
+
+        Runs synchronously during server construction, where the public
+        (async) ``FastMCP.get_tools`` cannot be awaited, so it reads the
+        tool manager directly; see the FastMCP pin in pyproject.toml.
+
+        Args:
+            mcp: FastMCP instance with all tools registered
+
+        Returns:
+            self
+        """
+        tools = []
+        for name, tool in mcp._tool_manager._tools.items():
+            info = CATALOG_BY_NAME.get(name)
+            if info is None:
+                logger.warning(f"Tool '{name}' is not in the tool catalog, listing it as '{UNCATEGORIZED}'")
+                summary = (tool.description or "").strip().split("\n", 1)[0]
+                info = ToolInfo(name, UNCATEGORIZED, summary)
+            tools.append(info)
+        self._set_tools(tools)
+        return self
+
+    def _set_tools(self, tools: Sequence[ToolInfo]):
+        """Store tools and precompute every derived view."""
+        self.tools: Tuple[ToolInfo, ...] = tuple(tools)
+        self.names: Tuple[str, ...] = tuple(tool.name for tool in self.tools)
+        self.total = len(self.tools)
+
+        categories = list(CATEGORIES)
+        if any(tool.category not in CATEGORIES for tool in self.tools):
+            categories.append(UNCATEGORIZED)
+        self.by_category: Dict[str, Tuple[ToolInfo, ...]] = {
+            category: tuple(tool for tool in self.tools if tool.category == category)
+            for category in categories
+        }
+        self.counts: Dict[str, int] = {category: len(tools) for category, tools in self.by_category.items()}
+        self.stateful_only: Tuple[str, ...] = tuple(tool.name for tool in self.tools if tool.stateful_only)
+
+        self._available = {
+            False: self.names,
+            True: tuple(tool.name for tool in self.tools if not tool.stateful_only),
+        }
+        self._summaries = {
+            stateless: {
+                "total": self.total,
+                "available": len(self._available[stateless]),
+                "categories": self.counts,
+                "stateful_only": list(self.stateful_only) if stateless else []
+            }
+            for stateless in (False, True)
+        }
+
+    def available(self, stateless: bool) -> Tuple[str, ...]:
+        """Names of tools usable in the given mode."""
+        return self._available[bool(stateless)]
+
+    def summary(self, stateless: bool) -> Dict[str, Any]:
+        """Tool availability summary for the given mode (healthProbe)."""
+        return self._summaries[bool(stateless)]
+
+    def category_title(self, category: str) -> str:
+        """Display title for a category."""
+        return CATEGORIES.get(category, "Other Tools")
+
+    def describe_categories(self) -> str:
+        """One line per category listing its tool names (server instructions)."""
+        return "\n".join(
+            f"- {self.category_title(category)}: {', '.join(tool.name for tool in tools)}"
+            for category, tools in self.by_category.items()
+            if tools
+        )
+
+    def get_tools_list(self, tools: Sequence[Any], include_fastmcp_meta: Optional[bool] = None) -> List[Any]:
+        """Return the MCP tools/list payload, converting only when tools change.
+
+        Args:
+            tools: FastMCP Tool objects as listed for this request
+            include_fastmcp_meta: Passed through to ``Tool.to_mcp_tool``
+
+        Returns:
+            List of MCP Tool definitions (shared, do not mutate)
+        """
+        source = self._tools_list_source
+        unchanged = (
+            source is not None
+            and include_fastmcp_meta == self._tools_list_meta
+            and len(source) == len(tools)
+            and all(a is b for a, b in zip(source, tools))
+        )
+        if not unchanged:
+            self._tools_list = [
+                tool.to_mcp_tool(name=tool.key, include_fastmcp_meta=include_fastmcp_meta)
+                for tool in tools
+            ]
+            self._tools_list_source = tuple(tools)
+            self._tools_list_meta = include_fastmcp_meta
+        return self._tools_list
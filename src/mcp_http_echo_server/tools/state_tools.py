@@ -3,13 +3,13 @@
 import os
 import sys
 import time
-import json
 import base64
 import uuid
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, UTC
 from fastmcp import FastMCP, Context
+from ..utils import codec
 from ..utils.state_adapter import StateAdapter
 
 logger = logging.getLogger(__name__)
@@ -384,8 +384,8 @@ def register_state_tools(mcp: FastMCP, stateless_mode: bool):
                     export_data["states"][key] = value
             
             # Encode as base64 for easy transfer
-            json_data = json.dumps(export_data, default=str)
-            encoded = base64.b64encode(json_data.encode()).decode()
+            json_data = codec.dumps_bytes(export_data, default=str)
+            encoded = base64.b64encode(json_data).decode()
             
             return {
                 "action": "export",
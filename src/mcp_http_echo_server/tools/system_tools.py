@@ -5,22 +5,39 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, UTC
 from fastmcp import FastMCP, Context
+from ..middleware.rate_limit import RateLimiter
+from ..utils.auth_context import get_auth_context
+from ..utils.metrics import metrics
 from ..utils.state_adapter import StateAdapter
 from ..session_manager import SessionManager
+from .registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 MAX_DISPLAY_SESSIONS = 10
 
 
-def register_system_tools(mcp: FastMCP, stateless_mode: bool, session_manager: Optional[SessionManager]):
+def register_system_tools(
+    mcp: FastMCP,
+    stateless_mode: bool,
+    session_manager: Optional[SessionManager],
+    session_limiter: Optional[RateLimiter] = None,
+    principal_limiter: Optional[RateLimiter] = None,
+    tool_registry: Optional[ToolRegistry] = None
+):
     """Register system monitoring tools.
     
     Args:
         mcp: FastMCP instance
         stateless_mode: Whether server is in stateless mode
         session_manager: Session manager instance (None in stateless mode)
+        session_limiter: Per-session rate limiter (None if disabled)
+        principal_limiter: Per-principal rate limiter (None if disabled)
+        tool_registry: Registry the tool metadata is reported from
+            (default: the full tool catalog)
     """
+    if tool_registry is None:
+        tool_registry = ToolRegistry.from_catalog()
     
     @mcp.tool
     async def healthProbe(ctx: Context) -> Dict[str, Any]:
@@ -86,17 +103,36 @@ def register_system_tools(mcp: FastMCP, stateless_mode: bool, session_manager: O
             }
         
         # Tool availability
-        result["tools"] = {
-            "total": 21,
-            "categories": {
-                "echo": 2,
-                "debug": 4,
-                "auth": 3,
-                "system": 2,
-                "state": 10
-            },
-            "stateful_only": ["replayLastEcho", "sessionHistory", "sessionTransfer"] if ctx.get_state("stateless_mode") else []
-        }
+        result["tools"] = tool_registry.summary(ctx.get_state("stateless_mode"))
+        
+        # Admission control (the full metrics are in serverMetrics)
+        admission = metrics.collect("admission")
+        if admission:
+            result["admission"] = admission
+            if admission["queue_depth"] > admission["max_queue"] // 2:
+                result["status"] = "degraded"
+                result["warnings"] = result.get("warnings", [])
+                result["warnings"].append("Admission queue more than half full")
+        
+        # Event loop lag and stalls (blocking calls) with the tools behind them
+        event_loop = metrics.collect("event_loop")
+        if event_loop:
+            result["event_loop"] = {
+                "lag_ms": event_loop["lag_ms"],
+                "max_lag_ms": event_loop["max_lag_ms"],
+                "lag_histogram": event_loop["lag_histogram"],
+                "stalls": event_loop["stalls"],
+                "stalls_by_tool": event_loop["stalls_by_tool"]
+            }
+            recent = [stall for stall in event_loop["recent_stalls"] if time.time() - stall["timestamp"] < 60]
+            if recent:
+                worst = max(recent, key=lambda stall: stall["duration_ms"])
+                result["status"] = "degraded"
+                result["warnings"] = result.get("warnings", [])
+                result["warnings"].append(
+                    f"Event loop blocked {len(recent)} time(s) in the last minute "
+                    f"(longest {worst['duration_ms']:.0f}ms in {worst['tool']})"
+                )
         
         # Performance metrics
         request_start = ctx.get_state("request_start_time")
@@ -132,6 +168,23 @@ def register_system_tools(mcp: FastMCP, stateless_mode: bool, session_manager: O
             }
         }
         
+        # Rate limiting decisions for this session and principal
+        if session_limiter or principal_limiter:
+            rate_limit = {}
+            session_id = ctx.get_state("session_id")
+            if session_limiter and session_id:
+                rate_limit["session"] = session_limiter.describe(session_id) or {"message": "No requests counted yet"}
+            if principal_limiter:
+                principal = get_auth_context(ctx).principal_id
+                if principal:
+                    rate_limit["principal"] = {
+                        "id": principal,
+                        **(principal_limiter.describe(principal) or {"message": "No requests counted yet"})
+                    }
+                else:
+                    rate_limit["principal"] = {"message": "Anonymous request, no principal limit applied"}
+            result["rate_limit"] = rate_limit
+        
         if is_stateless:
             # Stateless mode information
             result["session_management"] = {
@@ -146,13 +199,7 @@ def register_system_tools(mcp: FastMCP, stateless_mode: bool, session_manager: O
                 "replay_support": False,
                 "horizontal_scaling": True,
                 "serverless_ready": True,
-                "available_tools": [
-                    "echo", "printHeader", "bearerDecode", "authContext",
-                    "requestTiming", "corsAnalysis", "environmentDump",
-                    "healthProbe", "sessionInfo", "whoIStheGOAT",
-                    "stateInspector", "stateManipulator", "stateBenchmark",
-                    "stateValidator", "requestTracer", "modeDetector"
-                ]
+                "available_tools": tool_registry.available(stateless=True)
             }
         else:
             # Stateful mode information
@@ -227,7 +274,7 @@ def register_system_tools(mcp: FastMCP, stateless_mode: bool, session_manager: O
                 "replay_support": True,
                 "horizontal_scaling": False,
                 "serverless_ready": False,
-                "available_tools": "All 21 tools including stateful-only tools"
+                "available_tools": f"All {tool_registry.total} tools including stateful-only tools"
             }
         
         return result
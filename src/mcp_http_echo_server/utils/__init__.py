@@ -1,6 +1,20 @@
 """Utility modules for MCP Echo Server."""
 
-from .state_adapter import StateAdapter
+from typing import TYPE_CHECKING
+
 from .jwt_decoder import decode_jwt_token
+from .metrics import MetricsRegistry, metrics
+
+__all__ = ["StateAdapter", "decode_jwt_token", "MetricsRegistry", "metrics"]
+
+if TYPE_CHECKING:
+    from .state_adapter import StateAdapter
+
 
-__all__ = ["StateAdapter", "decode_jwt_token"]
\ No newline at end of file
+def __getattr__(name: str):
+    # StateAdapter depends on FastMCP, so it is imported on first access
+    if name == "StateAdapter":
+        from .state_adapter import StateAdapter
+        globals()[name] = StateAdapter
+        return StateAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
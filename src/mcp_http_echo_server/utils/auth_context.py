@@ -0,0 +1,152 @@
+"""Per-request authentication context, computed lazily and shared.
+
+One ``AuthContext`` is created per HTTP request and stored in the ASGI
+scope state, so the rate limiter, the tool middleware and every auth tool
+see the same object. Nothing is parsed until a property is first read,
+and each property is computed at most once per request.
+"""
+
+from functools import cached_property
+from typing import Any, Dict, Mapping, Optional
+
+from .jwt_decoder import decode_jwt_token
+from .jwt_verify import jwt_verifier
+
+# Key of the shared instance in the ASGI scope state / FastMCP context state
+AUTH_CONTEXT_KEY = "auth_context"
+
+# OAuth proxy identity headers -> field names
+OAUTH_HEADER_FIELDS = {
+    "x-user-id": "user_id",
+    "x-user-name": "user_name",
+    "x-auth-token": "auth_token",
+    "x-client-id": "client_id",
+    "x-oauth-client": "oauth_client",
+    "x-auth-user": "auth_user",
+    "x-auth-email": "auth_email",
+}
+
+
+class AuthContext:
+    """Bearer token, JWT claims and OAuth header identity of one request."""
+
+    def __init__(self, headers: Optional[Mapping[str, str]] = None, raw_headers: Optional[list] = None):
+        """Initialize the context (no parsing happens here).
+
+        Args:
+            headers: Request headers with lower-case names
+            raw_headers: ASGI ``(name, value)`` byte pairs, used if headers
+                is not given
+        """
+        self._headers = headers
+        self._raw_headers = raw_headers
+
+    @classmethod
+    def from_scope(cls, scope: Dict[str, Any]) -> "AuthContext":
+        """Create a context for an ASGI HTTP scope."""
+        return cls(raw_headers=scope.get("headers", []))
+
+    @cached_property
+    def headers(self) -> Mapping[str, str]:
+        """Request headers with lower-case names."""
+        if self._headers is not None:
+            return self._headers
+        return {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in self._raw_headers or []}
+
+    @cached_property
+    def authorization(self) -> str:
+        """Raw Authorization header ("" if absent)."""
+        return self.headers.get("authorization", "")
+
+    @cached_property
+    def bearer_token(self) -> Optional[str]:
+        """Token of a Bearer Authorization header, or None."""
+        if self.authorization.lower().startswith("bearer "):
+            return self.authorization[7:]
+        return None
+
+    @cached_property
+    def decoded(self) -> Optional[Dict[str, Any]]:
+        """Decoded bearer JWT (read-only), or None if absent or malformed."""
+        if not self.bearer_token:
+            return None
+        return decode_jwt_token(self.bearer_token)
+
+    @cached_property
+    def verification(self) -> Optional[Dict[str, Any]]:
+        """Signature verification result, or None without a decodable token."""
+        if not self.decoded:
+            return None
+        return jwt_verifier.verify(self.bearer_token)
+
+    @cached_property
+    def claims(self) -> Mapping[str, Any]:
+        """JWT payload claims ({} without a decodable token)."""
+        payload = self.decoded["payload"] if self.decoded else None
+        return payload if isinstance(payload, Mapping) else {}
+
+    @cached_property
+    def oauth_headers(self) -> Dict[str, str]:
+        """OAuth proxy identity headers present on the request, by field name."""
+        return {
+            field: self.headers[header]
+            for header, field in OAUTH_HEADER_FIELDS.items()
+            if self.headers.get(header)
+        }
+
+    @property
+    def user_id(self) -> Optional[str]:
+        """X-User-Id header value."""
+        return self.oauth_headers.get("user_id")
+
+    @property
+    def user_name(self) -> Optional[str]:
+        """X-User-Name header value."""
+        return self.oauth_headers.get("user_name")
+
+    @cached_property
+    def principal_id(self) -> Optional[str]:
+        """JWT subject, else OAuth user ID/name, else None (anonymous)."""
+        subject = self.claims.get("sub")
+        if subject:
+            return str(subject)
+        return self.user_id or self.user_name
+
+    @cached_property
+    def auth_method(self) -> str:
+        """"bearer", "oauth_headers" or "none"."""
+        if self.decoded:
+            return "bearer"
+        if len(self.oauth_headers) > 1 or self.user_id:
+            return "oauth_headers"
+        return "none"
+
+
+def get_scope_auth_context(scope: Dict[str, Any]) -> AuthContext:
+    """Get the request's AuthContext from the ASGI scope, creating it once.
+
+    The instance lives in ``scope["state"]``, which Starlette exposes as
+    ``request.state`` to everything handling the same request.
+    """
+    state = scope.setdefault("state", {})
+    auth = state.get(AUTH_CONTEXT_KEY)
+    if auth is None:
+        auth = state[AUTH_CONTEXT_KEY] = AuthContext.from_scope(scope)
+    return auth
+
+
+def get_auth_context(ctx) -> AuthContext:
+    """Get the AuthContext of a tool call.
+
+    Args:
+        ctx: FastMCP context
+
+    Returns:
+        The instance set by the request middleware, or one built from the
+        captured request headers
+    """
+    auth = ctx.get_state(AUTH_CONTEXT_KEY)
+    if auth is None:
+        auth = AuthContext(ctx.get_state("request_headers") or {})
+        ctx.set_state(AUTH_CONTEXT_KEY, auth)
+    return auth
@@ -0,0 +1,139 @@
+"""Pluggable JSON codec with an optional fast backend.
+
+The stdlib ``json`` module is always available. If ``orjson`` is installed
+(``pip install mcp-http-echo-server[fast]``) it is picked up automatically.
+Set ``MCP_JSON_CODEC=json`` to force the stdlib backend.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class JSONCodec:
+    """Base codec: stdlib json with compact separators."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+        """Serialize an object to a JSON string (``indent``: two spaces per level)."""
+        if indent:
+            return json.dumps(obj, default=default, indent=2, ensure_ascii=False)
+        return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return self.dumps(obj, default=default, indent=indent).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Parse JSON from a string or bytes.
+
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson-backed codec, falling back to stdlib for values orjson rejects."""
+
+    name = "orjson"
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps_bytes(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+        try:
+            return orjson.dumps(obj, default=default, option=self._OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return JSONCodec.dumps(self, obj, default=default, indent=indent).encode("utf-8")
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+        return self.dumps_bytes(obj, default=default, indent=indent).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: Dict[str, type] = {"json": JSONCodec}
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+
+
+def select_codec(name: Optional[str] = None) -> JSONCodec:
+    """Pick a codec by name, or the fastest available one.
+
+    Args:
+        name: "json", "orjson", or "auto"/None for the fastest installed
+
+    Returns:
+        Codec instance
+    """
+    name = (name or os.getenv("MCP_JSON_CODEC", "auto")).lower()
+    if name == "auto":
+        name = "orjson" if "orjson" in CODECS else "json"
+    if name not in CODECS:
+        logger.warning(f"JSON codec '{name}' is not available, using stdlib json")
+        name = "json"
+    return CODECS[name]()
+
+
+# Process-wide codec
+codec = select_codec()
+
+
+def set_codec(name: str) -> JSONCodec:
+    """Switch the process-wide codec (mainly for benchmarks)."""
+    global codec
+    codec = select_codec(name)
+    return codec
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize with the active codec."""
+    return codec.dumps(obj, default=default)
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to bytes with the active codec."""
+    return codec.dumps_bytes(obj, default=default)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse with the active codec."""
+    return codec.loads(data)
+
+
+def _tool_result_default(value: Any) -> Any:
+    """Fallback for values JSON has no type for (as FastMCP: sets as lists, else str)."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def tool_serializer() -> Optional[Callable[[Any], str]]:
+    """FastMCP tool_serializer rendering tool results with the active codec.
+
+    Returns None (keep FastMCP's own serializer) for the stdlib codec, which
+    is not faster than FastMCP's pydantic-core default. Otherwise the result
+    matches the default's layout, compact or indented depending on the
+    installed FastMCP version, so clients see the same text content.
+    """
+    if codec.name == "json":
+        return None
+    from fastmcp.tools.tool import default_serializer
+
+    indent = "\n" in default_serializer({"indent": True})
+
+    def serialize_tool_result(data: Any) -> str:
+        return codec.dumps(data, default=_tool_result_default, indent=indent)
+
+    return serialize_tool_result
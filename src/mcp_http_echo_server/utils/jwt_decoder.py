@@ -1,28 +1,219 @@
-"""JWT token decoder utility (no signature verification)."""
+"""JWT token decoder utility.
+
+Decoded tokens are kept in a bounded LRU cache keyed by a hash of the
+token, since clients send the same bearer token on every request. Entries
+expire at the token's ``exp`` claim. Cached results are shared, so they are
+returned as read-only structures (``FrozenDict`` and tuples); ``thaw``
+gives a plain mutable copy (dicts and lists, as decoded from JSON).
+Signature verification lives in ``jwt_verify``.
+"""
 
 import base64
+import binascii
+import copy
+import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
-import binascii
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import codec
 
 logger = logging.getLogger(__name__)
 
 JWT_PARTS_COUNT = 3
 
+# Default number of decoded tokens kept (MCP_JWT_CACHE_SIZE, 0 disables)
+DEFAULT_JWT_CACHE_SIZE = 1024
+
+
+class FrozenDict(dict):
+    """Read-only dict for cached results shared between requests.
+
+    Still a ``dict`` for serializers (json, orjson, pydantic), but every
+    mutating method raises ``TypeError``. Copies are plain mutable dicts.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached JWT data is read-only; use dict(...) for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert frozen results back to plain dicts and lists."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+class JWTCache:
+    """Bounded LRU cache of decoded tokens, expiring entries at ``exp``.
+
+    Keys are SHA-256 digests, so raw tokens are not kept in memory. Invalid
+    tokens are cached as well (as None) so repeated garbage is cheap.
+    Expired entries are dropped when looked up, and all of them are purged
+    before the least recently used entry is evicted to make room.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_JWT_CACHE_SIZE,
+        expiry: Optional[Callable[[Any], Optional[float]]] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+            expiry: Returns the expiry timestamp of a result (None = no
+                expiry); defaults to the ``exp`` claim of a decoded token
+        """
+        self.max_size = max_size
+        self.expiry = expiry or token_expiry
+        self._entries: "OrderedDict[bytes, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._next_expiry: Optional[float] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Cache key for a token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get_or_decode(self, token: str, decode: Callable[[str], Any]) -> Any:
+        """Return the cached result for a token, decoding it on a miss.
+
+        Args:
+            token: Raw JWT (without "Bearer " prefix), or any string key
+            decode: Called with the token on a miss; its result is frozen
+
+        Returns:
+            Frozen decode result (or None for invalid tokens)
+        """
+        if self.max_size <= 0:
+            return freeze(decode(token))
+
+        key = self.key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+
+        result = freeze(decode(token))
+        expires_at = self.expiry(result)
+        if expires_at is not None and expires_at <= now:
+            # Already expired: nothing to gain from caching it
+            return result
+
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                self._make_room(now)
+            self._entries[key] = (expires_at, result)
+            if expires_at is not None and (self._next_expiry is None or expires_at < self._next_expiry):
+                self._next_expiry = expires_at
+        return result
+
+    def _make_room(self, now: float):
+        """Purge expired entries, or evict the least recently used one."""
+        if self._next_expiry is not None and self._next_expiry <= now:
+            expired = [key for key, (expires_at, _) in self._entries.items()
+                       if expires_at is not None and expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            self.expired += len(expired)
+            remaining = [expires_at for expires_at, _ in self._entries.values() if expires_at is not None]
+            self._next_expiry = min(remaining) if remaining else None
+        if len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._next_expiry = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "expired": self.expired,
+            "evictions": self.evictions
+        }
+
+
+def token_expiry(decoded: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Get the numeric ``exp`` claim of a decoded token, if any."""
+    if not decoded:
+        return None
+    exp = decoded["payload"].get("exp") if isinstance(decoded["payload"], dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+# Process-wide cache
+jwt_cache = JWTCache(int(os.getenv("MCP_JWT_CACHE_SIZE", str(DEFAULT_JWT_CACHE_SIZE))))
+
 
 def decode_jwt_token(
     token: str,
-    verify_signature: bool = False
+    verify_signature: bool = False,
+    use_cache: bool = True
 ) -> Optional[Dict[str, Any]]:
-    """Decode a JWT token without signature verification.
+    """Decode a JWT token, optionally requiring a valid signature.
     
     Args:
         token: JWT token string
-        verify_signature: Whether to verify signature (not implemented)
+        verify_signature: Only return tokens whose signature verifies
+            against the configured JWKS keys (see ``jwt_verify``)
+        use_cache: Look the token up in the process-wide cache
         
     Returns:
-        Decoded token data or None if invalid
+        Decoded token data or None if invalid; read-only when cached,
+        plain dicts and lists otherwise
     """
     if not token:
         return None
@@ -31,6 +222,20 @@ def decode_jwt_token(
     if token.lower().startswith("bearer "):
         token = token[7:]
     
+    if use_cache:
+        decoded = jwt_cache.get_or_decode(token, _decode_jwt_token)
+    else:
+        decoded = _decode_jwt_token(token)
+    
+    if decoded and verify_signature:
+        from .jwt_verify import jwt_verifier
+        if not jwt_verifier.verify(token)["valid"]:
+            return None
+    return decoded
+
+
+def _decode_jwt_token(token: str) -> Optional[Dict[str, Any]]:
+    """Decode a JWT (without "Bearer " prefix), uncached."""
     try:
         # Split JWT parts
         parts = token.split(".")
@@ -41,15 +246,14 @@ def decode_jwt_token(
         # Decode header
         header_data = parts[0]
         header_padded = header_data + "=" * (4 - len(header_data) % 4)
-        header_json = json.loads(base64.urlsafe_b64decode(header_padded))
+        header_json = codec.loads(base64.urlsafe_b64decode(header_padded))
         
         # Decode payload
         payload_data = parts[1]
         payload_padded = payload_data + "=" * (4 - len(payload_data) % 4)
-        payload_json = json.loads(base64.urlsafe_b64decode(payload_padded))
+        payload_json = codec.loads(base64.urlsafe_b64decode(payload_padded))
         
-        # Note: We don't verify the signature (parts[2])
-        # This is intentional for debugging purposes
+        # The signature (parts[2]) is only checked on request, by jwt_verify
         
         return {
             "header": header_json,
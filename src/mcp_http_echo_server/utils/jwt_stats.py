@@ -0,0 +1,148 @@
+"""Per-token classification and aggregated claim statistics for JWT batches."""
+
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from .jwt_decoder import decode_jwt_token
+
+
+def parse_token_list(tokens: Optional[Iterable[str]] = None, text: str = "") -> List[str]:
+    """Collect tokens from a list and/or newline-separated text.
+
+    Blank lines are skipped and "Bearer " prefixes removed.
+    """
+    tokens = list(tokens or [])
+    if text:
+        tokens.extend(text.splitlines())
+    result = []
+    for token in tokens:
+        token = token.strip()
+        if token.lower().startswith("bearer "):
+            token = token[7:].strip()
+        if token:
+            result.append(token)
+    return result
+
+
+def classify_token(token: str, now: Optional[float] = None, verify: bool = False) -> Dict[str, Any]:
+    """Decode one token (through the shared cache) into a compact record.
+
+    Args:
+        token: Raw JWT
+        now: Reference time for expiry checks (default: current time)
+        verify: Add the signature verification status
+
+    Returns:
+        Record with status ("ok" or "malformed"), algorithm, issuer,
+        subject, audience, scopes, expiry and timing flags
+    """
+    decoded = decode_jwt_token(token)
+    if not decoded or not isinstance(decoded["payload"], dict) or not isinstance(decoded["header"], dict):
+        return {"status": "malformed"}
+
+    now = time.time() if now is None else now
+    payload = decoded["payload"]
+    exp = payload.get("exp")
+    nbf = payload.get("nbf")
+    has_exp = isinstance(exp, (int, float)) and not isinstance(exp, bool)
+
+    audience = payload.get("aud")
+    if audience is None:
+        audiences = ()
+    elif isinstance(audience, (list, tuple)):
+        audiences = tuple(str(a) for a in audience)
+    else:
+        audiences = (str(audience),)
+
+    scopes = payload.get("scope", payload.get("scp"))
+    if isinstance(scopes, str):
+        scopes = tuple(scopes.split())
+    elif isinstance(scopes, (list, tuple)):
+        scopes = tuple(str(s) for s in scopes)
+    else:
+        scopes = ()
+
+    record = {
+        "status": "ok",
+        "algorithm": decoded["header"].get("alg"),
+        "issuer": payload.get("iss"),
+        "subject": payload.get("sub"),
+        "audiences": audiences,
+        "scopes": scopes,
+        "exp": exp if has_exp else None,
+        "expired": has_exp and exp < now,
+        "not_yet_valid": isinstance(nbf, (int, float)) and nbf > now,
+    }
+    if verify:
+        from .jwt_verify import jwt_verifier
+        record["signature"] = jwt_verifier.verify(token)["status"]
+    return record
+
+
+class TokenBatchStats:
+    """Aggregates token records incrementally."""
+
+    def __init__(self):
+        self.total = 0
+        self.malformed = 0
+        self.expired = 0
+        self.not_yet_valid = 0
+        self.active = 0
+        self.without_exp = 0
+        self.issuers: Counter = Counter()
+        self.audiences: Counter = Counter()
+        self.scopes: Counter = Counter()
+        self.algorithms: Counter = Counter()
+        self.signatures: Counter = Counter()
+        self.subjects = set()
+        self.earliest_exp: Optional[float] = None
+        self.latest_exp: Optional[float] = None
+
+    def add(self, record: Dict[str, Any]):
+        """Count one record from ``classify_token``."""
+        self.total += 1
+        if record["status"] != "ok":
+            self.malformed += 1
+            return
+
+        self.algorithms[str(record["algorithm"])] += 1
+        self.issuers[str(record["issuer"])] += 1
+        self.audiences.update(record["audiences"])
+        self.scopes.update(record["scopes"])
+        if record["subject"] is not None:
+            self.subjects.add(str(record["subject"]))
+        if "signature" in record:
+            self.signatures[record["signature"]] += 1
+
+        self.expired += record["expired"]
+        self.not_yet_valid += record["not_yet_valid"]
+        self.active += not record["expired"] and not record["not_yet_valid"]
+        exp = record["exp"]
+        if exp is None:
+            self.without_exp += 1
+        else:
+            self.earliest_exp = exp if self.earliest_exp is None else min(self.earliest_exp, exp)
+            self.latest_exp = exp if self.latest_exp is None else max(self.latest_exp, exp)
+
+    def to_dict(self, top: int = 20) -> Dict[str, Any]:
+        """Summary with the ``top`` most common values per distribution."""
+        decoded = self.total - self.malformed
+        result = {
+            "total": self.total,
+            "decoded": decoded,
+            "malformed": self.malformed,
+            "expired": self.expired,
+            "active": self.active,
+            "not_yet_valid": self.not_yet_valid,
+            "without_exp": self.without_exp,
+            "unique_subjects": len(self.subjects),
+            "algorithms": dict(self.algorithms.most_common(top)),
+            "issuers": dict(self.issuers.most_common(top)),
+            "audiences": dict(self.audiences.most_common(top)),
+            "scopes": dict(self.scopes.most_common(top)),
+            "expiry_range": {"earliest": self.earliest_exp, "latest": self.latest_exp},
+        }
+        if self.signatures:
+            result["signatures"] = dict(self.signatures)
+        return result
@@ -0,0 +1,359 @@
+"""JWT signature verification against a local JWKS file.
+
+HMAC algorithms (HS256/384/512) use the stdlib. RSA (RS*, PS*) and EC (ES*)
+algorithms need the optional ``cryptography`` package (``pip install
+mcp-http-echo-server[jwt]``) and are reported as unsupported without it.
+
+Keys come from a JWKS file (``MCP_JWKS_FILE`` or ``--jwks-file``) that is
+re-read whenever it changes on disk. Verification results are cached per
+token until the token expires, keyed together with the key set generation
+so a key rotation re-verifies every token.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .jwt_decoder import DEFAULT_JWT_CACHE_SIZE, FrozenDict, JWTCache, decode_jwt_token
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+    from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+except ImportError:  # pragma: no cover - optional dependency
+    hashes = None
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between checks of the JWKS file for changes
+JWKS_CHECK_INTERVAL = 1.0
+
+HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Asymmetric algorithm -> (key type, hash name, EC curve)
+ASYMMETRIC_ALGORITHMS = {
+    "RS256": ("RSA", "SHA256", None),
+    "RS384": ("RSA", "SHA384", None),
+    "RS512": ("RSA", "SHA512", None),
+    "PS256": ("RSA", "SHA256", None),
+    "PS384": ("RSA", "SHA384", None),
+    "PS512": ("RSA", "SHA512", None),
+    "ES256": ("EC", "SHA256", "P-256"),
+    "ES384": ("EC", "SHA384", "P-384"),
+    "ES512": ("EC", "SHA512", "P-521"),
+}
+
+# Raw JWS signature length (r || s) per curve
+EC_SIGNATURE_SIZES = {"P-256": 64, "P-384": 96, "P-521": 132}
+
+EC_CURVES = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1, "P-521": ec.SECP521R1} if hashes else {}
+
+SUPPORTED_ALGORITHMS = tuple(HMAC_ALGORITHMS) + (tuple(ASYMMETRIC_ALGORITHMS) if hashes else ())
+
+
+class VerificationKey(NamedTuple):
+    """One usable key from the JWKS file."""
+
+    kid: Optional[str]
+    kty: str
+    alg: Optional[str]
+    crv: Optional[str]
+    key: Any  # bytes for "oct", a cryptography public key otherwise
+
+
+def b64url_decode(data: str) -> bytes:
+    """Decode unpadded base64url."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _b64url_int(data: str) -> int:
+    return int.from_bytes(b64url_decode(data), "big")
+
+
+def parse_jwk(jwk: Dict[str, Any]) -> Optional[VerificationKey]:
+    """Convert one JWK to a verification key.
+
+    Args:
+        jwk: JWK dict
+
+    Returns:
+        The key, or None if it is not a signing key this server can use
+
+    Raises:
+        ValueError: If the JWK is malformed
+    """
+    if not isinstance(jwk, dict):
+        raise ValueError(f"Invalid JWK: expected an object, got {type(jwk).__name__}")
+    if jwk.get("use", "sig") != "sig":
+        return None
+    kty = jwk.get("kty")
+    kid = jwk.get("kid")
+    alg = jwk.get("alg")
+    try:
+        if kty == "oct":
+            return VerificationKey(kid, kty, alg, None, b64url_decode(jwk["k"]))
+        if hashes is None or kty not in ("RSA", "EC"):
+            return None
+        if kty == "RSA":
+            public_key = rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+            return VerificationKey(kid, kty, alg, None, public_key)
+        curve = EC_CURVES.get(jwk.get("crv"))
+        if curve is None:
+            return None
+        public_key = ec.EllipticCurvePublicNumbers(
+            _b64url_int(jwk["x"]), _b64url_int(jwk["y"]), curve()
+        ).public_key()
+        return VerificationKey(kid, kty, alg, jwk["crv"], public_key)
+    except (KeyError, TypeError, ValueError, binascii.Error) as e:
+        raise ValueError(f"Invalid JWK {kid or kty!r}: {e}") from e
+
+
+class JWKSKeys:
+    """Keys from a JWKS file, reloaded when the file changes."""
+
+    def __init__(self, path: Optional[str] = None, check_interval: float = JWKS_CHECK_INTERVAL):
+        """Initialize the key set.
+
+        Args:
+            path: JWKS file path (None = no keys)
+            check_interval: Minimum seconds between file change checks
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.keys: Tuple[VerificationKey, ...] = ()
+        self.generation = 0
+        self.reloads = 0
+        self.load_error: Optional[str] = None
+        self._signature: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Reload the file if it changed (at most once per check interval)."""
+        if not self.path:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                stat = os.stat(self.path)
+            except OSError as e:
+                self._set_error(f"Cannot read JWKS file: {e}")
+                return
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature != self._signature:
+                self._signature = signature
+                self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                jwks = json.load(f)
+            entries = jwks["keys"] if isinstance(jwks, dict) and "keys" in jwks else [jwks]
+            keys = []
+            for entry in entries:
+                key = parse_jwk(entry)
+                if key is not None:
+                    keys.append(key)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Keep serving the previous keys
+            self._set_error(f"Cannot load JWKS file: {e}")
+            return
+        self.keys = tuple(keys)
+        self.generation += 1
+        self.reloads += 1
+        self.load_error = None
+        logger.info(f"Loaded {len(keys)} JWT verification key(s) from {self.path}")
+
+    def _set_error(self, error: str):
+        if error != self.load_error:
+            logger.error(error)
+        self.load_error = error
+
+    def find(self, alg: str, kid: Optional[str] = None) -> List[VerificationKey]:
+        """Keys usable for an algorithm (and key ID, if the token names one)."""
+        if alg in HMAC_ALGORITHMS:
+            kty, curve = "oct", None
+        else:
+            kty, _, curve = ASYMMETRIC_ALGORITHMS[alg]
+        return [
+            key for key in self.keys
+            if key.kty == kty
+            and (kid is None or key.kid == kid)
+            and (key.alg is None or key.alg == alg)
+            and (curve is None or key.crv == curve)
+        ]
+
+
+def verify_signature(alg: str, key: VerificationKey, signing_input: bytes, signature: bytes) -> bool:
+    """Check one signature with one key."""
+    if alg in HMAC_ALGORITHMS:
+        expected = hmac.new(key.key, signing_input, HMAC_ALGORITHMS[alg]).digest()
+        return hmac.compare_digest(expected, signature)
+
+    kty, hash_name, curve = ASYMMETRIC_ALGORITHMS[alg]
+    algorithm = getattr(hashes, hash_name)()
+    try:
+        if kty == "RSA":
+            if alg.startswith("PS"):
+                pad = padding.PSS(mgf=padding.MGF1(algorithm), salt_length=algorithm.digest_size)
+            else:
+                pad = padding.PKCS1v15()
+            key.key.verify(signature, signing_input, pad, algorithm)
+        else:
+            # JWS carries raw r || s, cryptography expects DER
+            if len(signature) != EC_SIGNATURE_SIZES[curve]:
+                return False
+            size = len(signature) // 2
+            der = encode_dss_signature(
+                int.from_bytes(signature[:size], "big"),
+                int.from_bytes(signature[size:], "big")
+            )
+            key.key.verify(der, signing_input, ec.ECDSA(algorithm))
+        return True
+    except (InvalidSignature, ValueError):
+        return False
+
+
+class JWTVerifier:
+    """Verifies JWT signatures with a cache of results until token expiry."""
+
+    def __init__(self, jwks_file: Optional[str] = None, cache_size: int = DEFAULT_JWT_CACHE_SIZE):
+        """Initialize the verifier.
+
+        Args:
+            jwks_file: JWKS file path (None = verification reports no keys)
+            cache_size: Verification results kept (0 disables caching)
+        """
+        self.keys = JWKSKeys(jwks_file)
+        self.cache = JWTCache(cache_size, expiry=lambda result: result["expires_at"])
+        self.verifications = 0
+        self.valid = 0
+        self.invalid = 0
+        self.verify_seconds = 0.0
+        self._by_algorithm: Dict[str, List[float]] = {}
+        # Counters are also updated from bearerDecodeBatch worker threads
+        self._lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        """Whether a JWKS file is set."""
+        return bool(self.keys.path)
+
+    def set_jwks_file(self, path: Optional[str]):
+        """Use a different JWKS file (cached results are dropped)."""
+        self.keys = JWKSKeys(path)
+        self.cache.clear()
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Verify a token's signature.
+
+        Args:
+            token: Raw JWT (without "Bearer " prefix)
+
+        Returns:
+            Read-only result with ``valid``, ``status`` ("valid",
+            "invalid_signature", "unknown_key", "no_keys",
+            "unsupported_algorithm" or "malformed"), ``algorithm``,
+            ``kid`` and ``expires_at``
+        """
+        self.keys.refresh()
+        key = f"{self.keys.generation}:{token}"
+        return self.cache.get_or_decode(key, lambda _: self._verify(token))
+
+    def _verify(self, token: str) -> Dict[str, Any]:
+        decoded = decode_jwt_token(token)
+        if not decoded or not isinstance(decoded["header"], dict):
+            return self._result("malformed")
+
+        header = decoded["header"]
+        alg = header.get("alg")
+        kid = header.get("kid")
+        payload = decoded["payload"]
+        exp = payload.get("exp") if isinstance(payload, dict) else None
+        expires_at = float(exp) if isinstance(exp, (int, float)) and not isinstance(exp, bool) else None
+
+        if alg not in SUPPORTED_ALGORITHMS:
+            return self._result("unsupported_algorithm", alg, kid, expires_at)
+        if not self.keys.keys:
+            return self._result("no_keys", alg, kid, expires_at)
+        candidates = self.keys.find(alg, kid)
+        if not candidates:
+            return self._result("unknown_key", alg, kid, expires_at)
+
+        signing_input, _, encoded_signature = token.rpartition(".")
+        try:
+            signature = b64url_decode(encoded_signature)
+        except (ValueError, binascii.Error):
+            return self._result("malformed", alg, kid, expires_at)
+
+        start = time.perf_counter()
+        valid = any(verify_signature(alg, key, signing_input.encode("ascii"), signature) for key in candidates)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.verifications += 1
+            self.verify_seconds += elapsed
+            timings = self._by_algorithm.setdefault(alg, [0, 0.0])
+            timings[0] += 1
+            timings[1] += elapsed
+            if valid:
+                self.valid += 1
+            else:
+                self.invalid += 1
+        return self._result("valid" if valid else "invalid_signature", alg, kid, expires_at)
+
+    @staticmethod
+    def _result(status: str, alg: Any = None, kid: Any = None, expires_at: Optional[float] = None) -> Dict[str, Any]:
+        return FrozenDict({
+            "valid": status == "valid",
+            "status": status,
+            "algorithm": alg,
+            "kid": kid,
+            "expires_at": expires_at
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get verification statistics."""
+        with self._lock:
+            by_algorithm = {
+                alg: {"count": count, "avg_verify_us": round(total / count * 1e6, 1)}
+                for alg, (count, total) in self._by_algorithm.items()
+            }
+        return {
+            "jwks_file": self.keys.path,
+            "keys": len(self.keys.keys),
+            "key_generation": self.keys.generation,
+            "reloads": self.keys.reloads,
+            "load_error": self.keys.load_error,
+            "algorithms": list(SUPPORTED_ALGORITHMS),
+            "verifications": self.verifications,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "avg_verify_us": round(self.verify_seconds / self.verifications * 1e6, 1) if self.verifications else None,
+            "by_algorithm": by_algorithm,
+            "cache": self.cache.get_stats()
+        }
+
+
+# Process-wide verifier
+jwt_verifier = JWTVerifier(
+    os.getenv("MCP_JWKS_FILE") or None,
+    int(os.getenv("MCP_JWT_CACHE_SIZE", str(DEFAULT_JWT_CACHE_SIZE)))
+)
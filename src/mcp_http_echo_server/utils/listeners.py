@@ -0,0 +1,77 @@
+"""Listening socket selection for the HTTP transports.
+
+Besides host/port the server can listen on a Unix domain socket (for a
+local sidecar proxy, skipping the TCP loopback stack) or on an already
+bound socket inherited as a file descriptor, either passed explicitly or
+through systemd socket activation (``LISTEN_FDS``).
+"""
+
+import logging
+import os
+import socket
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# First file descriptor passed by systemd socket activation (SD_LISTEN_FDS_START)
+SD_LISTEN_FDS_START = 3
+
+
+def systemd_listen_fd() -> Optional[int]:
+    """Get the socket passed by systemd socket activation, if any.
+
+    The activation variables are removed from the environment once read so
+    child processes do not try to claim the same socket.
+
+    Returns:
+        File descriptor of the first passed socket, or None
+    """
+    if os.getenv("LISTEN_PID") != str(os.getpid()):
+        return None
+    try:
+        count = int(os.getenv("LISTEN_FDS", "0"))
+    except ValueError:
+        return None
+
+    for name in ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"):
+        os.environ.pop(name, None)
+
+    if count < 1:
+        return None
+    if count > 1:
+        logger.warning(f"systemd passed {count} sockets, listening on the first only")
+    return SD_LISTEN_FDS_START
+
+
+def socket_from_fd(fd: int) -> socket.socket:
+    """Wrap an inherited listening socket.
+
+    The address family (TCP or Unix) is detected from the descriptor.
+
+    Args:
+        fd: File descriptor of a bound, listening stream socket
+
+    Returns:
+        Non-blocking socket object owning the descriptor
+
+    Raises:
+        ValueError: If the descriptor is not a stream socket
+    """
+    try:
+        sock = socket.socket(fileno=fd)
+    except OSError as e:
+        raise ValueError(f"File descriptor {fd} is not a socket: {e}") from e
+    if sock.type != socket.SOCK_STREAM:
+        sock.detach()
+        raise ValueError(f"File descriptor {fd} is not a stream socket")
+    sock.setblocking(False)
+    return sock
+
+
+def describe_listener(host: str, port: int, uds: Optional[str] = None, fd: Optional[int] = None) -> str:
+    """Human readable listening address for startup messages."""
+    if uds:
+        return f"unix:{uds}"
+    if fd is not None:
+        return f"fd:{fd}"
+    return f"{host}:{port}"
@@ -0,0 +1,246 @@
+"""Event loop lag monitor with blocking-call detection.
+
+Two independent probes:
+
+- A background task sleeps for ``interval`` and records how much later
+  than requested it woke up (the lag, also kept as a histogram).
+- A watchdog thread pings the loop with ``call_soon_threadsafe`` and,
+  when the ping has not run after ``slow_callback_threshold`` seconds,
+  treats the loop as blocked: it notes which tool the running task is
+  executing and the loop thread's stack at that moment, then waits for
+  the ping to measure how long the stall lasted.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .metrics import metrics
+from .profiler import collapse_stack
+
+logger = logging.getLogger(__name__)
+
+# How often the loop is sampled (seconds)
+DEFAULT_SAMPLE_INTERVAL = 0.5
+
+# Weight of the newest sample in the lag moving average
+LAG_EWMA_ALPHA = 0.3
+
+# Upper bounds (seconds) of the lag histogram buckets; larger lags land in
+# a final overflow bucket
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# A loop that does not run a ping for this long is blocked (seconds, 0 disables)
+DEFAULT_SLOW_CALLBACK_THRESHOLD = 0.1
+
+# Stalls kept with their stack for inspection
+MAX_RECENT_STALLS = 10
+
+# Frames kept of a stalled stack (leaf end)
+STALL_STACK_DEPTH = 24
+
+# Attribution of stalls outside any tool call
+NO_TOOL = "(none)"
+
+
+def bucket_label(bound: float) -> str:
+    """Histogram bucket label, e.g. ``le_25ms``."""
+    return f"le_{bound * 1000:g}ms"
+
+
+class LoopLagMonitor:
+    """Measures event loop lag and detects blocking callbacks.
+
+    The latest values are kept as plain attributes so readers (health
+    routes, metrics) never do any work.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        slow_callback_threshold: float = DEFAULT_SLOW_CALLBACK_THRESHOLD
+    ):
+        """Initialize the monitor.
+
+        Args:
+            interval: Sampling interval in seconds
+            slow_callback_threshold: Seconds without a ping running after
+                which the loop counts as blocked (0 disables the watchdog)
+        """
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.lag = 0.0
+        self.lag_ewma = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self.histogram = [0] * (len(LAG_BUCKETS) + 1)
+
+        self.stalls = 0
+        self.stalled_seconds = 0.0
+        self.last_stall: Optional[Dict[str, Any]] = None
+        self.recent_stalls: Deque[Dict[str, Any]] = deque(maxlen=MAX_RECENT_STALLS)
+        self.stalls_by_tool: Dict[str, Dict[str, float]] = {}
+        self._tools: Dict[asyncio.Task, str] = {}
+        self._stall_lock = threading.Lock()
+
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._watchdog_stop = threading.Event()
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def add_listener(self, listener: Callable[[], None]):
+        """Register a callable invoked after every sample."""
+        self._listeners.append(listener)
+
+    def start(self):
+        """Start sampling on the running event loop (no-op if already running)."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._task = loop.create_task(self._run())
+        if self.slow_callback_threshold > 0:
+            self._watchdog_stop.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="mcp-echo-loop-watchdog",
+                daemon=True
+            )
+            self._watchdog.start()
+        logger.debug(
+            f"Started event loop monitor (interval={self.interval}s, "
+            f"slow_callback_threshold={self.slow_callback_threshold}s)"
+        )
+
+    async def stop(self):
+        """Stop sampling and the watchdog."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog:
+            self._watchdog_stop.set()
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - start - self.interval))
+
+    def record(self, lag: float):
+        """Record one lag sample and notify listeners."""
+        self.lag = lag
+        self.lag_ewma += LAG_EWMA_ALPHA * (lag - self.lag_ewma)
+        self.max_lag = max(self.max_lag, lag)
+        self.samples += 1
+        for index, bound in enumerate(LAG_BUCKETS):
+            if lag <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+        for listener in self._listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Event loop monitor listener failed: {e}")
+
+    @contextlib.contextmanager
+    def track_tool(self, name: str) -> Iterator[None]:
+        """Attribute stalls of the current task to tool ``name`` while inside."""
+        task = asyncio.current_task()
+        if task is None:
+            yield
+            return
+        self._tools[task] = name
+        try:
+            yield
+        finally:
+            self._tools.pop(task, None)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread: int):
+        """Watchdog thread: ping the loop and catch it blocked."""
+        threshold = self.slow_callback_threshold
+        while not self._watchdog_stop.wait(threshold):
+            ran = threading.Event()
+            start = time.monotonic()
+            try:
+                loop.call_soon_threadsafe(ran.set)
+            except RuntimeError:
+                # Loop closed
+                return
+            if ran.wait(threshold):
+                continue
+
+            # Blocked: look at what the loop thread is running right now
+            try:
+                task = asyncio.current_task(loop)
+            except RuntimeError:
+                task = None
+            tool = self._tools.get(task, NO_TOOL) if task is not None else NO_TOOL
+            frame = sys._current_frames().get(loop_thread)
+            stack = collapse_stack(frame, STALL_STACK_DEPTH) if frame is not None else ""
+            del frame
+
+            while not ran.wait(threshold):
+                if self._watchdog_stop.is_set():
+                    return
+            self._record_stall(time.monotonic() - start, tool, stack)
+
+    def _record_stall(self, duration: float, tool: str, stack: str):
+        """Record one blocked period (called from the watchdog thread)."""
+        stall = {
+            "timestamp": time.time(),
+            "duration_ms": round(duration * 1000, 3),
+            "tool": tool,
+            "stack": stack,
+        }
+        with self._stall_lock:
+            self.stalls += 1
+            self.stalled_seconds += duration
+            self.last_stall = stall
+            self.recent_stalls.append(stall)
+            by_tool = self.stalls_by_tool.setdefault(tool, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            by_tool["count"] += 1
+            by_tool["total_ms"] = round(by_tool["total_ms"] + stall["duration_ms"], 3)
+            by_tool["max_ms"] = max(by_tool["max_ms"], stall["duration_ms"])
+        metrics.increment("event_loop.stalls")
+        metrics.increment(f"event_loop.stalls.{tool}")
+        leaf = stack.rsplit(";", 1)[-1] if stack else "unknown"
+        logger.warning(f"Event loop blocked for {stall['duration_ms']:.0f}ms (tool: {tool}, at: {leaf})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get lag statistics, the lag histogram and detected stalls."""
+        histogram = {bucket_label(bound): count for bound, count in zip(LAG_BUCKETS, self.histogram)}
+        histogram[f"gt_{LAG_BUCKETS[-1] * 1000:g}ms"] = self.histogram[-1]
+        with self._stall_lock:
+            stalls_by_tool = {tool: dict(stats) for tool, stats in self.stalls_by_tool.items()}
+            recent_stalls = list(self.recent_stalls)
+        return {
+            "running": self.running,
+            "interval_ms": round(self.interval * 1000, 1),
+            "lag_ms": round(self.lag * 1000, 3),
+            "lag_ewma_ms": round(self.lag_ewma * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "samples": self.samples,
+            "lag_histogram": histogram,
+            "slow_callback_threshold_ms": round(self.slow_callback_threshold * 1000, 1),
+            "stalls": self.stalls,
+            "stalled_ms": round(self.stalled_seconds * 1000, 3),
+            "stalls_by_tool": stalls_by_tool,
+            "recent_stalls": recent_stalls
+        }
@@ -0,0 +1,180 @@
+"""Labelled tracemalloc snapshots for memory-leak hunting.
+
+tracemalloc is started only on request and stopped again afterwards, so
+allocation tracing costs nothing until someone is looking. Snapshots are
+kept by label; the top allocation sites of one snapshot and the growth
+between two are grouped by line (``lineno``), file (``filename``) or full
+stack (``traceback``).
+"""
+
+import asyncio
+import logging
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+DEFAULT_FRAMES = 1
+MAX_FRAMES = 25
+DEFAULT_TOP = 20
+
+# Snapshots hold every trace; the oldest is dropped beyond this
+MAX_SNAPSHOTS = 10
+
+# Allocations of tracemalloc itself and the import system are noise
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def format_traceback(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    """Location label of a statistic: file, file:line or a stack of those."""
+    if group_by == "filename":
+        return traceback[0].filename
+    return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in traceback)
+
+
+class MemorySnapshots:
+    """Starts tracemalloc on demand and keeps labelled snapshots."""
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS):
+        self.max_snapshots = max_snapshots
+        self.snapshots: "OrderedDict[str, Tuple[float, tracemalloc.Snapshot]]" = OrderedDict()
+        self.started_at: Optional[float] = None
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = DEFAULT_FRAMES) -> Dict[str, Any]:
+        """Start tracing allocations with ``frames`` frames per trace."""
+        if not 1 <= frames <= MAX_FRAMES:
+            raise ValueError(f"frames must be between 1 and {MAX_FRAMES}")
+        if not self.tracing:
+            tracemalloc.start(frames)
+            self.started_at = time.time()
+            logger.warning(f"tracemalloc started with {frames} frame(s)")
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop tracing and drop all snapshots (frees their memory)."""
+        if self.tracing:
+            tracemalloc.stop()
+            logger.warning("tracemalloc stopped")
+        self.snapshots.clear()
+        self.started_at = None
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        """Tracing state, traced memory and stored snapshots."""
+        result = {
+            "tracing": self.tracing,
+            "snapshots": [
+                {"label": label, "taken_at": taken_at, "traces": len(snapshot.traces)}
+                for label, (taken_at, snapshot) in self.snapshots.items()
+            ],
+        }
+        if self.tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            result.update({
+                "frames": tracemalloc.get_traceback_limit(),
+                "started_at": self.started_at,
+                "traced_bytes": current,
+                "traced_peak_bytes": peak,
+                "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            })
+        return result
+
+    async def take(self, label: str = "") -> Dict[str, Any]:
+        """Take a snapshot under ``label`` (default: snapshot-N)."""
+        if not self.tracing:
+            raise ValueError("tracemalloc is not running; start it first")
+        label = label or f"snapshot-{len(self.snapshots) + 1}"
+        snapshot = await asyncio.to_thread(lambda: tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS))
+        self.snapshots.pop(label, None)
+        self.snapshots[label] = (time.time(), snapshot)
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        return {
+            "label": label,
+            "traces": len(snapshot.traces),
+            "size_bytes": sum(trace.size for trace in snapshot.traces),
+        }
+
+    def _get(self, label: str, offset: int = 1) -> Tuple[str, tracemalloc.Snapshot]:
+        """Snapshot by label, or the ``offset``-th most recent one."""
+        if label:
+            if label not in self.snapshots:
+                raise ValueError(f"Unknown snapshot '{label}'. Snapshots: {', '.join(self.snapshots) or 'none'}")
+            return label, self.snapshots[label][1]
+        labels = list(self.snapshots)
+        if len(labels) < offset:
+            raise ValueError(f"Need at least {offset} snapshot(s), have {len(labels)}")
+        label = labels[-offset]
+        return label, self.snapshots[label][1]
+
+    @staticmethod
+    def _check_group_by(group_by: str):
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Invalid group_by '{group_by}'. Use one of: {', '.join(GROUP_BY)}")
+
+    async def top(self, label: str = "", limit: int = DEFAULT_TOP, group_by: str = "lineno") -> Dict[str, Any]:
+        """Largest allocation sites of a snapshot (default: the latest)."""
+        self._check_group_by(group_by)
+        label, snapshot = self._get(label)
+        stats = await asyncio.to_thread(snapshot.statistics, group_by)
+        return {
+            "label": label,
+            "group_by": group_by,
+            "total_bytes": sum(stat.size for stat in stats),
+            "top": [
+                {
+                    "location": format_traceback(stat.traceback, group_by),
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                    "average_bytes": stat.size // stat.count if stat.count else 0,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    async def diff(self, label: str = "", compare_to: str = "", limit: int = DEFAULT_TOP,
+                   group_by: str = "lineno") -> Dict[str, Any]:
+        """Growth between two snapshots (default: the latest vs the one before)."""
+        self._check_group_by(group_by)
+        new_label, new = self._get(label)
+        old_label, old = self._get(compare_to, offset=2)
+        if old_label == new_label:
+            raise ValueError("Cannot compare a snapshot with itself")
+        stats: List[tracemalloc.StatisticDiff] = await asyncio.to_thread(new.compare_to, old, group_by)
+        return {
+            "label": new_label,
+            "compare_to": old_label,
+            "group_by": group_by,
+            "size_diff_bytes": sum(stat.size_diff for stat in stats),
+            "count_diff": sum(stat.count_diff for stat in stats),
+            "top": [
+                {
+                    "location": format_traceback(stat.traceback, group_by),
+                    "size_diff_bytes": stat.size_diff,
+                    "size_bytes": stat.size,
+                    "count_diff": stat.count_diff,
+                    "count": stat.count,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracing statistics for metrics."""
+        result = {"tracing": self.tracing, "snapshots": len(self.snapshots)}
+        if self.tracing:
+            result["traced_bytes"] = tracemalloc.get_traced_memory()[0]
+        return result
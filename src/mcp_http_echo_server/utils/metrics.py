@@ -0,0 +1,78 @@
+"""In-process metrics registry shared by middleware and tools."""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsRegistry:
+    """Collects counters and pluggable stat collectors.
+    
+    Counters are plain dotted names (e.g. ``admission.rejected.timeout``).
+    Components that already keep their own statistics register a collector
+    callable instead, which is only evaluated when a snapshot is taken.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._counters: Dict[str, float] = defaultdict(int)
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def increment(self, name: str, value: float = 1):
+        """Increment a counter.
+        
+        Args:
+            name: Counter name
+            value: Amount to add (default: 1)
+        """
+        with self._lock:
+            self._counters[name] += value
+    
+    def get(self, name: str) -> float:
+        """Get the current value of a counter."""
+        return self._counters.get(name, 0)
+    
+    def register_collector(self, name: str, collector: Callable[[], Dict[str, Any]]):
+        """Register a callable that returns a stats dict for snapshots.
+        
+        Args:
+            name: Section name in the snapshot
+            collector: Zero-argument callable returning a dict
+        """
+        self._collectors[name] = collector
+    
+    def unregister_collector(self, name: str):
+        """Remove a previously registered collector."""
+        self._collectors.pop(name, None)
+    
+    def collect(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return one collector's output (None if no such collector)."""
+        collector = self._collectors.get(name)
+        if collector is None:
+            return None
+        try:
+            return collector()
+        except Exception as e:
+            logger.error(f"Metrics collector {name} failed: {e}")
+            return {"error": str(e)}
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all counters and collector output."""
+        with self._lock:
+            counters = dict(sorted(self._counters.items()))
+        
+        sections = {name: self.collect(name) for name in list(self._collectors)}
+        return {"counters": counters, **sections}
+    
+    def reset(self):
+        """Reset all counters (collectors are kept)."""
+        with self._lock:
+            self._counters.clear()
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,205 @@
+"""On-demand CPU profiling of the running server.
+
+Two profilers, one session at a time:
+
+- ``sample``: a side thread reads ``sys._current_frames()`` every
+  ``interval`` seconds and counts the event loop thread's stacks. Overhead
+  is one stack walk per sample, independent of what the loop runs, so it
+  is safe under production load. Output is collapsed stacks
+  (``frame;frame;frame count``, the input format of flamegraph.pl and
+  speedscope) or a top list of functions by sample count.
+- ``cprofile``: cProfile enabled on the event loop thread for the
+  duration. Exact call counts and times, but it slows every Python call
+  down noticeably. Output is pstats text sorted by cumulative time.
+"""
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sample", "cprofile")
+OUTPUT_FORMATS = {"sample": ("collapsed", "top"), "cprofile": ("pstats",)}
+
+DEFAULT_DURATION = 5.0
+MAX_DURATION = 60.0
+DEFAULT_INTERVAL = 0.005
+MIN_INTERVAL = 0.001
+DEFAULT_LIMIT = 50
+
+# Deeper stacks are cut at the root end
+MAX_STACK_DEPTH = 128
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profiling session is already running."""
+
+
+def frame_label(frame) -> str:
+    """Flame graph label of one frame: ``function (file:line)``."""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame, max_depth: int = MAX_STACK_DEPTH) -> str:
+    """Collapse a frame's stack to ``root;...;leaf``."""
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """Samples one thread's stack from a side thread."""
+
+    def __init__(self, thread_id: int, interval: float = DEFAULT_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="mcp-echo-stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame)] += 1
+                self.samples += 1
+            del frame
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, most frequent first."""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int = DEFAULT_LIMIT) -> str:
+        """Functions by samples on top of the stack (self) and anywhere on it (total)."""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for label in set(frames):
+                total[label] += count
+        samples = self.samples or 1
+        lines = [f"{'self %':>7} {'total %':>8}  function"]
+        for label, count in own.most_common(limit):
+            lines.append(f"{count / samples * 100:>7.1f} {total[label] / samples * 100:>8.1f}  {label}")
+        return "\n".join(lines)
+
+
+class Profiler:
+    """Runs one time-bounded profiling session at a time."""
+
+    def __init__(self):
+        self.active: Optional[Dict[str, Any]] = None
+        self._stats = {"sessions": 0, "rejected_busy": 0, "last": None}
+
+    async def profile(
+        self,
+        mode: str = "sample",
+        duration: float = DEFAULT_DURATION,
+        interval: float = DEFAULT_INTERVAL,
+        output: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT
+    ) -> Dict[str, Any]:
+        """Profile the event loop thread for ``duration`` seconds.
+
+        Must be awaited on the event loop that should be profiled.
+
+        Args:
+            mode: "sample" or "cprofile"
+            duration: Seconds to profile (at most MAX_DURATION)
+            interval: Seconds between samples (sample mode)
+            output: "collapsed" or "top" (sample), "pstats" (cprofile);
+                defaults to the first format of the mode
+            limit: Entries in top/pstats output
+
+        Returns:
+            Session summary with the rendered profile under "output"
+
+        Raises:
+            ValueError: On invalid arguments
+            ProfilerBusy: If another session is running
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Invalid mode '{mode}'. Use one of: {', '.join(PROFILE_MODES)}")
+        output = output or OUTPUT_FORMATS[mode][0]
+        if output not in OUTPUT_FORMATS[mode]:
+            raise ValueError(f"Invalid format '{output}' for {mode}. Use one of: {', '.join(OUTPUT_FORMATS[mode])}")
+        if not 0 < duration <= MAX_DURATION:
+            raise ValueError(f"duration must be between 0 and {MAX_DURATION:g} seconds")
+        interval = max(MIN_INTERVAL, interval)
+        if self.active:
+            self._stats["rejected_busy"] += 1
+            raise ProfilerBusy(f"A {self.active['mode']} profile is already running")
+
+        self.active = {"mode": mode, "started": time.time(), "duration": duration}
+        self._stats["sessions"] += 1
+        logger.warning(f"Profiling started: {mode} for {duration}s")
+        start = time.perf_counter()
+        try:
+            if mode == "sample":
+                result = await self._sample(duration, interval, output, limit)
+            else:
+                result = await self._cprofile(duration, limit)
+        finally:
+            self.active = None
+        result = {"mode": mode, "format": output, "duration": round(time.perf_counter() - start, 3), **result}
+        self._stats["last"] = {key: value for key, value in result.items() if key != "output"}
+        logger.warning(f"Profiling finished: {mode} after {result['duration']}s")
+        return result
+
+    @staticmethod
+    async def _sample(duration: float, interval: float, output: str, limit: int) -> Dict[str, Any]:
+        sampler = StackSampler(threading.get_ident(), interval)
+        sampler.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            await asyncio.to_thread(sampler.stop)
+        return {
+            "interval": interval,
+            "samples": sampler.samples,
+            "unique_stacks": len(sampler.stacks),
+            "output": sampler.collapsed() if output == "collapsed" else sampler.top(limit),
+        }
+
+    @staticmethod
+    async def _cprofile(duration: float, limit: int) -> Dict[str, Any]:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler (e.g. a debugger) holds the profiling hook
+            raise ProfilerBusy(str(e)) from None
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile.disable()
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return {"calls": stats.total_calls, "output": stream.getvalue()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get profiler statistics."""
+        return {"active": self.active, **self._stats}
@@ -0,0 +1,100 @@
+"""Event loop and HTTP parser selection for the HTTP transport.
+
+``uvloop`` and ``httptools`` are optional (``pip install
+mcp-http-echo-server[fast]``). "auto" picks them when installed and falls
+back to the stdlib asyncio loop and the pure-Python h11 parser otherwise.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LOOP_CHOICES = ("auto", "asyncio", "uvloop")
+HTTP_PARSER_CHOICES = ("auto", "h11", "httptools")
+
+# uvicorn's own defaults
+DEFAULT_BACKLOG = 2048
+DEFAULT_KEEP_ALIVE_TIMEOUT = 5
+
+
+def is_available(module: str) -> bool:
+    """Check whether an optional module can be imported."""
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_loop(name: str = "auto") -> str:
+    """Resolve a loop choice to the implementation that will be used.
+
+    Args:
+        name: "auto", "asyncio" or "uvloop"
+
+    Returns:
+        "uvloop" or "asyncio"
+    """
+    if name == "auto":
+        return "uvloop" if is_available("uvloop") else "asyncio"
+    if name == "uvloop" and not is_available("uvloop"):
+        logger.warning("uvloop requested but not installed, using asyncio")
+        return "asyncio"
+    return name
+
+
+def resolve_http_parser(name: str = "auto") -> str:
+    """Resolve an HTTP parser choice to the implementation that will be used.
+
+    Args:
+        name: "auto", "h11" or "httptools"
+
+    Returns:
+        "httptools" or "h11"
+    """
+    if name == "auto":
+        return "httptools" if is_available("httptools") else "h11"
+    if name == "httptools" and not is_available("httptools"):
+        logger.warning("httptools requested but not installed, using h11")
+        return "h11"
+    return name
+
+
+def get_loop_factory(loop: str) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get an event loop factory for a resolved loop name (None = asyncio default)."""
+    if loop == "uvloop":
+        import uvloop
+        return uvloop.new_event_loop
+    return None
+
+
+def build_uvicorn_config(
+    http_parser: str,
+    backlog: int = DEFAULT_BACKLOG,
+    keep_alive_timeout: int = DEFAULT_KEEP_ALIVE_TIMEOUT,
+    limit_concurrency: int = 0,
+    graceful_shutdown_timeout: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the uvicorn options for the HTTP transport.
+
+    Args:
+        http_parser: Resolved HTTP parser ("h11" or "httptools")
+        backlog: Listen socket backlog
+        keep_alive_timeout: Seconds an idle keep-alive connection stays open
+        limit_concurrency: Max concurrent connections/tasks before uvicorn
+            answers 503 (0 = unlimited)
+        graceful_shutdown_timeout: Seconds uvicorn waits for open
+            connections on shutdown before cancelling them (None = forever)
+
+    Returns:
+        Keyword arguments for uvicorn.Config
+    """
+    config = {
+        "http": http_parser,
+        "backlog": backlog,
+        "timeout_keep_alive": keep_alive_timeout,
+    }
+    if limit_concurrency > 0:
+        config["limit_concurrency"] = limit_concurrency
+    if graceful_shutdown_timeout is not None:
+        config["timeout_graceful_shutdown"] = graceful_shutdown_timeout
+    return config
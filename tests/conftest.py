@@ -0,0 +1,73 @@
+"""Shared helpers for tests that drive the server over its HTTP app."""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import pytest
+
+from mcp_http_echo_server import MCPEchoServer
+from mcp_http_echo_server.bench import HEADERS, PROTOCOL_VERSION
+
+
+async def open_session(client: httpx.AsyncClient) -> Dict[str, str]:
+    """Initialize a session and return the headers for later requests."""
+    headers = dict(HEADERS)
+    response = await client.post("/mcp", headers=headers, json={
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "tests", "version": "1.0.0"}
+        }
+    })
+    assert response.status_code == 200, response.text
+    if response.headers.get("mcp-session-id"):
+        headers["mcp-session-id"] = response.headers["mcp-session-id"]
+    headers["mcp-protocol-version"] = PROTOCOL_VERSION
+    await client.post("/mcp", headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+    return headers
+
+
+def sse_messages(response: httpx.Response) -> List[Dict[str, Any]]:
+    """Every JSON-RPC message of a JSON or SSE response, in order."""
+    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+        return [response.json()]
+    return [json.loads(line[5:]) for line in response.text.splitlines() if line.startswith("data:")]
+
+
+@pytest.fixture
+def call_tool():
+    """Call one tool on a fresh stateful server.
+
+    Extra keyword arguments are passed to MCPEchoServer. Returns the tool's structured result and the notifications sent while
+    it ran.
+    """
+
+    def call(name: str, arguments: Dict[str, Any],
+             progress_token: Optional[str] = None, **options) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        params: Dict[str, Any] = {"name": name, "arguments": arguments}
+        if progress_token is not None:
+            params["_meta"] = {"progressToken": progress_token}
+
+        async def scenario():
+            server = MCPEchoServer(**{"max_in_flight": 0, **options})
+            app = server.http_app()
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    headers = await open_session(client)
+                    response = await client.post("/mcp", headers=headers, json={
+                        "jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": params
+                    })
+                    assert response.status_code == 200, response.text
+                    return sse_messages(response)
+
+        *notifications, response = asyncio.run(scenario())
+        result = response["result"]
+        return result.get("structuredContent") or json.loads(result["content"][0]["text"]), notifications
+
+    return call
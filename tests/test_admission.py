@@ -0,0 +1,119 @@
+"""Tests for the admission controller."""
+
+import asyncio
+
+import pytest
+
+from mcp_http_echo_server.middleware.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    is_priority_request,
+)
+
+
+def test_admits_up_to_max_in_flight():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=2, max_queue=0)
+        assert await controller.acquire() == 0.0
+        assert await controller.acquire() == 0.0
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire()
+        assert exc.value.reason == "queue_full"
+        assert controller.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+def test_queued_request_gets_released_slot():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, max_wait=1.0)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+
+        controller.release(0.01)
+        assert await waiter >= 0
+        assert controller.in_flight == 1
+        assert controller.queue_depth == 0
+        assert controller.get_stats()["queued"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_rejects():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, max_wait=0.01)
+        await controller.acquire()
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire()
+        assert exc.value.reason == "timeout"
+        assert controller.queue_depth == 0
+        assert exc.value.retry_after >= 1.0
+
+    asyncio.run(scenario())
+
+
+def test_wait_estimate_rejects_before_queueing():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=10, max_wait=0.5)
+        await controller.acquire()
+        # Teach the controller that requests take about a second
+        for _ in range(50):
+            controller.in_flight += 1
+            controller.release(1.0)
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire()
+        assert exc.value.reason == "wait_estimate"
+        assert controller.queue_depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_priority_lane_bypasses_queue():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, max_wait=1.0, priority_slots=1)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+
+        # A free priority slot is taken straight away, ahead of the queue
+        assert controller.try_acquire_priority()
+        assert controller.priority_in_flight == 1
+        assert controller.queue_depth == 1
+
+        controller.release(0.0, priority=True)
+        assert controller.priority_in_flight == 0
+        assert controller.in_flight == 1
+
+        controller.release(0.0)
+        await waiter
+
+    asyncio.run(scenario())
+
+
+def test_full_priority_lane_falls_back_to_normal_slots():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=2, max_queue=0, priority_slots=1)
+        assert controller.try_acquire_priority()
+        # Priority lane is full but the normal pool is idle: no rejection
+        assert not controller.try_acquire_priority()
+        assert await controller.acquire() == 0.0
+        assert controller.in_flight == 1
+        assert controller.priority_in_flight == 1
+
+        stats = controller.get_stats()
+        assert stats["priority_admitted"] == 1
+        assert stats["priority_overflow"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_is_priority_request():
+    health = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "healthProbe"}}
+    echo = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "echo"}}
+    assert is_priority_request(health)
+    assert not is_priority_request(echo)
+    assert not is_priority_request({"method": "tools/list"})
+    assert not is_priority_request([health])
@@ -0,0 +1,108 @@
+"""Tests for the per-request authentication context."""
+
+import base64
+import json
+
+from mcp_http_echo_server.utils.auth_context import (
+    AUTH_CONTEXT_KEY,
+    AuthContext,
+    get_auth_context,
+    get_scope_auth_context,
+)
+
+
+def make_token(payload):
+    def segment(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{segment({'alg': 'none'})}.{segment(payload)}.sig"
+
+
+def bearer(payload) -> str:
+    return f"Bearer {make_token(payload)}"
+
+
+def test_anonymous_request():
+    auth = AuthContext({})
+    assert auth.bearer_token is None
+    assert auth.decoded is None
+    assert auth.claims == {}
+    assert auth.principal_id is None
+    assert auth.auth_method == "none"
+
+
+def test_jwt_subject_takes_precedence_over_oauth_headers():
+    auth = AuthContext({
+        "authorization": bearer({"sub": "alice"}),
+        "x-user-id": "uid-1",
+        "x-user-name": "bob",
+    })
+    assert auth.principal_id == "alice"
+    assert auth.auth_method == "bearer"
+
+
+def test_non_string_subject_is_stringified():
+    assert AuthContext({"authorization": bearer({"sub": 42})}).principal_id == "42"
+
+
+def test_token_without_subject_falls_back_to_user_id_then_name():
+    headers = {"authorization": bearer({"scope": "read"}), "x-user-id": "uid-1", "x-user-name": "bob"}
+    auth = AuthContext(headers)
+    assert auth.principal_id == "uid-1"
+    # A decodable token still decides the method
+    assert auth.auth_method == "bearer"
+
+    assert AuthContext({"x-user-name": "bob"}).principal_id == "bob"
+
+
+def test_malformed_bearer_falls_back_to_oauth_headers():
+    auth = AuthContext({"authorization": "Bearer not-a-jwt", "x-user-id": "uid-1"})
+    assert auth.bearer_token == "not-a-jwt"
+    assert auth.decoded is None
+    assert auth.principal_id == "uid-1"
+    assert auth.auth_method == "oauth_headers"
+
+
+def test_oauth_method_needs_user_id_or_two_headers():
+    assert AuthContext({"x-user-name": "bob"}).auth_method == "none"
+    assert AuthContext({"x-user-id": "uid-1"}).auth_method == "oauth_headers"
+    assert AuthContext({"x-user-name": "bob", "x-client-id": "cli"}).auth_method == "oauth_headers"
+
+
+def test_basic_authorization_is_not_a_bearer_token():
+    auth = AuthContext({"authorization": "Basic dXNlcjpwdw=="})
+    assert auth.authorization.startswith("Basic")
+    assert auth.bearer_token is None
+    assert auth.auth_method == "none"
+
+
+def test_raw_scope_headers_are_lowercased():
+    auth = AuthContext(raw_headers=[(b"Authorization", bearer({"sub": "alice"}).encode()), (b"X-User-Id", b"uid")])
+    assert auth.headers["x-user-id"] == "uid"
+    assert auth.principal_id == "alice"
+
+
+def test_scope_context_is_created_once():
+    scope = {"type": "http", "headers": [(b"x-user-id", b"uid")]}
+    auth = get_scope_auth_context(scope)
+    assert get_scope_auth_context(scope) is auth
+    assert scope["state"][AUTH_CONTEXT_KEY] is auth
+
+
+def test_tool_context_falls_back_to_captured_headers():
+    class FakeContext:
+        def __init__(self, state):
+            self.state = state
+
+        def get_state(self, key):
+            return self.state.get(key)
+
+        def set_state(self, key, value):
+            self.state[key] = value
+
+    ctx = FakeContext({"request_headers": {"x-user-id": "uid"}})
+    auth = get_auth_context(ctx)
+    assert auth.principal_id == "uid"
+    assert get_auth_context(ctx) is auth
+
+    shared = AuthContext({})
+    assert get_auth_context(FakeContext({AUTH_CONTEXT_KEY: shared})) is shared
@@ -0,0 +1,108 @@
+"""Tests for JSON-RPC batch splitting."""
+
+import asyncio
+import json
+
+from mcp_http_echo_server.middleware.batch import BatchMiddleware, extract_responses
+
+
+def test_extract_responses_from_json():
+    body = b'{"jsonrpc":"2.0","id":1,"result":{}}'
+    assert extract_responses("application/json", body) == [{"jsonrpc": "2.0", "id": 1, "result": {}}]
+    assert extract_responses("application/json", b"") == []
+
+
+def test_extract_responses_from_json_array_drops_non_responses():
+    body = json.dumps([
+        {"jsonrpc": "2.0", "id": 1, "result": {}},
+        {"jsonrpc": "2.0", "method": "notifications/progress", "params": {}},
+        {"jsonrpc": "2.0", "id": 2, "error": {"code": -1, "message": "x"}},
+    ]).encode()
+    assert [m["id"] for m in extract_responses("application/json", body)] == [1, 2]
+
+
+def test_extract_responses_from_sse():
+    body = (
+        b'event: message\ndata: {"jsonrpc":"2.0","method":"notifications/progress","params":{}}\n\n'
+        b'event: message\ndata: {"jsonrpc":"2.0",\ndata: "id":7,"result":{"ok":true}}\n\n'
+    )
+    assert extract_responses("text/event-stream", body) == [{"jsonrpc": "2.0", "id": 7, "result": {"ok": True}}]
+
+
+class FakeApp:
+    """ASGI app answering every entry and recording the session it saw."""
+
+    def __init__(self):
+        self.seen = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, scope, receive, send):
+        message = json.loads((await receive())["body"])
+        session = dict(scope["headers"]).get(b"mcp-session-id")
+        self.seen.append((message.get("method"), session))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        headers = [(b"content-type", b"application/json")]
+        if message.get("method") == "initialize":
+            headers.append((b"mcp-session-id", b"new-session"))
+        elif session:
+            headers.append((b"mcp-session-id", session))
+        if "id" not in message:
+            await send({"type": "http.response.start", "status": 202, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        body = json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": {}}).encode()
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def call(name, id):
+    return {"jsonrpc": "2.0", "id": id, "method": "tools/call", "params": {"name": name}}
+
+
+def run_batch(middleware, batch, headers=()):
+    scope = {"type": "http", "method": "POST", "path": "/mcp", "headers": list(headers)}
+    return asyncio.run(middleware.execute(scope, batch))
+
+
+def test_initialize_session_reaches_later_entries():
+    app = FakeApp()
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        call("echo", 2),
+        call("healthProbe", 3),
+    ]
+    responses, session_id = run_batch(BatchMiddleware(app), batch)
+    assert session_id == "new-session"
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert app.seen[0] == ("initialize", None)
+    assert all(session == b"new-session" for _, session in app.seen[1:])
+
+
+def test_stateful_batch_runs_in_order_one_by_one():
+    app = FakeApp()
+    batch = [call("echo", i) for i in range(5)]
+    responses, _ = run_batch(BatchMiddleware(app), batch, [(b"mcp-session-id", b"abc")])
+    assert [r["id"] for r in responses] == list(range(5))
+    assert app.peak == 1
+
+
+def test_stateless_batch_runs_concurrently():
+    app = FakeApp()
+    batch = [call("echo", i) for i in range(6)]
+    responses, session_id = run_batch(BatchMiddleware(app, max_concurrency=3, stateless_mode=True), batch)
+    assert [r["id"] for r in responses] == list(range(6))
+    assert session_id is None
+    assert app.peak == 3
+
+
+def test_adaptive_batch_without_session_is_concurrent():
+    app = FakeApp()
+    batch = [call("echo", i) for i in range(4)]
+    run_batch(BatchMiddleware(app, max_concurrency=4, adaptive_mode=True), batch)
+    assert app.peak == 4
@@ -0,0 +1,57 @@
+"""Tests for the load generator's argument parsing and latency summary."""
+
+import pytest
+
+from mcp_http_echo_server.bench import latency_summary, main, parse_mix, parse_tool_args
+
+
+def test_parse_mix_weights():
+    assert parse_mix("echo=8, healthProbe=1.5,printHeader") == [
+        ("echo", 8.0), ("healthProbe", 1.5), ("printHeader", 1.0)
+    ]
+    assert parse_mix("echo,,") == [("echo", 1.0)]
+
+
+@pytest.mark.parametrize("spec, message", [
+    ("", "empty"),
+    (" , ", "empty"),
+    ("echo=lots", "Invalid weight for echo"),
+    ("echo=0", "must be positive"),
+    ("echo=-1", "must be positive"),
+])
+def test_parse_mix_rejects_bad_specs(spec, message):
+    with pytest.raises(ValueError, match=message):
+        parse_mix(spec)
+
+
+def test_parse_tool_args():
+    assert parse_tool_args(None) == {}
+    assert parse_tool_args('{"echo": {"message": "x"}}') == {"echo": {"message": "x"}}
+
+
+@pytest.mark.parametrize("text", ["[1]", '"echo"', '{"echo": 1}', '{"echo": ["x"]}', "{"])
+def test_parse_tool_args_rejects_non_objects(text):
+    with pytest.raises(ValueError):
+        parse_tool_args(text)
+
+
+@pytest.mark.parametrize("argv", [["--tool-args", "[1]"], ["--tool-args", '{"echo": 1}'], ["--mix", "echo=0"]])
+def test_main_reports_bad_arguments_as_usage_errors(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_latency_summary_nearest_rank_percentiles():
+    summary = latency_summary([float(ms) for ms in range(1000, 0, -1)])
+    assert summary["count"] == 1000
+    assert (summary["min_ms"], summary["max_ms"], summary["mean_ms"]) == (1.0, 1000.0, 500.5)
+    assert (summary["p50_ms"], summary["p90_ms"], summary["p99_ms"], summary["p999_ms"]) == (501.0, 901.0, 991.0, 1000.0)
+
+
+def test_latency_summary_small_and_empty_samples():
+    assert latency_summary([]) == {"count": 0}
+    summary = latency_summary([2.5])
+    assert summary["p50_ms"] == summary["p999_ms"] == 2.5
+    assert latency_summary([1.0, 9.0])["p50_ms"] == 9.0
@@ -0,0 +1,64 @@
+"""Tests for the pluggable JSON codec."""
+
+import datetime
+
+import pytest
+from fastmcp.tools.tool import default_serializer
+
+from mcp_http_echo_server.utils import codec
+
+
+@pytest.fixture
+def restore_codec():
+    previous = codec.codec.name
+    yield
+    codec.set_codec(previous)
+
+
+def test_select_codec_by_name_and_env(monkeypatch):
+    assert codec.select_codec("json").name == "json"
+    assert codec.select_codec("no-such-codec").name == "json"
+    monkeypatch.setenv("MCP_JSON_CODEC", "json")
+    assert codec.select_codec().name == "json"
+
+
+@pytest.mark.parametrize("name", sorted(codec.CODECS))
+def test_round_trip_is_compact_and_unescaped(name):
+    selected = codec.select_codec(name)
+    value = {"text": "grüße", "list": [1, 2.5, None, True], "nested": {"a": {}}}
+    assert selected.dumps(value) == '{"text":"grüße","list":[1,2.5,null,true],"nested":{"a":{}}}'
+    assert selected.dumps_bytes(value) == selected.dumps(value).encode("utf-8")
+    assert selected.loads(selected.dumps_bytes(value)) == value
+    assert selected.loads(selected.dumps(value)) == value
+
+
+@pytest.mark.parametrize("name", sorted(codec.CODECS))
+def test_invalid_json_raises_value_error(name):
+    with pytest.raises(ValueError):
+        codec.select_codec(name).loads(b"{not json")
+
+
+@pytest.mark.skipif("orjson" not in codec.CODECS, reason="orjson not installed")
+def test_orjson_falls_back_to_stdlib_for_wide_integers():
+    selected = codec.select_codec("orjson")
+    assert selected.dumps({"big": 2 ** 70}) == '{"big":1180591620717411303424}'
+    assert selected.dumps({1: "x"}) == '{"1":"x"}'
+
+
+def test_stdlib_codec_keeps_fastmcp_serializer(restore_codec):
+    codec.set_codec("json")
+    assert codec.tool_serializer() is None
+
+
+@pytest.mark.skipif("orjson" not in codec.CODECS, reason="orjson not installed")
+def test_tool_serializer_matches_fastmcp_default(restore_codec):
+    codec.set_codec("orjson")
+    serialize = codec.tool_serializer()
+    value = {
+        "message": "ünïcode",
+        "items": [1, {"nested": [None, 2.5]}],
+        "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "empty": {},
+    }
+    assert serialize(value) == default_serializer(value)
+    assert codec.loads(serialize({"tags": {"a"}})) == {"tags": ["a"]}
@@ -0,0 +1,93 @@
+"""Tests for Accept-Encoding negotiation and response compression."""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from mcp_http_echo_server.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("gzip", "gzip"),
+    ("deflate", "deflate"),
+    ("br", None),
+    ("deflate, gzip", "deflate"),
+    ("gzip;q=0.5, deflate", "deflate"),
+    ("gzip;q=0, deflate;q=0", None),
+    ("*", "gzip"),
+    ("br, *;q=0.1", "gzip"),
+    ("gzip;q=0, *", "deflate"),
+    ("gzip;q=0, deflate;q=0, *", None),
+    ("gzip;q=0.1, *;q=0.5", "deflate"),
+    ("GZIP ; q=0.8", "gzip"),
+    ("gzip;q=bogus, deflate;q=0.2", "deflate"),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def run_middleware(body: bytes, accept_encoding: str = "gzip", content_type: bytes = b"application/json",
+                   minimum_size: int = 100):
+    """Send one POST through CompressionMiddleware; return (headers, body)."""
+
+    async def app(scope, receive, send):
+        await receive()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b'{"jsonrpc":"2.0","id":1,"method":"ping"}', "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(CompressionMiddleware(app, minimum_size=minimum_size)(scope, receive, send))
+    headers = {name.decode(): value.decode() for name, value in sent[0]["headers"]}
+    return headers, b"".join(message.get("body", b"") for message in sent[1:])
+
+
+def test_compresses_large_json():
+    payload = b'{"result":"' + b"x" * 1000 + b'"}'
+    headers, body = run_middleware(payload)
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert "Accept-Encoding" in headers["vary"]
+    assert gzip.decompress(body) == payload
+
+
+def test_deflate():
+    payload = b'{"result":"' + b"x" * 1000 + b'"}'
+    headers, body = run_middleware(payload, accept_encoding="deflate")
+    assert headers["content-encoding"] == "deflate"
+    assert zlib.decompress(body) == payload
+
+
+def test_skips_responses_below_minimum_size():
+    payload = b'{"result":"small"}'
+    headers, body = run_middleware(payload, minimum_size=len(payload) + 1)
+    assert "content-encoding" not in headers
+    assert body == payload
+
+
+def test_skips_without_acceptable_encoding_or_type():
+    payload = b"x" * 1000
+    headers, body = run_middleware(payload, accept_encoding="br")
+    assert "content-encoding" not in headers and body == payload
+    headers, body = run_middleware(payload, content_type=b"image/png")
+    assert "content-encoding" not in headers and body == payload
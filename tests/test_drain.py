@@ -0,0 +1,143 @@
+"""Tests for graceful drain."""
+
+import asyncio
+import json
+
+from mcp_http_echo_server.middleware.drain import (
+    DRAINING_ERROR_CODE,
+    DrainController,
+    DrainMiddleware,
+    is_initialize_request,
+)
+from mcp_http_echo_server.middleware.health import HealthState
+from mcp_http_echo_server.utils.loop_monitor import LoopLagMonitor
+
+
+def make_controller(**kwargs) -> DrainController:
+    controller = DrainController(**kwargs)
+    controller.exits = 0
+
+    def exit_():
+        controller.exits += 1
+
+    # Do not hand SIGTERM to the test process
+    controller._exit = exit_
+    return controller
+
+
+def post(controller: DrainController, message, method: str = "POST"):
+    """Send one request through DrainMiddleware; return (status, body, app called)."""
+    called = []
+
+    async def app(scope, receive, send):
+        called.append(await receive())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    body = json.dumps(message).encode()
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": "/mcp", "headers": []}
+    asyncio.run(DrainMiddleware(app, controller)(scope, receive, send))
+    return sent[0]["status"], sent[1]["body"], bool(called)
+
+
+INITIALIZE = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+PING = {"jsonrpc": "2.0", "id": 2, "method": "ping"}
+
+
+def test_tracks_in_flight_and_streams():
+    controller = make_controller()
+    controller.request_started()
+    controller.request_started(stream=True)
+    assert (controller.in_flight, controller.streams) == (1, 1)
+    controller.request_finished()
+    controller.request_finished(stream=True)
+    assert controller.get_stats()["in_flight"] == 0
+
+
+def test_draining_rejects_new_sessions_only():
+    controller = make_controller()
+    assert post(controller, INITIALIZE)[0] == 200
+
+    controller.begin()
+    status, body, called = post(controller, INITIALIZE)
+    assert status == 503 and not called
+    assert json.loads(body)["error"]["code"] == DRAINING_ERROR_CODE
+    assert post(controller, [PING, INITIALIZE])[0] == 503
+    assert controller.get_stats()["rejected_sessions"] == 2
+
+    # Requests in existing sessions are still served
+    assert post(controller, PING) == (200, b"{}", True)
+    assert controller.in_flight == 0
+
+
+def test_begin_fails_readiness():
+    health = HealthState(LoopLagMonitor(slow_callback_threshold=0))
+    controller = make_controller(health=health)
+    controller.begin()
+    controller.begin()
+    assert health.reasons == ["draining"]
+    assert controller.get_stats()["drains"] == 1
+
+
+def test_drain_waits_for_in_flight_requests():
+    async def scenario():
+        controller = make_controller(drain_timeout=5.0)
+        controller.request_started()
+        # Streams never finish on their own and must not hold up the drain
+        controller.request_started(stream=True)
+        drain = asyncio.create_task(controller.drain())
+        await asyncio.sleep(0.05)
+        assert not drain.done()
+        assert controller.draining
+
+        controller.request_finished()
+        await asyncio.wait_for(drain, timeout=1.0)
+        stats = controller.get_stats()
+        assert stats["last_remaining_in_flight"] == 0
+        assert stats["last_wait_seconds"] < 5.0
+        assert controller.exits == 1
+
+    asyncio.run(scenario())
+
+
+def test_drain_gives_up_at_timeout():
+    async def scenario():
+        controller = make_controller(drain_timeout=0.05)
+        controller.request_started()
+        await asyncio.wait_for(controller.drain(), timeout=1.0)
+        assert controller.get_stats()["last_remaining_in_flight"] == 1
+        assert controller.exits == 1
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_hooks_run_despite_failures():
+    calls = []
+
+    async def failing():
+        calls.append("failing")
+        raise RuntimeError("boom")
+
+    async def flush():
+        calls.append("flush")
+
+    controller = make_controller()
+    controller.add_shutdown_hook(failing)
+    controller.add_shutdown_hook(flush)
+    asyncio.run(controller.run_shutdown_hooks())
+    assert calls == ["failing", "flush"]
+
+
+def test_is_initialize_request():
+    assert is_initialize_request(INITIALIZE)
+    assert is_initialize_request([PING, INITIALIZE])
+    assert not is_initialize_request(PING)
+    assert not is_initialize_request(None)
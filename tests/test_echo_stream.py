@@ -0,0 +1,57 @@
+"""Tests for echoStream over the HTTP app."""
+
+import pytest
+
+from mcp_http_echo_server.tools.echo_tools import (
+    MAX_CHUNK_DELAY_MS,
+    MAX_CHUNK_SIZE,
+    MAX_STREAM_BYTES,
+    MAX_STREAM_CHUNKS,
+)
+
+
+def progress_of(notifications):
+    return [n["params"] for n in notifications if n["method"] == "notifications/progress"]
+
+
+def test_streams_message_as_progress(call_tool):
+    result, notifications = call_tool("echoStream", {"message": "hello world", "chunk_size": 4}, progress_token="t1")
+    progress = progress_of(notifications)
+    assert [p["progress"] for p in progress] == [1, 2, 3]
+    assert all(p["total"] == 3 and p["progressToken"] == "t1" for p in progress)
+    assert "".join(p["message"] for p in progress) == "hello world"
+    assert (result["chunks_sent"], result["bytes_sent"], result["delivery"]) == (3, 11, "progress")
+
+
+def test_count_wraps_generated_payload(call_tool):
+    result, notifications = call_tool("echoStream", {"count": 5, "chunk_size": 50}, progress_token=7)
+    progress = progress_of(notifications)
+    assert [p["progress"] for p in progress] == [1, 2, 3, 4, 5]
+    assert all(len(p["message"]) == 50 for p in progress)
+    assert (result["chunks_sent"], result["bytes_sent"], result["source"]) == (5, 250, "generated")
+
+
+def test_log_delivery_without_progress_token(call_tool):
+    result, notifications = call_tool("echoStream", {"size": 10, "chunk_size": 4})
+    logs = [n["params"] for n in notifications if n["method"] == "notifications/message"]
+    chunks = [log["data"] for log in logs if log.get("logger") == "echoStream"]
+    assert len(chunks) == 3
+    assert progress_of(notifications) == []
+    assert (result["chunks_sent"], result["bytes_sent"], result["delivery"]) == (3, 10, "log")
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"message": "x", "chunk_size": 0}, "chunk_size must be between"),
+    ({"message": "x", "chunk_size": MAX_CHUNK_SIZE + 1}, "chunk_size must be between"),
+    ({"message": "x", "delay_ms": MAX_CHUNK_DELAY_MS + 1}, "delay_ms must be between"),
+    ({"count": 0}, "count must be between"),
+    ({"count": MAX_STREAM_CHUNKS + 1}, "count must be between"),
+    ({"size": MAX_STREAM_BYTES + 1, "chunk_size": MAX_CHUNK_SIZE}, "exceeds the limit"),
+    ({}, "Provide a message"),
+    ({"message": "x", "delivery": "sse"}, "Invalid delivery"),
+    ({"message": "x", "delivery": "progress"}, "progressToken"),
+])
+def test_rejects_out_of_range_arguments(call_tool, arguments, message):
+    result, notifications = call_tool("echoStream", arguments)
+    assert message in result["error"]
+    assert progress_of(notifications) == []
@@ -0,0 +1,103 @@
+"""Tests for echoSynthetic, its delay distributions and payload cache."""
+
+import random
+import statistics
+
+import pytest
+
+from mcp_http_echo_server.tools.echo_tools import (
+    MAX_SYNTHETIC_BYTES,
+    MAX_SYNTHETIC_DELAY_MS,
+    PayloadCache,
+    sample_delay_ms,
+)
+
+
+def samples(distribution, delay_ms, jitter_ms=0, n=2000, seed=1, **kwargs):
+    rng = random.Random(seed)
+    return [sample_delay_ms(rng, distribution, delay_ms, jitter_ms, **kwargs) for _ in range(n)]
+
+
+def test_fixed_delay_ignores_jitter():
+    assert set(samples("fixed", 50, jitter_ms=20, n=10)) == {50}
+
+
+def test_uniform_delay_stays_within_jitter():
+    delays = samples("uniform", 100, jitter_ms=20)
+    assert min(delays) >= 80 and max(delays) <= 120
+    assert statistics.mean(delays) == pytest.approx(100, abs=2)
+
+
+def test_normal_delay_mean_and_spread():
+    delays = samples("normal", 100, jitter_ms=10)
+    assert statistics.mean(delays) == pytest.approx(100, abs=1)
+    assert statistics.stdev(delays) == pytest.approx(10, abs=1)
+
+
+def test_longtail_delay_is_skewed_above_scale():
+    delays = sorted(samples("longtail", 10, tail_alpha=1.5))
+    assert delays[0] >= 10
+    # Pareto(1.5): median ~1.59x, p99 ~21.5x the scale
+    assert delays[len(delays) // 2] == pytest.approx(15.9, rel=0.1)
+    assert delays[int(len(delays) * 0.99)] > 100
+
+
+def test_delays_are_clamped():
+    assert min(samples("normal", 0, jitter_ms=50, n=200)) == 0
+    assert max(samples("longtail", MAX_SYNTHETIC_DELAY_MS, n=50)) == MAX_SYNTHETIC_DELAY_MS
+
+
+def test_cache_returns_same_payload_object():
+    cache = PayloadCache(max_bytes=1000)
+    payload = cache.get(100)
+    assert len(payload) == 100 and payload.isascii()
+    assert cache.get(100) is payload
+    assert cache.get(0) == ""
+
+
+def test_cache_drops_least_recently_used_sizes():
+    cache = PayloadCache(max_bytes=300)
+    cache.get(100)
+    cache.get(150)
+    cache.get(100)
+    cache.get(120)
+    # 150 was least recently used and is dropped to fit 120
+    assert list(cache._payloads) == [100, 120]
+    assert cache._bytes == 220
+
+
+def test_cache_skips_payloads_larger_than_budget():
+    cache = PayloadCache(max_bytes=100)
+    cache.get(50)
+    assert len(cache.get(500)) == 500
+    assert list(cache._payloads) == [50]
+
+
+def test_tool_payload_shape(call_tool):
+    result, _ = call_tool("echoSynthetic", {"size": 5000, "message": "hi", "seed": 3})
+    assert len(result["payload"]) == 5000
+    assert result["payload"].isascii()
+    assert result["message"] == "hi"
+    assert (result["size"], result["distribution"], result["delay_ms"]) == (5000, "fixed", 0)
+
+
+def test_tool_seed_gives_reproducible_delay(call_tool):
+    arguments = {"delay_ms": 5, "distribution": "uniform", "jitter_ms": 4, "seed": 42}
+    first, _ = call_tool("echoSynthetic", arguments)
+    second, _ = call_tool("echoSynthetic", arguments)
+    assert first["delay_ms"] == second["delay_ms"]
+    assert first["delay_ms"] == round(sample_delay_ms(random.Random(42), "uniform", 5, 4), 3)
+    assert first["actual_delay_ms"] >= first["delay_ms"] * 0.9
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"size": -1}, "size must be between"),
+    ({"size": MAX_SYNTHETIC_BYTES + 1}, "size must be between"),
+    ({"delay_ms": MAX_SYNTHETIC_DELAY_MS + 1}, "delay_ms must be between"),
+    ({"distribution": "poisson"}, "Invalid distribution"),
+    ({"jitter_ms": -1}, "jitter_ms"),
+    ({"tail_alpha": 0}, "tail_alpha"),
+])
+def test_tool_rejects_bad_arguments(call_tool, arguments, message):
+    result, _ = call_tool("echoSynthetic", arguments)
+    assert message in result["error"]
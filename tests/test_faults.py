@@ -0,0 +1,80 @@
+"""Tests for fault injection rules."""
+
+import pytest
+
+from mcp_http_echo_server.middleware.faults import (
+    FaultInjector,
+    FaultRule,
+    parse_fault_spec,
+    request_targets,
+)
+
+
+def test_parse_full_spec():
+    rules = parse_fault_spec("tool:echo error=0.2 status=503; method:tools/list latency=300 jitter=100; * drip=2048")
+    assert rules == [
+        FaultRule("tool:echo", error=0.2, status=503),
+        FaultRule("method:tools/list", latency=300.0, jitter=100.0),
+        FaultRule("*", drip=2048.0),
+    ]
+    assert isinstance(rules[0].status, int)
+
+
+def test_parse_defaults_to_any_target_and_skips_blanks():
+    assert parse_fault_spec("") == []
+    assert parse_fault_spec(" ; ;") == []
+    assert parse_fault_spec("drop=1 drop_hold=0.5") == [FaultRule("*", drop=1.0, drop_hold=0.5)]
+
+
+def test_describe_round_trips():
+    spec = "tool:echo error=0.5 truncate=1.0 truncate_after=10"
+    rules = parse_fault_spec(spec)
+    assert rules[0].describe() == spec
+    assert parse_fault_spec(rules[0].describe()) == rules
+
+
+@pytest.mark.parametrize("spec, message", [
+    ("echo error=1", "Invalid fault target"),
+    ("tool:echo bogus=1", "Invalid fault option"),
+    ("tool:echo error", "Invalid fault option"),
+    ("tool:echo error=lots", "Invalid value for error"),
+    ("tool:echo status=5.5", "Invalid value for status"),
+    ("tool:echo latency=-1", "must not be negative"),
+    ("tool:echo error=1.5", "probability"),
+    ("* drop=2", "probability"),
+    ("* error=nan", "Invalid value for error"),
+    ("* latency=inf", "Invalid value for latency"),
+    ("* drip=-inf", "Invalid value for drip"),
+    ("* error=1 status=42", "status must be an HTTP status code"),
+    ("* error=1 status=600", "status must be an HTTP status code"),
+])
+def test_parse_rejects_malformed_specs(spec, message):
+    with pytest.raises(ValueError, match=message):
+        parse_fault_spec(spec)
+
+
+def test_request_targets():
+    call = {"method": "tools/call", "params": {"name": "echo"}}
+    assert request_targets(call) == ("method:tools/call", "tool:echo")
+    assert request_targets({"method": "ping"}) == ("method:ping",)
+    assert request_targets([call, {"method": "ping"}]) == ("method:tools/call", "tool:echo", "method:ping")
+    assert request_targets("garbage") == ()
+
+
+def test_first_matching_rule_applies():
+    injector = FaultInjector(seed=1)
+    rules = parse_fault_spec("tool:echo error=1; * latency=100")
+    plan = injector.plan(rules, ("method:tools/call", "tool:echo"))
+    assert plan.error and plan.latency == 0.0
+
+    plan = injector.plan(rules, ("method:ping",))
+    assert not plan.error and plan.latency == pytest.approx(0.1)
+
+    assert injector.plan(parse_fault_spec("tool:echo error=1"), ("method:ping",)) is None
+
+
+def test_seeded_plans_are_reproducible():
+    rules = parse_fault_spec("* error=0.5 drop=0.5 latency=100 jitter=50")
+    targets = ("method:ping",)
+    a, b = FaultInjector(seed=7), FaultInjector(seed=7)
+    assert [a.plan(rules, targets) for _ in range(20)] == [b.plan(rules, targets) for _ in range(20)]
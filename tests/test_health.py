@@ -0,0 +1,101 @@
+"""Tests for the health routes."""
+
+import asyncio
+import json
+
+from mcp_http_echo_server.middleware.admission import AdmissionController
+from mcp_http_echo_server.middleware.health import HealthMiddleware, HealthState
+from mcp_http_echo_server.utils.loop_monitor import LoopLagMonitor
+
+
+def make_health(**kwargs) -> HealthState:
+    return HealthState(LoopLagMonitor(slow_callback_threshold=0), **kwargs)
+
+
+def test_ready_by_default():
+    health = make_health()
+    status, body = health.readiness_response()
+    assert status == 200
+    assert json.loads(body)["status"] == "ready"
+
+
+def test_loop_lag_and_draining_fail_readiness():
+    health = make_health(max_loop_lag=0.1)
+    health.loop_monitor.record(0.5)
+    assert not health.ready
+    assert health.reasons == ["event_loop_lag"]
+
+    health.loop_monitor.record(0.0)
+    assert health.ready
+
+    health.set_draining()
+    status, body = health.readiness_response()
+    assert status == 503
+    assert json.loads(body)["reasons"] == ["draining"]
+
+
+def test_full_admission_queue_fails_readiness():
+    admission = AdmissionController(max_in_flight=1, max_queue=2)
+    health = make_health(admission=admission, max_queue_fraction=0.5)
+    admission._waiters.extend([object(), object()])
+    health.refresh()
+    assert health.reasons == ["admission_queue_full"]
+
+
+def test_unreachable_session_store_fails_readiness():
+    class BrokenStore:
+        def check_health(self):
+            raise ConnectionError("down")
+
+    health = make_health(session_manager=BrokenStore())
+    assert health.reasons == ["session_store_unreachable"]
+    assert health.get_stats() == {"ready": False, "reasons": ["session_store_unreachable"]}
+
+
+def request(health: HealthState, path: str, method: str = "GET"):
+    """Send one request through HealthMiddleware; return (status, body, app called)."""
+    called = []
+
+    async def app(scope, receive, send):
+        called.append(scope["path"])
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    async def scenario():
+        middleware = HealthMiddleware(app, health)
+        await middleware({"type": "http", "method": method, "path": path, "headers": []}, receive, send)
+        await health.loop_monitor.stop()
+
+    asyncio.run(scenario())
+    return sent[0]["status"], sent[1]["body"], bool(called)
+
+
+def test_live_route_bypasses_app():
+    assert request(make_health(), "/health/live") == (200, b'{"status":"alive"}', False)
+    assert request(make_health(), "/health")[0] == 200
+
+
+def test_ready_route_reports_cached_verdict():
+    health = make_health()
+    health.set_draining()
+    status, body, called = request(health, "/health/ready")
+    assert status == 503 and not called
+    assert json.loads(body)["status"] == "not_ready"
+
+
+def test_health_routes_reject_other_methods():
+    assert request(make_health(), "/health/live", method="POST")[0] == 405
+    assert request(make_health(), "/health/ready", method="HEAD")[1] == b""
+
+
+def test_other_paths_reach_app():
+    status, _, called = request(make_health(), "/mcp", method="POST")
+    assert status == 204 and called
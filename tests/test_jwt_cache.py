@@ -0,0 +1,137 @@
+"""Tests for the decoded JWT cache."""
+
+import base64
+import json
+
+import pytest
+
+from mcp_http_echo_server.utils import jwt_decoder
+from mcp_http_echo_server.utils.jwt_decoder import FrozenDict, JWTCache, decode_jwt_token, thaw
+
+
+def make_token(payload, header=None):
+    def segment(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{segment(header or {'alg': 'none'})}.{segment(payload)}.sig"
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(1000.0)
+    monkeypatch.setattr(jwt_decoder.time, "time", clock)
+    return clock
+
+
+def counting_decoder():
+    calls = []
+
+    def decode(token):
+        calls.append(token)
+        return jwt_decoder._decode_jwt_token(token)
+
+    return decode, calls
+
+
+def test_hit_returns_same_frozen_result(clock):
+    cache = JWTCache(max_size=4)
+    decode, calls = counting_decoder()
+    token = make_token({"sub": "alice", "exp": 2000, "roles": ["a", "b"]})
+
+    first = cache.get_or_decode(token, decode)
+    assert cache.get_or_decode(token, decode) is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert isinstance(first, FrozenDict)
+    assert first["payload"]["roles"] == ("a", "b")
+    with pytest.raises(TypeError):
+        first["payload"]["sub"] = "mallory"
+
+
+def test_entries_expire_at_exp(clock):
+    cache = JWTCache(max_size=4)
+    decode, calls = counting_decoder()
+    token = make_token({"sub": "alice", "exp": 1010})
+
+    cache.get_or_decode(token, decode)
+    clock.now = 1009.0
+    cache.get_or_decode(token, decode)
+    assert len(calls) == 1
+
+    clock.now = 1010.0
+    cache.get_or_decode(token, decode)
+    assert len(calls) == 2
+    assert cache.expired == 1
+    # Already expired on decode: returned but not stored
+    assert cache.get_stats()["size"] == 0
+
+
+def test_lru_eviction(clock):
+    cache = JWTCache(max_size=2)
+    decode, calls = counting_decoder()
+    a, b, c = (make_token({"sub": name}) for name in "abc")
+
+    cache.get_or_decode(a, decode)
+    cache.get_or_decode(b, decode)
+    cache.get_or_decode(a, decode)  # a is now most recently used
+    cache.get_or_decode(c, decode)  # evicts b
+    assert cache.evictions == 1
+
+    calls.clear()
+    cache.get_or_decode(a, decode)
+    cache.get_or_decode(b, decode)
+    assert calls == [b]
+
+
+def test_expired_entries_are_purged_before_evicting(clock):
+    cache = JWTCache(max_size=2)
+    decode, _ = counting_decoder()
+    short = make_token({"sub": "short", "exp": 1005})
+    long = make_token({"sub": "long"})
+
+    cache.get_or_decode(short, decode)
+    cache.get_or_decode(long, decode)
+    clock.now = 1006.0
+    cache.get_or_decode(make_token({"sub": "new"}), decode)
+    assert (cache.expired, cache.evictions) == (1, 0)
+
+
+def test_invalid_tokens_are_cached_as_none(clock):
+    cache = JWTCache(max_size=2)
+    decode, calls = counting_decoder()
+    assert cache.get_or_decode("garbage", decode) is None
+    assert cache.get_or_decode("garbage", decode) is None
+    assert len(calls) == 1
+
+
+def test_disabled_cache_decodes_every_time(clock):
+    cache = JWTCache(max_size=0)
+    decode, calls = counting_decoder()
+    token = make_token({"sub": "alice"})
+    cache.get_or_decode(token, decode)
+    cache.get_or_decode(token, decode)
+    assert len(calls) == 2
+
+
+def test_thaw_gives_plain_json_types():
+    decoded = decode_jwt_token(make_token({"aud": ["x", "y"], "nested": {"k": [1]}}))
+    assert isinstance(decoded, FrozenDict)
+    plain = thaw(decoded)
+    assert type(plain) is dict and type(plain["payload"]) is dict
+    assert plain["payload"]["aud"] == ["x", "y"]
+    plain["payload"]["aud"].append("z")
+    assert decoded["payload"]["aud"] == ("x", "y")
+    assert json.loads(json.dumps(plain)) == plain
+
+
+def test_uncached_decode_is_not_frozen():
+    decoded = decode_jwt_token(make_token({"aud": ["x", "y"]}), use_cache=False)
+    assert type(decoded) is dict and type(decoded["payload"]) is dict
+    assert decoded["payload"]["aud"] == ["x", "y"]
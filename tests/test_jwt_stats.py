@@ -0,0 +1,95 @@
+"""Tests for JWT batch classification and bearerDecodeBatch."""
+
+import base64
+import json
+
+from mcp_http_echo_server.utils.jwt_stats import TokenBatchStats, classify_token, parse_token_list
+
+NOW = 1_000_000.0
+
+
+def make_token(payload, header=None):
+    def segment(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{segment(header or {'alg': 'HS256'})}.{segment(payload)}.sig"
+
+
+def test_parse_token_list_strips_bearer_and_blanks():
+    tokens = parse_token_list(["Bearer a", "  "], "b\n\nbearer c \n")
+    assert tokens == ["a", "b", "c"]
+
+
+def test_classify_token():
+    record = classify_token(make_token({
+        "iss": "idp", "sub": "alice", "aud": ["api", "web"], "scope": "read write", "exp": NOW + 60
+    }), now=NOW)
+    assert record["status"] == "ok"
+    assert record["algorithm"] == "HS256"
+    assert record["audiences"] == ("api", "web")
+    assert record["scopes"] == ("read", "write")
+    assert not record["expired"] and not record["not_yet_valid"]
+    assert classify_token("not-a-jwt", now=NOW) == {"status": "malformed"}
+
+
+def test_stats_count_each_token_once():
+    stats = TokenBatchStats()
+    tokens = [
+        make_token({"sub": "a", "exp": NOW + 60}),
+        make_token({"sub": "b", "exp": NOW - 60}),
+        make_token({"sub": "c", "nbf": NOW + 60}),
+        # Both expired and not yet valid (nbf after exp)
+        make_token({"sub": "d", "exp": NOW - 60, "nbf": NOW + 60}),
+        "garbage",
+    ]
+    for token in tokens:
+        stats.add(classify_token(token, now=NOW))
+
+    summary = stats.to_dict()
+    assert (summary["total"], summary["decoded"], summary["malformed"]) == (5, 4, 1)
+    assert (summary["expired"], summary["not_yet_valid"]) == (2, 2)
+    assert summary["active"] == 1
+    assert summary["without_exp"] == 1
+    assert summary["unique_subjects"] == 4
+    assert summary["expiry_range"] == {"earliest": NOW - 60, "latest": NOW + 60}
+
+
+def test_stats_top_limits_distributions():
+    stats = TokenBatchStats()
+    for issuer in ("a", "a", "a", "b", "b", "c"):
+        stats.add(classify_token(make_token({"iss": issuer}), now=NOW))
+    assert stats.to_dict(top=2)["issuers"] == {"a": 3, "b": 2}
+    assert "signatures" not in stats.to_dict()
+
+
+def test_batch_tool_aggregates_and_keeps_input_order(call_tool):
+    tokens = [make_token({"sub": str(i), "iss": "idp", "exp": 4102444800}) for i in range(5)] + ["garbage"]
+    result, _ = call_tool("bearerDecodeBatch", {
+        "text": "\n".join(f"Bearer {token}" for token in tokens),
+        "chunk_size": 2,
+        "workers": 2,
+        "include_results": True,
+    })
+    assert result["summary"]["total"] == 6
+    assert result["summary"]["malformed"] == 1
+    assert result["summary"]["active"] == 5
+    assert result["summary"]["issuers"] == {"idp": 5}
+    assert [r["index"] for r in result["results"]] == list(range(6))
+    assert result["results"][-1]["status"] == "malformed"
+
+
+def test_batch_tool_streams_chunks_as_progress(call_tool):
+    tokens = [make_token({"sub": str(i)}) for i in range(5)]
+    result, notifications = call_tool("bearerDecodeBatch", {
+        "tokens": tokens, "chunk_size": 2, "stream": True
+    }, progress_token="batch")
+    progress = [n["params"] for n in notifications if n["method"] == "notifications/progress"]
+    assert [p["progress"] for p in progress] == [2, 4, 5]
+    assert all(p["total"] == 5 and p["progressToken"] == "batch" for p in progress)
+    assert [json.loads(p["message"])["offset"] for p in progress] == [0, 2, 4]
+    assert result["summary"]["total"] == 5
+
+
+def test_batch_tool_rejects_bad_arguments(call_tool):
+    assert "error" in call_tool("bearerDecodeBatch", {"tokens": []})[0]
+    assert "chunk_size" in call_tool("bearerDecodeBatch", {"tokens": ["a"], "chunk_size": 0})[0]["error"]
+    assert "workers" in call_tool("bearerDecodeBatch", {"tokens": ["a"], "workers": 17})[0]["error"]
@@ -0,0 +1,184 @@
+"""Tests for JWT signature verification."""
+
+import base64
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from mcp_http_echo_server.utils.jwt_verify import JWTVerifier, verify_signature
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64url_int(value: int, length: int = None) -> str:
+    length = length or (value.bit_length() + 7) // 8
+    return b64url(value.to_bytes(length, "big"))
+
+
+def signing_input(header, payload) -> str:
+    return f"{b64url(json.dumps(header).encode())}.{b64url(json.dumps(payload).encode())}"
+
+
+def hs256_token(secret: bytes, payload, kid="hs"):
+    data = signing_input({"alg": "HS256", "kid": kid}, payload)
+    return f"{data}.{b64url(hmac.new(secret, data.encode(), hashlib.sha256).digest())}"
+
+
+def tamper(token: str) -> str:
+    header, payload, signature = token.split(".")
+    forged = b64url(json.dumps({"sub": "mallory", "exp": 4102444800}).encode())
+    return f"{header}.{forged}.{signature}"
+
+
+def make_verifier(tmp_path, keys) -> JWTVerifier:
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": keys}))
+    verifier = JWTVerifier(str(path))
+    verifier.keys.check_interval = 0
+    return verifier
+
+
+PAYLOAD = {"sub": "alice", "exp": 4102444800}
+SECRET = b"s3cret-key-for-tests"
+OCT_JWK = {"kty": "oct", "kid": "hs", "k": b64url(SECRET)}
+
+
+def test_hs256_valid_and_tampered(tmp_path):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    token = hs256_token(SECRET, PAYLOAD)
+
+    result = verifier.verify(token)
+    assert result["valid"]
+    assert result["status"] == "valid"
+    assert result["algorithm"] == "HS256"
+    assert result["expires_at"] == 4102444800.0
+
+    assert verifier.verify(tamper(token))["status"] == "invalid_signature"
+    assert verifier.verify(hs256_token(b"wrong", PAYLOAD))["status"] == "invalid_signature"
+
+
+def test_rs256_valid_and_tampered(tmp_path):
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    verifier = make_verifier(tmp_path, [
+        {"kty": "RSA", "kid": "rsa", "alg": "RS256", "n": b64url_int(numbers.n), "e": b64url_int(numbers.e)}
+    ])
+
+    data = signing_input({"alg": "RS256", "kid": "rsa"}, PAYLOAD)
+    signature = private_key.sign(data.encode(), padding.PKCS1v15(), hashes.SHA256())
+    token = f"{data}.{b64url(signature)}"
+
+    assert verifier.verify(token)["status"] == "valid"
+    assert verifier.verify(tamper(token))["status"] == "invalid_signature"
+
+
+def es256_setup(tmp_path):
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    numbers = private_key.public_key().public_numbers()
+    verifier = make_verifier(tmp_path, [{
+        "kty": "EC", "kid": "ec", "crv": "P-256",
+        "x": b64url_int(numbers.x, 32), "y": b64url_int(numbers.y, 32)
+    }])
+
+    data = signing_input({"alg": "ES256", "kid": "ec"}, PAYLOAD)
+    r, s = decode_dss_signature(private_key.sign(data.encode(), ec.ECDSA(hashes.SHA256())))
+    return verifier, data, r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+
+def test_es256_valid_and_tampered(tmp_path):
+    pytest.importorskip("cryptography")
+    verifier, data, signature = es256_setup(tmp_path)
+    token = f"{data}.{b64url(signature)}"
+
+    assert verifier.verify(token)["status"] == "valid"
+    assert verifier.verify(tamper(token))["status"] == "invalid_signature"
+
+
+def test_es256_rejects_wrong_signature_length(tmp_path):
+    pytest.importorskip("cryptography")
+    verifier, data, signature = es256_setup(tmp_path)
+    verifier.keys.refresh()
+    key = verifier.keys.keys[0]
+
+    assert verify_signature("ES256", key, data.encode(), signature)
+    # Left-padded r and s would still decode to the same integers
+    r, s = signature[:32], signature[32:]
+    padded = b"\x00" + r + b"\x00" + s
+    assert not verify_signature("ES256", key, data.encode(), padded)
+    assert not verify_signature("ES256", key, data.encode(), signature[:-1])
+
+
+def test_unknown_kid(tmp_path):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    result = verifier.verify(hs256_token(SECRET, PAYLOAD, kid="other"))
+    assert not result["valid"]
+    assert result["status"] == "unknown_key"
+    assert result["kid"] == "other"
+
+
+def test_alg_none_is_unsupported(tmp_path):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    token = f"{signing_input({'alg': 'none'}, PAYLOAD)}."
+    result = verifier.verify(token)
+    assert not result["valid"]
+    assert result["status"] == "unsupported_algorithm"
+
+
+def test_jwks_reload_invalidates_cached_results(tmp_path):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    token = hs256_token(SECRET, PAYLOAD)
+    assert verifier.verify(token)["valid"]
+    assert verifier.verify(token)["valid"]
+    assert verifier.verifications == 1
+    assert verifier.keys.generation == 1
+
+    # Rotate the key under the same kid; the file size changes too
+    rotated = {"kty": "oct", "kid": "hs", "k": b64url(b"rotated-secret-for-tests")}
+    (tmp_path / "jwks.json").write_text(json.dumps({"keys": [rotated]}))
+
+    result = verifier.verify(token)
+    assert verifier.keys.generation == 2
+    assert verifier.keys.reloads == 2
+    assert result["status"] == "invalid_signature"
+    assert verifier.verifications == 2
+
+
+def test_jwks_load_error_keeps_previous_keys(tmp_path):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    token = hs256_token(SECRET, PAYLOAD)
+    assert verifier.verify(token)["valid"]
+
+    (tmp_path / "jwks.json").write_text("{not json")
+    assert verifier.verify(token)["valid"]
+    assert verifier.keys.generation == 1
+    assert verifier.get_stats()["load_error"].startswith("Cannot load JWKS file")
+
+
+@pytest.mark.parametrize("content", [
+    {"keys": ["x"]},
+    {"keys": [OCT_JWK, 42]},
+    {"keys": "not-a-list"},
+    ["x"],
+])
+def test_malformed_jwks_is_reported_and_previous_keys_kept(tmp_path, content):
+    verifier = make_verifier(tmp_path, [OCT_JWK])
+    token = hs256_token(SECRET, PAYLOAD)
+    assert verifier.verify(token)["valid"]
+
+    (tmp_path / "jwks.json").write_text(json.dumps(content))
+    verifier.keys.refresh()
+    assert verifier.keys.generation == 1
+    assert len(verifier.keys.keys) == 1
+    assert verifier.get_stats()["load_error"].startswith("Cannot load JWKS file")
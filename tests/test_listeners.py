@@ -0,0 +1,81 @@
+"""Tests for listening socket selection."""
+
+import os
+import socket
+
+import pytest
+
+from mcp_http_echo_server.utils.listeners import (
+    SD_LISTEN_FDS_START,
+    describe_listener,
+    socket_from_fd,
+    systemd_listen_fd,
+)
+
+
+@pytest.fixture
+def activation_env(monkeypatch):
+    def set_env(pid, fds="1"):
+        monkeypatch.setenv("LISTEN_PID", str(pid))
+        monkeypatch.setenv("LISTEN_FDS", fds)
+        monkeypatch.setenv("LISTEN_FDNAMES", "http")
+    return set_env
+
+
+def test_systemd_fd_for_this_process(activation_env):
+    activation_env(os.getpid())
+    assert systemd_listen_fd() == SD_LISTEN_FDS_START
+    # Consumed: children must not claim the socket again
+    assert "LISTEN_PID" not in os.environ
+    assert "LISTEN_FDS" not in os.environ
+    assert "LISTEN_FDNAMES" not in os.environ
+    assert systemd_listen_fd() is None
+
+
+def test_systemd_fd_for_other_process_is_ignored(activation_env):
+    activation_env(os.getpid() + 1)
+    assert systemd_listen_fd() is None
+    # Left in place for the process it was meant for
+    assert os.environ["LISTEN_FDS"] == "1"
+
+
+def test_systemd_fd_without_sockets(activation_env):
+    activation_env(os.getpid(), fds="0")
+    assert systemd_listen_fd() is None
+    activation_env(os.getpid(), fds="bogus")
+    assert systemd_listen_fd() is None
+
+
+def test_socket_from_fd_wraps_listening_socket():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    sock = socket_from_fd(os.dup(listener.fileno()))
+    try:
+        assert sock.family == socket.AF_INET
+        assert sock.getsockname() == listener.getsockname()
+        assert not sock.getblocking()
+    finally:
+        sock.close()
+        listener.close()
+
+
+def test_socket_from_fd_rejects_non_stream_sockets():
+    udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        with pytest.raises(ValueError, match="not a stream socket"):
+            socket_from_fd(udp.fileno())
+    finally:
+        udp.close()
+
+
+def test_socket_from_fd_rejects_files(tmp_path):
+    with open(tmp_path / "not-a-socket", "w") as f:
+        with pytest.raises(ValueError, match="not a socket"):
+            socket_from_fd(f.fileno())
+
+
+def test_describe_listener():
+    assert describe_listener("0.0.0.0", 3000) == "0.0.0.0:3000"
+    assert describe_listener("0.0.0.0", 3000, uds="/run/echo.sock") == "unix:/run/echo.sock"
+    assert describe_listener("0.0.0.0", 3000, fd=3) == "fd:3"
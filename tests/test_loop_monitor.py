@@ -0,0 +1,81 @@
+"""Tests for the event loop lag monitor."""
+
+import asyncio
+import time
+
+from mcp_http_echo_server.utils.loop_monitor import NO_TOOL, LoopLagMonitor
+
+
+def test_record_updates_lag_and_histogram():
+    monitor = LoopLagMonitor(slow_callback_threshold=0)
+    monitor.record(0.002)
+    monitor.record(5.0)
+    monitor.record(0.0)
+
+    stats = monitor.get_stats()
+    assert stats["samples"] == 3
+    assert stats["lag_ms"] == 0.0
+    assert stats["max_lag_ms"] == 5000.0
+    assert stats["lag_histogram"]["le_1ms"] == 1
+    assert stats["lag_histogram"]["le_5ms"] == 1
+    assert stats["lag_histogram"]["gt_2500ms"] == 1
+    assert sum(stats["lag_histogram"].values()) == 3
+
+
+def test_listeners_run_after_each_sample_and_errors_are_contained():
+    monitor = LoopLagMonitor(slow_callback_threshold=0)
+    seen = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    monitor.add_listener(broken)
+    monitor.add_listener(lambda: seen.append(monitor.lag))
+    monitor.record(0.01)
+    assert seen == [0.01]
+
+
+def test_samples_the_running_loop():
+    async def scenario():
+        monitor = LoopLagMonitor(interval=0.01, slow_callback_threshold=0)
+        monitor.start()
+        assert monitor.running
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    assert not monitor.running
+    assert monitor.samples > 0
+
+
+def test_watchdog_attributes_stall_to_tool():
+    async def scenario():
+        monitor = LoopLagMonitor(interval=10, slow_callback_threshold=0.02)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        with monitor.track_tool("blockingTool"):
+            time.sleep(0.2)
+        # Let the watchdog see the loop run again and record the stall
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if monitor.stalls:
+                break
+        await monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+    stats = monitor.get_stats()
+    assert stats["stalls"] >= 1
+    assert "blockingTool" in stats["stalls_by_tool"]
+    stall = stats["recent_stalls"][0]
+    assert stall["duration_ms"] >= 20
+    assert "test_watchdog_attributes_stall_to_tool" in stall["stack"]
+
+
+def test_stall_outside_tools_is_unattributed():
+    monitor = LoopLagMonitor(slow_callback_threshold=0)
+    monitor._record_stall(0.3, NO_TOOL, "")
+    stats = monitor.get_stats()
+    assert stats["stalls_by_tool"] == {NO_TOOL: {"count": 1, "total_ms": 300.0, "max_ms": 300.0}}
+    assert stats["stalled_ms"] == 300.0
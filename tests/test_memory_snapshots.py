@@ -0,0 +1,131 @@
+"""Tests for tracemalloc snapshots."""
+
+import asyncio
+import tracemalloc
+
+import pytest
+
+from mcp_http_echo_server.utils.memory_snapshots import MAX_FRAMES, MemorySnapshots
+
+
+@pytest.fixture
+def snapshots():
+    snapshots = MemorySnapshots(max_snapshots=3)
+    yield snapshots
+    snapshots.stop()
+    assert not tracemalloc.is_tracing()
+
+
+def test_start_and_stop_are_idempotent(snapshots):
+    assert snapshots.start(frames=2)["tracing"]
+    started_at = snapshots.started_at
+    status = snapshots.start(frames=5)
+    # A second start keeps the running session and its frame limit
+    assert status["frames"] == 2
+    assert snapshots.started_at == started_at
+
+    assert not snapshots.stop()["tracing"]
+    assert snapshots.stop() == {"tracing": False, "snapshots": []}
+
+
+@pytest.mark.parametrize("frames", [0, MAX_FRAMES + 1])
+def test_start_validates_frames(snapshots, frames):
+    with pytest.raises(ValueError, match="frames"):
+        snapshots.start(frames=frames)
+    assert not snapshots.tracing
+
+
+def test_take_requires_tracing(snapshots):
+    with pytest.raises(ValueError, match="not running"):
+        asyncio.run(snapshots.take())
+
+
+def test_oldest_snapshots_are_evicted(snapshots):
+    snapshots.start()
+
+    async def take_all():
+        for label in ("a", "b", "c", "d"):
+            await snapshots.take(label)
+        # Re-taking a label moves it to the newest position
+        await snapshots.take("b")
+
+    asyncio.run(take_all())
+    assert list(snapshots.snapshots) == ["c", "d", "b"]
+    assert snapshots.get_stats()["snapshots"] == 3
+
+
+def test_default_labels_are_numbered(snapshots):
+    snapshots.start()
+    result = asyncio.run(snapshots.take())
+    assert result["label"] == "snapshot-1"
+    assert result["traces"] >= 0
+
+
+def test_get_by_label_and_offset(snapshots):
+    snapshots.start()
+
+    async def take_two():
+        await snapshots.take("before")
+        await snapshots.take("after")
+
+    asyncio.run(take_two())
+    assert snapshots._get("")[0] == "after"
+    assert snapshots._get("", offset=2)[0] == "before"
+    with pytest.raises(ValueError, match="Need at least 3"):
+        snapshots._get("", offset=3)
+    with pytest.raises(ValueError, match="Unknown snapshot 'missing'"):
+        snapshots._get("missing")
+
+
+def test_diff_shows_growth(snapshots):
+    snapshots.start()
+    retained = []
+
+    async def scenario():
+        await snapshots.take("before")
+        retained.extend(bytearray(1000) for _ in range(200))
+        await snapshots.take("after")
+        return await snapshots.diff(limit=5)
+
+    result = asyncio.run(scenario())
+    assert (result["label"], result["compare_to"]) == ("after", "before")
+    assert result["size_diff_bytes"] > 100_000
+    assert len(result["top"]) <= 5
+
+
+def test_diff_needs_two_different_snapshots(snapshots):
+    snapshots.start()
+
+    async def scenario():
+        await snapshots.take("only")
+        with pytest.raises(ValueError, match="Need at least 2"):
+            await snapshots.diff()
+        with pytest.raises(ValueError, match="with itself"):
+            await snapshots.diff("only", "only")
+
+    asyncio.run(scenario())
+
+
+def test_invalid_group_by(snapshots):
+    snapshots.start()
+
+    async def scenario():
+        await snapshots.take("a")
+        await snapshots.take("b")
+        with pytest.raises(ValueError, match="Invalid group_by"):
+            await snapshots.top(group_by="module")
+        with pytest.raises(ValueError, match="Invalid group_by"):
+            await snapshots.diff(group_by="module")
+        return await snapshots.top(group_by="filename", limit=3)
+
+    result = asyncio.run(scenario())
+    assert result["label"] == "b"
+    assert len(result["top"]) <= 3
+
+
+def test_stop_drops_snapshots(snapshots):
+    snapshots.start()
+    asyncio.run(snapshots.take("a"))
+    snapshots.stop()
+    assert snapshots.snapshots == {}
+    assert snapshots.started_at is None
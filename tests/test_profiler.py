@@ -0,0 +1,150 @@
+"""Tests for the on-demand profiler and its HTTP route."""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+from mcp_http_echo_server.middleware.profiling import PROFILE_PATH, ProfileRouteMiddleware
+from mcp_http_echo_server.utils.profiler import (
+    MAX_DURATION,
+    Profiler,
+    ProfilerBusy,
+    StackSampler,
+    collapse_stack,
+)
+
+
+def inner():
+    return sys._getframe()
+
+
+def outer():
+    return inner()
+
+
+def test_collapse_stack_runs_root_to_leaf():
+    stack = collapse_stack(outer())
+    frames = stack.split(";")
+    assert frames[-1].startswith("inner (test_profiler.py:")
+    assert frames[-2].startswith("outer (test_profiler.py:")
+    # Callers of the test (pytest) sit at the root end
+    assert len(frames) > 2
+
+
+def test_collapse_stack_keeps_leaf_end_when_cut():
+    stack = collapse_stack(outer(), max_depth=2)
+    assert [label.split(" ")[0] for label in stack.split(";")] == ["outer", "inner"]
+
+
+def test_sampler_top_and_collapsed_output():
+    sampler = StackSampler(thread_id=0)
+    sampler.stacks.update({"main;handle;encode": 6, "main;handle": 3, "main;idle": 1})
+    sampler.samples = 10
+
+    assert sampler.collapsed().splitlines() == ["main;handle;encode 6", "main;handle 3", "main;idle 1"]
+    lines = sampler.top(limit=2).splitlines()
+    assert lines[0].split() == ["self", "%", "total", "%", "function"]
+    # encode: 60% self and total; handle: 30% self, 90% total
+    assert lines[1].split() == ["60.0", "60.0", "encode"]
+    assert lines[2].split() == ["30.0", "90.0", "handle"]
+    assert len(lines) == 3
+
+
+def test_sampler_samples_a_thread():
+    sampler = StackSampler(threading.get_ident(), interval=0.001)
+    sampler.start()
+    deadline = time.monotonic() + 2
+    while not sampler.samples and time.monotonic() < deadline:
+        sum(range(10000))
+    sampler.stop()
+    assert sampler.samples > 0
+    assert "test_sampler_samples_a_thread" in sampler.collapsed()
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"mode": "perf"}, "Invalid mode"),
+    ({"duration": 0}, "duration"),
+    ({"duration": MAX_DURATION + 1}, "duration"),
+    ({"mode": "sample", "output": "pstats"}, "Invalid format"),
+    ({"mode": "cprofile", "output": "collapsed"}, "Invalid format"),
+])
+def test_profile_validates_arguments(kwargs, message):
+    profiler = Profiler()
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(profiler.profile(**kwargs))
+    assert profiler.get_stats()["sessions"] == 0
+
+
+def test_concurrent_session_is_rejected():
+    async def scenario():
+        profiler = Profiler()
+        first = asyncio.create_task(profiler.profile(duration=0.2, interval=0.001))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ProfilerBusy):
+            await profiler.profile(mode="cprofile", duration=0.1)
+        result = await first
+        return profiler, result
+
+    profiler, result = asyncio.run(scenario())
+    stats = profiler.get_stats()
+    assert (stats["sessions"], stats["rejected_busy"]) == (1, 1)
+    assert stats["active"] is None
+    assert result["mode"] == "sample" and result["format"] == "collapsed"
+    assert "output" not in stats["last"]
+
+
+def test_cprofile_session():
+    result = asyncio.run(Profiler().profile(mode="cprofile", duration=0.05, limit=5))
+    assert result["format"] == "pstats"
+    assert "cumulative" in result["output"]
+
+
+def route(path: str, method: str = "GET", profiler: Profiler = None):
+    """Send one request through ProfileRouteMiddleware."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=ProfileRouteMiddleware(app, profiler or Profiler()))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path)
+
+    return asyncio.run(scenario())
+
+
+def test_route_profiles_and_returns_text():
+    response = route(f"{PROFILE_PATH}?duration=0.05&interval_ms=1&format=top")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text.splitlines()[0].split() == ["self", "%", "total", "%", "function"]
+    assert json.loads(response.headers["x-profile-summary"])["format"] == "top"
+
+
+@pytest.mark.parametrize("query", ["duration=0", "duration=abc", "mode=perf", "mode=cprofile&format=top", "limit=x"])
+def test_route_rejects_bad_arguments(query):
+    response = route(f"{PROFILE_PATH}?{query}")
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_route_rejects_other_methods():
+    assert route(PROFILE_PATH, method="POST").status_code == 405
+
+
+def test_route_reports_busy_profiler():
+    profiler = Profiler()
+    profiler.active = {"mode": "sample", "started": time.time(), "duration": 5}
+    response = route(f"{PROFILE_PATH}?duration=1", profiler=profiler)
+    assert response.status_code == 409
+    assert "already running" in response.json()["error"]
+
+
+def test_other_paths_reach_app():
+    assert route("/mcp", method="POST").status_code == 204
@@ -0,0 +1,48 @@
+"""Tests for the token-bucket rate limiter."""
+
+import pytest
+
+from mcp_http_echo_server.middleware.rate_limit import TokenBucket, RateLimiter
+
+
+def test_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(2.0, now=0.0)
+    assert bucket.consume(rate=1.0, burst=2.0, now=0.0) == 0.0
+    assert bucket.consume(rate=1.0, burst=2.0, now=0.0) == 0.0
+    assert bucket.consume(rate=1.0, burst=2.0, now=0.0) == pytest.approx(1.0)
+    assert (bucket.allowed, bucket.throttled) == (2, 1)
+
+
+def test_bucket_refills_at_rate_up_to_burst():
+    bucket = TokenBucket(0.0, now=0.0)
+    assert bucket.consume(rate=2.0, burst=4.0, now=0.25) == pytest.approx(0.25)
+    assert bucket.consume(rate=2.0, burst=4.0, now=0.5) == 0.0
+    assert not bucket.is_full(rate=2.0, burst=4.0, now=1.0)
+    assert bucket.is_full(rate=2.0, burst=4.0, now=100.0)
+    bucket.consume(rate=2.0, burst=4.0, now=100.0)
+    assert bucket.tokens == pytest.approx(3.0)
+
+
+def test_limiter_default_burst():
+    assert RateLimiter("session", rate=5).burst == 10
+    assert RateLimiter("session", rate=0.1).burst == 1
+    assert RateLimiter("session", rate=5, burst=3).burst == 3
+
+
+def test_limiter_keys_are_independent():
+    limiter = RateLimiter("session", rate=1, burst=1)
+    assert limiter.check("a", now=0.0) == 0.0
+    assert limiter.check("a", now=0.0) > 0
+    assert limiter.check("b", now=0.0) == 0.0
+
+    limiter.remove("a")
+    assert limiter.check("a", now=0.0) == 0.0
+
+
+def test_limiter_sweep_drops_only_full_buckets():
+    limiter = RateLimiter("principal", rate=1, burst=2)
+    limiter.check("idle", now=0.0)
+    limiter.check("busy", now=0.0)
+    limiter.check("busy", now=1.5)
+    assert limiter.sweep(now=2.0) == 1
+    assert set(limiter.buckets) == {"busy"}
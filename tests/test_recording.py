@@ -0,0 +1,195 @@
+"""Tests for traffic recording and replay."""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from mcp_http_echo_server.middleware.recording import RecordingWriter, parse_response_body, rotate_files
+from mcp_http_echo_server.replay import Replay, group_records, load_records
+from mcp_http_echo_server.utils import codec
+
+
+def capture(ts, session=None, method="ping", status=200):
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": method}).encode()
+    response = [b'{"jsonrpc":"2.0","id":1,"result":{}}']
+    return (ts, session, "2025-06-18", body, status, "application/json", response, False, 1.0)
+
+
+def read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_record_format():
+    record = RecordingWriter.to_record(capture(1.5, session="s1", method="tools/list"))
+    assert record["session"] == "s1"
+    assert record["request"]["method"] == "tools/list"
+    assert record["response"] == {"jsonrpc": "2.0", "id": 1, "result": {}}
+    assert "response_truncated" not in record
+
+
+def test_sse_body_with_several_messages_is_a_list():
+    body = b'event: message\ndata: {"a":1}\n\nevent: message\ndata: {"b":2}\n\n'
+    assert parse_response_body("text/event-stream", body) == [{"a": 1}, {"b": 2}]
+    assert parse_response_body("text/event-stream", b'data: {"a":1}\n\n') == {"a": 1}
+
+
+def test_rotates_by_size_between_records(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    line_size = len(codec.dumps_bytes(RecordingWriter.to_record(capture(1.0)))) + 1
+    writer = RecordingWriter(path, max_bytes=line_size * 2, backups=2)
+
+    writer._write([capture(float(ts)) for ts in range(7)])
+
+    stats = writer.get_stats()
+    assert stats["written"] == 7
+    assert stats["rotations"] == 3
+    # Each file holds whole records; the oldest file beyond backups is gone
+    assert [r["ts"] for r in read_lines(path)] == [6.0]
+    assert [r["ts"] for r in read_lines(path + ".1")] == [4.0, 5.0]
+    assert [r["ts"] for r in read_lines(path + ".2")] == [2.0, 3.0]
+    assert not (tmp_path / "traffic.jsonl.3").exists()
+
+
+def test_rotate_without_backups_removes_file(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    path.write_text("old\n")
+    rotate_files(str(path), 0)
+    assert not path.exists()
+
+
+def test_close_flushes_and_drops_later_records(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+
+    async def scenario():
+        writer = RecordingWriter(path, flush_interval=60)
+        writer.record(capture(1.0))
+        writer.record(capture(2.0))
+        await writer.close()
+        writer.record(capture(3.0))
+        return writer.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert [r["ts"] for r in read_lines(path)] == [1.0, 2.0]
+    assert (stats["written"], stats["dropped"]) == (2, 1)
+
+
+def test_full_buffer_drops_records(tmp_path):
+    async def scenario():
+        writer = RecordingWriter(str(tmp_path / "traffic.jsonl"), max_pending=1, flush_interval=60)
+        writer.record(capture(1.0))
+        writer.record(capture(2.0))
+        await writer.close()
+        return writer.get_stats()
+
+    assert asyncio.run(scenario())["dropped"] == 1
+
+
+def test_load_records_merges_rotated_files_by_time(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    writer = RecordingWriter(path, max_bytes=1, backups=5)
+    writer._write([capture(float(ts)) for ts in (1, 2, 3)])
+    files = [path + ".2", path, path + ".1"]
+    assert [r["ts"] for r in load_records(files)] == [1.0, 2.0, 3.0]
+    assert len(load_records(files, limit=2)) == 2
+
+
+def record(ts, session, method, status=200):
+    return {
+        "ts": ts,
+        "session": session,
+        "protocol_version": "2025-06-18",
+        "request": {"jsonrpc": "2.0", "id": ts, "method": method},
+        "status": status,
+        "response": {"jsonrpc": "2.0", "id": ts, "result": {}},
+        "duration_ms": 1.0,
+    }
+
+
+def test_group_records_keeps_session_order():
+    records = [
+        record(1, "a", "initialize"),
+        record(2, "b", "initialize"),
+        record(3, None, "ping"),
+        record(4, "a", "tools/list"),
+        record(5, "b", "tools/list"),
+        record(6, "a", "tools/call"),
+    ]
+    units = group_records(records)
+    assert [[r["ts"] for r in unit] for unit in units] == [[1, 4, 6], [2, 5], [3]]
+
+
+def test_replay_sends_session_in_order_on_new_session():
+    sent = []
+
+    def handler(request: httpx.Request):
+        if request.method == "DELETE":
+            sent.append(("DELETE", request.headers.get("mcp-session-id")))
+            return httpx.Response(200)
+        method = json.loads(request.content)["method"]
+        sent.append((method, request.headers.get("mcp-session-id")))
+        headers = {"mcp-session-id": "replayed"} if method == "initialize" else {}
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}}, headers=headers)
+
+    unit = [record(1, "a", "initialize"), record(2, "a", "tools/list"), record(3, "a", "tools/call")]
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            replay = Replay(client, "http://test/mcp", {}, speed=0, start_ts=1)
+            await replay.run_unit(unit, asyncio.Semaphore(1))
+            return replay.report(0.1, unit)
+
+    report = asyncio.run(scenario())
+    assert sent == [
+        ("initialize", None),
+        ("tools/list", "replayed"),
+        ("tools/call", "replayed"),
+        ("DELETE", "replayed"),
+    ]
+    assert report["status_mismatches"] == 0
+    assert report["outcome_mismatches"] == 0
+    entry = report["keys"]["tools/call:None"]
+    assert entry["count"] == 1
+    assert entry["recorded_server"]["p50_ms"] == 1.0
+    assert entry["replay_client"]["count"] == 1
+
+
+def test_replay_opens_session_for_records_without_initialize():
+    sent = []
+
+    def handler(request: httpx.Request):
+        if request.method == "POST":
+            sent.append(json.loads(request.content)["method"])
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}}, headers={"mcp-session-id": "new"})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            replay = Replay(client, "http://test/mcp", {}, speed=0, start_ts=1)
+            await replay.run_unit([record(1, "a", "tools/list")], asyncio.Semaphore(1))
+
+    asyncio.run(scenario())
+    assert sent == ["initialize", "notifications/initialized", "tools/list"]
+
+
+def test_waiting_sessions_do_not_hold_the_limiter():
+    sent = []
+
+    def handler(request: httpx.Request):
+        if request.method == "POST":
+            sent.append(json.loads(request.content)["id"])
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}})
+
+    # Session a waits 0.3s between its requests; b is due in between
+    units = [[record(1.0, None, "ping"), record(1.3, None, "ping")], [record(1.1, None, "ping")]]
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            replay = Replay(client, "http://test/mcp", {}, speed=1, start_ts=1.0)
+            replay.started = time.perf_counter()
+            limiter = asyncio.Semaphore(1)
+            await asyncio.gather(*(replay.run_unit(unit, limiter) for unit in units))
+
+    asyncio.run(scenario())
+    assert sent == [1.0, 1.1, 1.3]
@@ -0,0 +1,84 @@
+"""Tests for the tool registry."""
+
+from mcp_http_echo_server.tools.registry import (
+    CATALOG_BY_NAME,
+    CATEGORIES,
+    TOOL_CATALOG,
+    UNCATEGORIZED,
+    ToolInfo,
+    ToolRegistry,
+)
+
+TOOLS = (
+    ToolInfo("echo", "echo", "Echo"),
+    ToolInfo("sessionHistory", "state", "History", stateful_only=True),
+    ToolInfo("healthProbe", "system", "Health"),
+)
+
+
+def test_catalog_names_are_unique_and_categorized():
+    assert len(CATALOG_BY_NAME) == len(TOOL_CATALOG)
+    assert all(tool.category in CATEGORIES for tool in TOOL_CATALOG)
+
+
+def test_availability_per_mode():
+    registry = ToolRegistry(TOOLS)
+    assert registry.available(False) == ("echo", "sessionHistory", "healthProbe")
+    assert registry.available(True) == ("echo", "healthProbe")
+    assert registry.stateful_only == ("sessionHistory",)
+
+
+def test_summary_counts():
+    registry = ToolRegistry(TOOLS)
+    stateless = registry.summary(True)
+    assert stateless["total"] == 3
+    assert stateless["available"] == 2
+    assert stateless["stateful_only"] == ["sessionHistory"]
+    assert registry.summary(False)["stateful_only"] == []
+    assert stateless["categories"]["echo"] == 1
+    assert stateless["categories"]["admin"] == 0
+
+
+def test_describe_categories_skips_empty_ones():
+    lines = ToolRegistry(TOOLS).describe_categories().splitlines()
+    assert lines == [
+        "- Echo Tools: echo",
+        "- System Tools: healthProbe",
+        "- State Tools: sessionHistory",
+    ]
+
+
+class FakeTool:
+    def __init__(self, description):
+        self.description = description
+
+
+class FakeMCP:
+    def __init__(self, names):
+        self._tool_manager = type("Manager", (), {})()
+        self._tool_manager._tools = {name: FakeTool(f"{name} tool.\n\nDetails.") for name in names}
+
+
+def test_load_uses_catalog_and_falls_back_to_uncategorized():
+    registry = ToolRegistry().load(FakeMCP(["echo", "customTool"]))
+    assert registry.names == ("echo", "customTool")
+    assert registry.by_category[UNCATEGORIZED][0].summary == "customTool tool."
+    assert registry.category_title(UNCATEGORIZED) == "Other Tools"
+
+
+def test_tools_list_is_cached_until_tools_change():
+    class Tool:
+        key = "t"
+        conversions = 0
+
+        def to_mcp_tool(self, name, include_fastmcp_meta):
+            Tool.conversions += 1
+            return {"name": name}
+
+    registry = ToolRegistry()
+    tools = [Tool()]
+    first = registry.get_tools_list(tools)
+    assert registry.get_tools_list(list(tools)) is first
+    assert Tool.conversions == 1
+    registry.get_tools_list([Tool()])
+    assert Tool.conversions == 2
@@ -0,0 +1,19 @@
+"""Tests for healthProbe and serverMetrics."""
+
+
+def test_health_probe_reports_admission_only(call_tool):
+    result, _ = call_tool("healthProbe", {}, max_in_flight=8)
+    assert result["admission"]["max_in_flight"] == 8
+    assert "event_loop" in result
+    assert "metrics" not in result
+
+
+def test_server_metrics_snapshot_and_sections(call_tool):
+    result, _ = call_tool("serverMetrics", {}, max_in_flight=8)
+    assert {"counters", "admission", "event_loop", "jwt_cache"} <= set(result)
+
+    result, _ = call_tool("serverMetrics", {"section": "admission"}, max_in_flight=8)
+    assert list(result) == ["admission"]
+
+    result, _ = call_tool("serverMetrics", {"section": "bogus"})
+    assert "Unknown section 'bogus'" in result["error"]
@@ -0,0 +1,81 @@
+"""Tests for event loop and HTTP parser selection."""
+
+import pytest
+
+from mcp_http_echo_server.utils import transport_tuning
+from mcp_http_echo_server.utils.transport_tuning import (
+    DEFAULT_BACKLOG,
+    DEFAULT_KEEP_ALIVE_TIMEOUT,
+    build_uvicorn_config,
+    get_loop_factory,
+    resolve_http_parser,
+    resolve_loop,
+)
+
+
+def installed(monkeypatch, *modules):
+    monkeypatch.setattr(transport_tuning, "is_available", lambda module: module in modules)
+
+
+@pytest.mark.parametrize("name, expected", [("auto", "uvloop"), ("uvloop", "uvloop"), ("asyncio", "asyncio")])
+def test_loop_with_uvloop_installed(monkeypatch, name, expected):
+    installed(monkeypatch, "uvloop")
+    assert resolve_loop(name) == expected
+
+
+@pytest.mark.parametrize("name", ["auto", "uvloop", "asyncio"])
+def test_loop_falls_back_to_asyncio(monkeypatch, name):
+    installed(monkeypatch)
+    assert resolve_loop(name) == "asyncio"
+
+
+@pytest.mark.parametrize("name, expected", [("auto", "httptools"), ("httptools", "httptools"), ("h11", "h11")])
+def test_parser_with_httptools_installed(monkeypatch, name, expected):
+    installed(monkeypatch, "httptools")
+    assert resolve_http_parser(name) == expected
+
+
+@pytest.mark.parametrize("name", ["auto", "httptools", "h11"])
+def test_parser_falls_back_to_h11(monkeypatch, name):
+    installed(monkeypatch)
+    assert resolve_http_parser(name) == "h11"
+
+
+def test_requested_but_missing_package_is_logged(monkeypatch, caplog):
+    installed(monkeypatch)
+    resolve_loop("uvloop")
+    resolve_http_parser("httptools")
+    assert "uvloop requested but not installed" in caplog.text
+    assert "httptools requested but not installed" in caplog.text
+
+
+def test_asyncio_uses_default_loop_factory():
+    assert get_loop_factory("asyncio") is None
+
+
+def test_default_uvicorn_config():
+    assert build_uvicorn_config("h11") == {
+        "http": "h11",
+        "backlog": DEFAULT_BACKLOG,
+        "timeout_keep_alive": DEFAULT_KEEP_ALIVE_TIMEOUT,
+    }
+
+
+def test_uvicorn_config_with_limits():
+    config = build_uvicorn_config(
+        "httptools", backlog=4096, keep_alive_timeout=30, limit_concurrency=500, graceful_shutdown_timeout=10
+    )
+    assert config == {
+        "http": "httptools",
+        "backlog": 4096,
+        "timeout_keep_alive": 30,
+        "limit_concurrency": 500,
+        "timeout_graceful_shutdown": 10,
+    }
+
+
+def test_zero_limit_concurrency_is_omitted():
+    config = build_uvicorn_config("h11", limit_concurrency=0, graceful_shutdown_timeout=0)
+    assert "limit_concurrency" not in config
+    # 0 is a real timeout (cancel immediately), unlike None
+    assert config["timeout_graceful_shutdown"] == 0